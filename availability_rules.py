@@ -0,0 +1,135 @@
+"""
+판매가능객실 규칙 엔진
+config.AVAILABILITY_RULES 규칙표를 방 타입×날짜 잔여/예약 행렬 전체에 한 번에 적용
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+import config
+
+RULE_ACTIONS = ('open', 'booked_plus', 'fixed', 'alert')
+
+
+def load_rules(path=None):
+    """규칙표 로드 (AVAILABILITY_RULES_FILE JSON이 있으면 우선, 없으면 config.AVAILABILITY_RULES)"""
+    path = path or config.AVAILABILITY_RULES_FILE
+    if path:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return list(config.AVAILABILITY_RULES)
+
+
+class AvailabilityRules:
+    """
+    선언형 규칙표 평가기
+
+    규칙은 위에서부터 순서대로 검사하며 셀마다 처음 맞는 규칙 하나만 적용:
+        room          방 타입 키, 목록, 또는 '*' (모든 방 타입)
+        remaining_min / remaining_max / booked_min / booked_max   조건 (경계 포함, 생략 시 무조건)
+        action        'open'(빈칸 = 모두 오픈), 'booked_plus'(예약+value), 'fixed'(value), 'alert'(수동 확인)
+        value         booked_plus/fixed 값
+        message       alert 메시지 ({room}, {remaining}, {booked} 치환)
+    """
+
+    def __init__(self, rules=None):
+        self.rules = load_rules() if rules is None else list(rules)
+        for idx, rule in enumerate(self.rules):
+            if rule.get('action') not in RULE_ACTIONS:
+                raise ValueError(f"규칙 {idx + 1}: 알 수 없는 action {rule.get('action')!r}")
+            if rule['action'] in ('booked_plus', 'fixed') and 'value' not in rule:
+                raise ValueError(f"규칙 {idx + 1}: {rule['action']}에는 value가 필요합니다")
+
+    def _room_mask(self, rule, room_keys):
+        rooms = rule.get('room', '*')
+        if rooms == '*':
+            return np.ones(len(room_keys), dtype=bool)
+        if isinstance(rooms, str):
+            rooms = [rooms]
+        return np.isin(np.asarray(room_keys, dtype=object), rooms)
+
+    def evaluate(self, room_keys, remaining, booked):
+        """
+        방 타입×날짜 행렬 전체를 한 번에 평가
+
+        Args:
+            room_keys: 행 순서의 방 타입 키 목록 ('SINGLE' 등)
+            remaining, booked: (방 타입 수 × 날짜 수) 행렬 (ndarray 또는 DataFrame, 값 없음은 NaN)
+
+        Returns:
+            {'target': 목표 판매가능객실 행렬 (NaN = 빈칸/알림/규칙 없음),
+             'alert': 알림 마스크, 'rule': 적용된 규칙 인덱스 (-1 = 규칙 없음)}
+            입력이 DataFrame이면 같은 index/columns의 DataFrame으로 반환
+        """
+        frame = remaining if isinstance(remaining, pd.DataFrame) else None
+        remaining = np.asarray(remaining, dtype=float)
+        booked = np.asarray(booked, dtype=float)
+        if remaining.shape != booked.shape or remaining.ndim != 2 or remaining.shape[0] != len(room_keys):
+            raise ValueError(f"행렬 크기가 맞지 않습니다: remaining {remaining.shape}, booked {booked.shape}, 방 {len(room_keys)}개")
+
+        target = np.full(remaining.shape, np.nan)
+        alert = np.zeros(remaining.shape, dtype=bool)
+        rule_idx = np.full(remaining.shape, -1, dtype=int)
+        unmatched = ~(np.isnan(remaining) | np.isnan(booked))
+
+        for idx, rule in enumerate(self.rules):
+            hit = unmatched & self._room_mask(rule, room_keys)[:, None]
+            if 'remaining_min' in rule:
+                hit &= remaining >= rule['remaining_min']
+            if 'remaining_max' in rule:
+                hit &= remaining <= rule['remaining_max']
+            if 'booked_min' in rule:
+                hit &= booked >= rule['booked_min']
+            if 'booked_max' in rule:
+                hit &= booked <= rule['booked_max']
+            if not hit.any():
+                continue
+
+            action = rule['action']
+            if action == 'booked_plus':
+                target[hit] = booked[hit] + rule['value']
+            elif action == 'fixed':
+                target[hit] = rule['value']
+            elif action == 'alert':
+                alert[hit] = True
+            rule_idx[hit] = idx
+            unmatched &= ~hit
+            if not unmatched.any():
+                break
+
+        if frame is not None:
+            return {
+                'target': pd.DataFrame(target, index=frame.index, columns=frame.columns),
+                'alert': pd.DataFrame(alert, index=frame.index, columns=frame.columns),
+                'rule': pd.DataFrame(rule_idx, index=frame.index, columns=frame.columns),
+            }
+        return {'target': target, 'alert': alert, 'rule': rule_idx}
+
+    def evaluate_cell(self, room_key, remaining, booked):
+        """
+        셀 하나 평가 (calculate_available_rooms 호환)
+
+        Returns:
+            판매가능객실 수량 (None이면 빈칸 = 모두 오픈), 또는 'ALERT:메시지'
+        """
+        result = self.evaluate([room_key], [[remaining]], [[booked]])
+        return self.cell_value(result, 0, 0, room_key, remaining, booked)
+
+    def cell_value(self, result, row, col, room_key, remaining, booked):
+        """평가 결과 행렬의 한 셀을 기존 반환 형식으로 변환"""
+        if result['alert'][row, col]:
+            return f"ALERT:{self.alert_message(result['rule'][row, col], room_key, remaining, booked)}"
+        value = result['target'][row, col]
+        return None if np.isnan(value) else int(value)
+
+    def alert_message(self, rule_idx, room_key, remaining, booked):
+        message = self.rules[rule_idx].get('message', '{room} 예약 {booked}건 - 수동 확인 필요')
+        return message.format(room=room_key, remaining=remaining, booked=booked)
+
+    def describe(self, rule_idx):
+        """규칙 인덱스를 로그용 문자열로 변환"""
+        if rule_idx < 0:
+            return "규칙 없음"
+        rule = self.rules[rule_idx]
+        return rule.get('name') or f"규칙 {rule_idx + 1} ({rule['action']})"
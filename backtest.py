@@ -0,0 +1,276 @@
+"""
+판매가능객실 규칙 백테스트 (오프라인)
+저장된 잔여/예약 이력(스냅샷 저장소의 실행별 관측 이력, 변경 저널, change_history.xlsx)을 후보 규칙표에 다시 적용해
+규칙표·규칙별로 변경 셀 수, 묶어둔 객실 수, 알림 수를 비교 (CMS/브라우저 없이 실행)
+
+사용법:
+    python backtest.py --variants 규칙후보.json                 # 현재 규칙표 + 후보 규칙표 비교
+    python backtest.py --history change_history.xlsx --rules a.json b.json --detail
+    python backtest.py --history .cms_snapshots.sqlite3 --start 2026-01-01 -o backtest.csv
+
+후보 규칙표 파일:
+    --rules: AVAILABILITY_RULES_FILE과 같은 형식(규칙 목록) JSON, 파일 하나가 후보 하나
+    --variants: {"후보 이름": [규칙...], ...} 또는 [{"name": ..., "rules": [...]}, ...] JSON
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import config
+from availability_rules import AvailabilityRules, load_rules
+from change_journal import ChangeJournal
+from snapshot_store import SnapshotStore
+
+HISTORY_COLUMNS = ('observed', 'date', 'room_name', 'remaining', 'booked', 'value')
+# 변경 저널/변경 이력 엑셀 열 → 이력 열
+JOURNAL_HISTORY_COLUMNS = {'run_id': 'observed', 'room_type': 'room_name', 'old_value': 'value'}
+BASELINE_NAME = "현재 규칙"
+
+
+def _read_change_history_xlsx(path):
+    """change_history.xlsx 읽기 (change_history 시트, 없으면 첫 시트). 잔여/예약 열이 없으면 ValueError"""
+    sheets = pd.ExcelFile(path).sheet_names
+    sheet = 'change_history' if 'change_history' in sheets else sheets[0]
+    history = pd.read_excel(path, sheet_name=sheet, dtype={'old_value': str})
+    missing = [column for column in ('date', 'room_type', 'remaining', 'booked') if column not in history.columns]
+    if missing:
+        raise ValueError(
+            f"{os.path.basename(path)} ({sheet} 시트)에 {', '.join(missing)} 열이 없어 백테스트할 수 없습니다. "
+            "이전 형식의 변경 이력은 잔여/예약을 담고 있지 않으므로 스냅샷 저장소나 변경 저널을 사용하세요.")
+    if 'run_id' not in history.columns:
+        history['run_id'] = history.get('run_date')
+    return history.rename(columns=JOURNAL_HISTORY_COLUMNS)
+
+
+def load_history(path=None, start_date=None, end_date=None):
+    """
+    잔여/예약 이력 로드 (파일 확장자로 형식 판단: .jsonl 저널, .xlsx 변경 이력, 그 외 스냅샷 저장소)
+    경로를 지정하지 않으면 스냅샷 저장소가 있으면 스냅샷 저장소, 없으면 변경 저널 사용
+
+    스냅샷 저장소는 실행마다 읽은 값(관측 이력)을 사용하고, 관측 이력이 없는 이전 파일이면 마지막 값만 사용.
+    저널/변경 이력은 실제로 바뀐 셀만 담고 있으므로 규칙 비교가 바뀐 셀 쪽으로 치우침.
+
+    Returns:
+        DataFrame [observed, date, room_name, remaining, booked, value] (한 행 = 관측 시점의 방 타입×날짜 셀 하나)
+    """
+    if not path:
+        path = config.SNAPSHOT_STORE_FILE if os.path.exists(config.SNAPSHOT_STORE_FILE) else config.CHANGE_JOURNAL_FILE
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"이력 파일이 없습니다: {path}")
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.jsonl':
+        print("  ⚠ 변경 저널은 값이 바뀐 셀만 담고 있어 결과가 바뀐 셀 쪽으로 치우칩니다 (스냅샷 저장소 권장)")
+        records = pd.DataFrame(list(ChangeJournal(path).records()))
+        history = records.rename(columns=JOURNAL_HISTORY_COLUMNS) if not records.empty else records
+    elif ext == '.xlsx':
+        print("  ⚠ 변경 이력은 값이 바뀐 셀만 담고 있어 결과가 바뀐 셀 쪽으로 치우칩니다 (스냅샷 저장소 권장)")
+        history = _read_change_history_xlsx(path)
+    else:
+        store = SnapshotStore(path)
+        try:
+            history = pd.DataFrame(store.observations(start_date, end_date)).rename(columns={'run_id': 'observed'})
+            if history.empty:
+                print("  ⚠ 스냅샷 저장소에 관측 이력이 없어 날짜별 마지막 값만 사용합니다")
+                history = pd.DataFrame(store.cells(start_date, end_date)).rename(columns={'updated_at': 'observed'})
+        finally:
+            store.close()
+
+    if history.empty:
+        return pd.DataFrame(columns=HISTORY_COLUMNS)
+    history = history.reindex(columns=HISTORY_COLUMNS)
+    history['date'] = history['date'].astype(str).str[:10]
+    if start_date:
+        history = history[history['date'] >= start_date]
+    if end_date:
+        history = history[history['date'] <= end_date]
+    return history.reset_index(drop=True)
+
+
+def load_variants(rules_files=(), variants_file=None, include_baseline=True):
+    """후보 규칙표 목록 [(이름, 규칙 목록)] (현재 규칙표가 맨 앞)"""
+    variants = [(BASELINE_NAME, load_rules())] if include_baseline else []
+    for path in rules_files:
+        variants.append((os.path.splitext(os.path.basename(path))[0], load_rules(path)))
+    if variants_file:
+        with open(variants_file, encoding='utf-8') as f:
+            data = json.load(f)
+        items = data.items() if isinstance(data, dict) else ((v['name'], v['rules']) for v in data)
+        variants.extend((name, list(rules)) for name, rules in items)
+    names = [name for name, _ in variants]
+    if len(set(names)) != len(names):
+        raise ValueError("후보 규칙표 이름이 중복됩니다.")
+    return variants
+
+
+class RuleBacktest:
+    """
+    이력 셀 전체를 (방 타입 × 셀) 행렬로 만들어 두고 후보 규칙표마다 한 번씩 평가
+    (방 타입마다 셀 수가 다르므로 빈 자리는 NaN = 규칙 평가 제외)
+
+    지표 (규칙 평가 결과를 plan_room_availability와 같은 방식으로 해석):
+        changed   현재 값과 달라 입력·저장이 필요한 셀 수 (알림 셀 제외)
+        held_back 판매가능객실 제한으로 팔지 않고 묶어둔 객실 수 합계 = max(잔여 - (목표 - 예약), 0)
+                  (빈칸 = 모두 오픈은 0)
+        alerts    수동 확인 알림 셀 수
+    """
+
+    def __init__(self, history):
+        room_keys = {name: key for key, name in config.ROOM_TYPES.items()}
+        known = history['room_name'].isin(list(room_keys))
+        self.skipped = int((~known).sum())  # ROOM_TYPES에 없는 방 이름
+        history = history[known]
+
+        keys = history['room_name'].map(room_keys)
+        codes, self.room_keys = pd.factorize(keys)
+        self.room_keys = list(self.room_keys)
+        max_counts = keys.map(lambda key: config.ROOM_MAX_COUNT.get(key, 10)).to_numpy(dtype=float)
+        remaining = pd.to_numeric(history['remaining'], errors='coerce').to_numpy(dtype=float)
+        booked = pd.to_numeric(history['booked'], errors='coerce').to_numpy(dtype=float)
+        # 잔여/예약을 읽지 못한 셀은 실행 시와 같이 잔여=최대 수량, 예약=0으로 평가
+        missing = np.isnan(remaining) | np.isnan(booked)
+        remaining = np.where(missing, max_counts, remaining)
+        booked = np.where(missing, 0, booked)
+
+        # 셀 위치: (방 타입 행, 방 타입 안에서의 순번 열)
+        self.rows = codes
+        self.cols = pd.Series(codes).groupby(codes).cumcount().to_numpy()
+        shape = (len(self.room_keys), int(self.cols.max()) + 1 if len(codes) else 0)
+        self.remaining_matrix = np.full(shape, np.nan)
+        self.booked_matrix = np.full(shape, np.nan)
+        self.remaining_matrix[self.rows, self.cols] = remaining
+        self.booked_matrix[self.rows, self.cols] = booked
+        self.remaining = remaining
+        self.booked = booked
+        # 현재 입력값: 빈칸 NaN, 숫자가 아닌 값은 inf (어떤 목표와도 달라 항상 변경)
+        values = history['value'].astype(str).str.strip().where(history['value'].notna(), "")
+        current = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+        self.current = np.where(np.isnan(current) & (values != "").to_numpy(), np.inf, current)
+        self.cells = len(codes)
+        self.observations = history['observed'].nunique()
+        self.dates = (history['date'].min(), history['date'].max()) if self.cells else (None, None)
+
+    def run(self, rules):
+        """
+        규칙표 하나 평가
+
+        Returns:
+            (전체 지표 dict, 규칙별 지표 목록)
+        """
+        engine = AvailabilityRules(rules)
+        result = engine.evaluate(self.room_keys, self.remaining_matrix, self.booked_matrix)
+        target = result['target'][self.rows, self.cols]
+        alert = result['alert'][self.rows, self.cols]
+        rule_idx = result['rule'][self.rows, self.cols]
+
+        unchanged = (np.isnan(target) & np.isnan(self.current)) | (target == self.current)
+        changed = ~alert & ~unchanged
+        offered = np.clip(np.nan_to_num(target) - self.booked, 0, None)
+        held_back = np.where(np.isnan(target), 0, np.clip(self.remaining - offered, 0, None))
+
+        totals = {'cells': self.cells, 'changed': int(changed.sum()),
+                  'held_back': int(held_back.sum()), 'alerts': int(alert.sum())}
+        # 규칙별 집계 (0번 칸 = 규칙 없음)
+        bins = rule_idx + 1
+        size = len(engine.rules) + 1
+        counts = {
+            'cells': np.bincount(bins, minlength=size),
+            'changed': np.bincount(bins, weights=changed, minlength=size),
+            'held_back': np.bincount(bins, weights=held_back, minlength=size),
+            'alerts': np.bincount(bins, weights=alert, minlength=size),
+        }
+        per_rule = [
+            dict(rule=engine.describe(idx), **{name: int(values[idx + 1]) for name, values in counts.items()})
+            for idx in range(-1, len(engine.rules))
+            if idx >= 0 or counts['cells'][0]
+        ]
+        return totals, per_rule
+
+
+def run_backtest(history, variants):
+    """
+    후보 규칙표 전체 백테스트
+
+    Returns:
+        (RuleBacktest, 규칙표별 결과 DataFrame, 규칙별 결과 DataFrame)
+    """
+    backtest = RuleBacktest(history)
+    summary, details = [], []
+    for name, rules in variants:
+        started = time.time()
+        totals, per_rule = backtest.run(rules)
+        summary.append(dict(variant=name, **totals, ms=round((time.time() - started) * 1000, 1)))
+        details.extend(dict(variant=name, **row) for row in per_rule)
+    return backtest, pd.DataFrame(summary), pd.DataFrame(details)
+
+
+def print_report(backtest, summary, details, detail=False):
+    print("\n" + "="*60)
+    print(f"📊 규칙 백테스트: 셀 {backtest.cells:,}개 (관측 {backtest.observations}회, "
+          f"{backtest.dates[0]} ~ {backtest.dates[1]}), 후보 {len(summary)}개")
+    if backtest.skipped:
+        print(f"  ⚠ ROOM_TYPES에 없는 방 이름 {backtest.skipped}개 셀 제외")
+    print("="*60)
+    print(f"  {'후보':<24} {'변경 셀':>8} {'묶어둔 객실':>10} {'알림':>6} {'평가(ms)':>9}")
+    for row in summary.itertuples():
+        print(f"  {row.variant:<24} {row.changed:>8,} {row.held_back:>10,} {row.alerts:>6,} {row.ms:>9.1f}")
+    if not detail:
+        return
+    for name, rows in details.groupby('variant', sort=False):
+        print(f"\n  [{name}]")
+        for row in rows.itertuples():
+            print(f"    {row.rule:<32} 셀 {row.cells:>7,} | 변경 {row.changed:>6,} | "
+                  f"묶어둔 객실 {row.held_back:>6,} | 알림 {row.alerts:>5,}")
+
+
+def export_results(summary, details, path):
+    """결과 저장 (.xlsx면 규칙표별/규칙별 시트, 그 외 규칙별 결과 CSV)"""
+    if path.lower().endswith('.xlsx'):
+        with pd.ExcelWriter(path) as writer:
+            summary.to_excel(writer, sheet_name='variants', index=False)
+            details.to_excel(writer, sheet_name='rules', index=False)
+    else:
+        details.to_csv(path, index=False, encoding='utf-8-sig')
+    print(f"\n백테스트 결과({path}) 저장 완료!")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="판매가능객실 규칙 백테스트 (오프라인)")
+    parser.add_argument("--history", default=None,
+                        help="이력 파일: 저널(.jsonl), 변경 이력(.xlsx), 스냅샷 저장소(.sqlite3) "
+                             "(기본: 스냅샷 저장소, 없으면 변경 저널)")
+    parser.add_argument("--rules", nargs="*", default=[], help="후보 규칙표 JSON (파일 하나가 후보 하나)")
+    parser.add_argument("--variants", default=None, help="여러 후보 규칙표를 담은 JSON")
+    parser.add_argument("--no-baseline", action="store_true", help="현재 규칙표(config)를 비교에서 제외")
+    parser.add_argument("--start", help="이력 시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", help="이력 종료일 (YYYY-MM-DD)")
+    parser.add_argument("--detail", action="store_true", help="규칙별 지표 출력")
+    parser.add_argument("-o", "--output", default=None, help="결과 저장 (.xlsx 또는 .csv)")
+    args = parser.parse_args(argv)
+
+    started = time.time()
+    try:
+        history = load_history(args.history, args.start, args.end)
+    except (OSError, ValueError) as e:
+        print(f"❌ 이력 읽기 실패: {e}")
+        return
+    if history.empty:
+        print("백테스트할 이력이 없습니다.")
+        return
+    variants = load_variants(args.rules, args.variants, include_baseline=not args.no_baseline)
+    if not variants:
+        print("비교할 규칙표가 없습니다. --rules 또는 --variants를 지정하세요.")
+        return
+    backtest, summary, details = run_backtest(history, variants)
+    print_report(backtest, summary, details, args.detail)
+    if args.output:
+        export_results(summary, details, args.output)
+    print(f"\n⏱ 전체 {time.time() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
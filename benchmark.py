@@ -0,0 +1,171 @@
+"""
+모의 CMS 화면 기반 종단간 벤치마크
+cms_stub_server의 모의 화면을 헤드리스 Chrome으로 실제 조작하며
+윈도우당 시간, 셀당 WebDriver 명령 수, 초당 처리 셀 수를 측정
+
+사용법:
+    python benchmark.py --windows 3 --latency-ms 100 --render-ms 200
+    python benchmark.py --json bench.json       # 결과를 JSON으로 저장 (변경 전후 비교용)
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import config
+from cms_profiler import CMSProfiler
+from cms_stub_server import STUB_CHANNELS, start_stub_server
+
+
+# 벤치마크 동안 바꾸는 설정 (끝나면 원래 값으로 되돌림)
+STUB_CONFIG_KEYS = (
+    'CMS_BASE_URL', 'CMS_URL', 'CMS_API_BASE_URL', 'CMS_BACKEND', 'HEADLESS', 'SESSION_REUSE',
+    'CHROME_USER_DATA_DIR', 'SESSION_FILE', 'CHANGE_JOURNAL_FILE', 'CHECKPOINT_FILE', 'SNAPSHOT_STORE_FILE',
+    'BASE_PRICE_FILE',
+)
+
+
+@contextmanager
+def stub_config(base_url, work_dir, headless=True):
+    """
+    블록 안에서만 설정을 스텁 서버/임시 디렉터리로 전환
+    (실제 CMS, 기준가격.xlsx, 저널, 체크포인트, 스냅샷 저장소를 건드리지 않고, 끝나면 원래 설정으로 복원)
+    """
+    original = {key: getattr(config, key) for key in STUB_CONFIG_KEYS}
+    try:
+        config.CMS_BASE_URL = base_url
+        config.CMS_URL = base_url + "/#/app/zz/zz03_0100"
+        config.CMS_API_BASE_URL = base_url
+        config.CMS_BACKEND = 'browser'
+        config.HEADLESS = headless
+        config.SESSION_REUSE = False
+        config.CHROME_USER_DATA_DIR = None
+        config.SESSION_FILE = os.path.join(work_dir, 'session.json')
+        config.CHANGE_JOURNAL_FILE = os.path.join(work_dir, 'change_journal.jsonl')
+        config.CHECKPOINT_FILE = os.path.join(work_dir, 'checkpoint.json')
+        config.SNAPSHOT_STORE_FILE = os.path.join(work_dir, 'snapshots.sqlite3')
+        price_file = os.path.join(work_dir, os.path.basename(config.BASE_PRICE_FILE))
+        if os.path.exists(config.BASE_PRICE_FILE):
+            shutil.copy(config.BASE_PRICE_FILE, price_file)
+        config.BASE_PRICE_FILE = price_file
+        yield
+    finally:
+        for key, value in original.items():
+            setattr(config, key, value)
+
+
+def measure(name, profiler, func, windows, cells):
+    """시나리오 하나 실행 후 지표 계산"""
+    profiler.reset()
+    started = time.time()
+    func()
+    elapsed = time.time() - started
+    commands = profiler.total_commands()
+    return {
+        'scenario': name,
+        'windows': windows,
+        'cells': cells,
+        'seconds': round(elapsed, 3),
+        'seconds_per_window': round(elapsed / windows, 3) if windows else None,
+        'commands': commands,
+        'commands_per_cell': round(commands / cells, 2) if cells else None,
+        'cells_per_second': round(cells / elapsed, 1) if elapsed else None,
+        'top_commands': profiler.command_counts()[:5],
+    }
+
+
+def print_report(results, settings):
+    print("\n" + "="*86)
+    print(f"📊 벤치마크 결과 (API 지연 {settings['latency_ms']}ms, 렌더링 지연 {settings['render_ms']}ms, "
+          f"드라이버 프로필 {settings.get('driver_profile', '-')})")
+    print("="*86)
+    print(f"{'시나리오':<22}{'윈도우':>6}{'셀':>7}{'시간(s)':>10}{'s/윈도우':>10}{'명령':>8}{'명령/셀':>9}{'셀/s':>9}")
+    for r in results:
+        print(f"{r['scenario']:<22}{r['windows']:>6}{r['cells']:>7}{r['seconds']:>10.2f}"
+              f"{(r['seconds_per_window'] or 0):>10.2f}{r['commands']:>8}{(r['commands_per_cell'] or 0):>9.2f}"
+              f"{(r['cells_per_second'] or 0):>9.1f}")
+    for r in results:
+        top = ", ".join(f"{command} {count}" for command, count in r['top_commands'])
+        print(f"  {r['scenario']}: {top}")
+
+
+def run_benchmark(windows=2, start_date=None, latency_ms=50, render_ms=100, headless=True, driver_profile=None):
+    """
+    모의 화면에서 로그인 → 객실수 자동조정(첫 실행/재실행) → 요금 자동입력 측정
+
+    Returns:
+        시나리오별 결과 목록
+    """
+    from hotel_cms_controller import HotelCMSController, INVENTORY_WINDOW_DAYS
+
+    start_date = start_date or (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+    end_date = (datetime.strptime(start_date, "%Y-%m-%d")
+                + timedelta(days=windows * INVENTORY_WINDOW_DAYS - 1)).strftime("%Y-%m-%d")
+    work_dir = tempfile.mkdtemp(prefix="hcms-bench-")
+    server, base_url = start_stub_server(latency_ms=latency_ms, render_ms=render_ms)
+    results = []
+    try:
+        with stub_config(base_url, work_dir, headless):
+            print(f"✓ 스텁 서버: {base_url} (작업 디렉터리: {work_dir})")
+            inventory_cells = windows * INVENTORY_WINDOW_DAYS * len(config.ROOM_TYPES)
+            rate_cells = len(server.state.room_names) * len(STUB_CHANNELS) * INVENTORY_WINDOW_DAYS
+            controller = HotelCMSController()
+            controller.profiler = CMSProfiler(enabled=True)  # WebDriver 명령 수 집계 (WebElement 명령 포함)
+            try:
+                controller.setup_driver(driver_profile)
+                profiler = controller.profiler
+
+                def login():
+                    controller.navigate_to_cms()
+                    if not controller.login():
+                        raise RuntimeError("모의 화면 로그인 실패")
+
+                results.append(measure("로그인", profiler, login, 0, 0))
+                results.append(measure(
+                    "객실수 (변경 있음)", profiler,
+                    lambda: controller.run_for_date_range_with_input(start_date, end_date), windows, inventory_cells))
+                results.append(measure(
+                    "객실수 (변경 없음)", profiler,
+                    lambda: controller.run_for_date_range_with_input(start_date, end_date), windows, inventory_cells))
+                results.append(measure(
+                    "요금 (RMO)", profiler,
+                    lambda: controller.auto_set_rates_by_rmo(start_date, window_days=INVENTORY_WINDOW_DAYS),
+                    1, rate_cells))
+            finally:
+                controller.close()  # 작업 디렉터리의 저널/스냅샷 저장소를 닫은 뒤 설정 복원
+    finally:
+        server.shutdown()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 CMS 화면 종단간 벤치마크")
+    parser.add_argument("--windows", type=int, default=2, help="객실수 자동조정 15일 윈도우 수")
+    parser.add_argument("--start", default=None, help="시작일 (기본: 오늘+3일)")
+    parser.add_argument("--latency-ms", type=int, default=50, help="API(XHR) 응답 지연")
+    parser.add_argument("--render-ms", type=int, default=100, help="그리드 렌더링 지연")
+    parser.add_argument("--show", action="store_true", help="브라우저 창 표시 (기본: 헤드리스)")
+    parser.add_argument("--driver-profile", choices=sorted(config.DRIVER_PROFILES), default=None,
+                        help="Chrome 드라이버 프로필 (프로필별 속도 비교용)")
+    parser.add_argument("--json", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    settings = {'windows': args.windows, 'latency_ms': args.latency_ms, 'render_ms': args.render_ms,
+                'driver_profile': args.driver_profile or config.DRIVER_PROFILE}
+    results = run_benchmark(args.windows, args.start, args.latency_ms, args.render_ms, headless=not args.show,
+                            driver_profile=args.driver_profile)
+    print_report(results, settings)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'settings': settings, 'measured_at': datetime.now().isoformat(timespec='seconds'),
+                       'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
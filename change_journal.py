@@ -0,0 +1,141 @@
+"""
+판매가능객실 변경 저널 (JSONL, 추가 전용)
+윈도우가 저장될 때마다 해당 윈도우의 변경 내역을 바로 파일에 기록 (실행 중 오류가 나도 저장된 변경은 남음)
+
+엑셀 내보내기:
+    python change_journal.py                       # 마지막 실행분 → change_history.xlsx
+    python change_journal.py --all -o 전체이력.xlsx  # 전체 이력
+"""
+import argparse
+import json
+import os
+from datetime import datetime
+
+from openpyxl import Workbook
+
+import config
+
+JOURNAL_COLUMNS = ('run_id', 'run_date', 'date', 'room_type', 'old_value', 'new_value', 'remaining', 'booked', 'saved')
+
+
+def new_run_id():
+    """실행 구분용 ID (시작 시각)"""
+    return datetime.now().strftime("%Y%m%d-%H%M%S")
+
+
+class ChangeJournal:
+    """추가 전용 변경 저널 (한 줄 = 셀 변경 1건)"""
+
+    def __init__(self, path=None, run_id=None):
+        self.path = path or config.CHANGE_JOURNAL_FILE
+        self.run_id = run_id or new_run_id()
+        self.count = 0  # 이번 실행에서 기록한 건수
+
+    def append(self, changes, saved=True):
+        """
+        윈도우 하나의 변경 목록 기록 (파일에 바로 flush + fsync)
+
+        Args:
+            changes: plan_room_availability의 변경 목록
+            saved: 저장(확인 팝업)까지 완료되었는지 여부
+        """
+        if not changes:
+            return 0
+        run_date = datetime.now().strftime('%Y-%m-%d')
+        lines = []
+        for change in changes:
+            record = {
+                'run_id': self.run_id,
+                'run_date': run_date,
+                'date': change['date'],
+                'room_type': change['room_name'],
+                'old_value': change['old_value'],
+                'new_value': change['value'],
+                'remaining': change.get('remaining'),
+                'booked': change.get('booked'),
+                'saved': saved,
+            }
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.count += len(lines)
+        return len(lines)
+
+    def records(self, run_id=None):
+        """저널 레코드를 한 줄씩 읽기 (run_id 지정 시 해당 실행분만, 깨진 줄은 건너뜀)"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # 기록 도중 중단된 마지막 줄
+                if run_id is None or record.get('run_id') == run_id:
+                    yield record
+
+    def last_run_id(self):
+        last = None
+        for record in self.records():
+            last = record.get('run_id')
+        return last
+
+    def merge_from(self, path):
+        """다른 저널 파일(병렬 워커 등)의 내용을 이어 붙이고 원본 삭제"""
+        if not os.path.exists(path):
+            return 0
+        count = 0
+        with open(path, encoding='utf-8') as src, open(self.path, 'a', encoding='utf-8') as dst:
+            for line in src:
+                if line.strip():
+                    dst.write(line if line.endswith("\n") else line + "\n")
+                    count += 1
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.remove(path)
+        self.count += count
+        return count
+
+    def export_xlsx(self, path="change_history.xlsx", run_id=None):
+        """
+        저널을 엑셀로 내보내기 (행 단위 스트리밍 쓰기)
+
+        Returns:
+            내보낸 건수
+        """
+        workbook = sheet = None
+        count = 0
+        for record in self.records(run_id):
+            if workbook is None:
+                # 기록이 있을 때만 워크북 생성 (저장하지 않은 write-only 워크북을 남기지 않음)
+                workbook = Workbook(write_only=True)
+                sheet = workbook.create_sheet("change_history")
+                sheet.append(list(JOURNAL_COLUMNS))
+            sheet.append([record.get(column) for column in JOURNAL_COLUMNS])
+            count += 1
+        if workbook is not None:
+            workbook.save(path)
+        return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="변경 저널 엑셀 내보내기")
+    parser.add_argument("-o", "--output", default="change_history.xlsx")
+    parser.add_argument("--journal", default=None, help="저널 파일 (기본: config.CHANGE_JOURNAL_FILE)")
+    parser.add_argument("--run", default=None, help="내보낼 실행 ID (기본: 마지막 실행)")
+    parser.add_argument("--all", action="store_true", help="전체 이력 내보내기")
+    args = parser.parse_args()
+
+    journal = ChangeJournal(args.journal)
+    run_id = None if args.all else (args.run or journal.last_run_id())
+    count = journal.export_xlsx(args.output, run_id)
+    if count:
+        print(f"변경 이력({args.output}) 저장 완료! 변경 건수: {count}")
+    else:
+        print("변경된 내역이 없습니다.")
+
+
+if __name__ == "__main__":
+    main()
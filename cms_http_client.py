@@ -0,0 +1,251 @@
+"""
+CMS JSON API 직접 호출 클라이언트 (화면 조작 없이 인벤토리/요금 조회·저장)
+브라우저 로그인 세션의 쿠키를 가져와 연결 풀을 쓰는 requests 세션으로 호출
+
+요청/응답 형식 (cms_stub_server.py가 같은 형식으로 동작):
+    inventory_search  {"startDate", "days", "rooms": [방 이름]}
+                      → {"rows": [{"roomName", "date", "remaining", "booked", "salesLimit"}]}
+    inventory_save    {"items": [{"roomName", "date", "salesLimit"}]}  (salesLimit null = 빈칸)
+                      → {"results": [{"roomName", "date", "ok", "salesLimit"}]}
+    rate_search       {"startDate", "days"}
+                      → {"rows": [{"roomName", "channel", "date", "price", "closed"}]}
+    rate_save         {"items": [{"roomName", "channel", "date", "price"}]}
+                      → {"results": [{"roomName", "channel", "date", "ok"}]}
+
+모든 API가 POST이므로 재시도는 조회(search) 요청에만 적용 (저장 요청은 중복 반영될 수 있어 재시도하지 않고 실패를 그대로 알림)
+"""
+import json
+import time
+from datetime import datetime, timedelta
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+
+
+class CMSApiError(Exception):
+    """CMS API 호출 실패"""
+
+
+class CMSAuthError(CMSApiError):
+    """CMS API 인증 실패 (세션 만료)"""
+
+
+READ_ENDPOINTS = ('inventory_search', 'rate_search')  # 같은 요청을 다시 보내도 안전한 조회 API
+READ_RETRIES = 2  # 조회 요청 재시도 횟수 (연결 오류, 502/503/504)
+RETRY_STATUS = (502, 503, 504)
+
+
+def endpoints_ready():
+    """
+    HTTP 백엔드를 쓸 수 있는지 확인
+
+    Returns:
+        (가능 여부, 불가능한 이유)
+    """
+    if not config.CMS_API_ENDPOINTS_CONFIRMED:
+        return False, ("config.CMS_API_ENDPOINTS가 확인되지 않았습니다 - 개발자 도구 Network 탭에서 실제 경로를 확인해 "
+                       "수정한 뒤 CMS_API_ENDPOINTS_CONFIRMED = True로 설정하세요")
+    missing = [name for name in ('inventory_search', 'inventory_save', 'rate_search', 'rate_save')
+               if not config.CMS_API_ENDPOINTS.get(name)]
+    if missing:
+        return False, f"config.CMS_API_ENDPOINTS에 경로가 없습니다: {', '.join(missing)}"
+    return True, None
+
+
+class CMSHttpClient:
+    """인벤토리/요금 조회·저장 API 클라이언트"""
+
+    def __init__(self, base_url=None, endpoints=None, pool_size=None, timeout=None):
+        self.base_url = base_url or config.CMS_API_BASE_URL
+        self.endpoints = dict(config.CMS_API_ENDPOINTS)
+        self.endpoints.update(endpoints or {})
+        self.timeout = timeout or config.HTTP_TIMEOUT
+        self.sleep = time.sleep  # 조회 재시도 간 대기 (프로파일러가 감쌀 수 있도록 인스턴스 속성)
+        self.relogin = None  # 인증 실패 시 한 번 호출할 재로그인 함수 (세션 쿠키를 다시 등록, 컨트롤러가 설정)
+
+        pool_size = pool_size or config.HTTP_POOL_SIZE
+        # 재시도는 _post에서 조회 요청에만 적용 (어댑터는 재시도하지 않음)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        })
+
+    # ------------------------------------------------------------------
+    # 인증 (브라우저 세션 재사용)
+    # ------------------------------------------------------------------
+    def import_cookies(self, cookies, storage=None):
+        """Selenium get_cookies() 형식의 쿠키와 웹 스토리지(토큰)를 세션에 등록"""
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain'), path=cookie.get('path', '/')
+            )
+        token_key = config.CMS_API_TOKEN_STORAGE_KEY
+        if token_key and storage:
+            token = (storage.get('local') or {}).get(token_key) or (storage.get('session') or {}).get(token_key)
+            if token:
+                self.session.headers["Authorization"] = f"Bearer {token.strip(chr(34))}"
+        return len(cookies)
+
+    def import_browser_session(self, driver, storage=None):
+        """로그인된 WebDriver의 쿠키를 가져오기"""
+        return self.import_cookies(driver.get_cookies(), storage)
+
+    def load_session_file(self, path=None):
+        """save_session()으로 저장된 세션 파일에서 쿠키 가져오기"""
+        with open(path or config.SESSION_FILE, encoding='utf-8') as f:
+            session = json.load(f)
+        return self.import_cookies(session.get('cookies', []), session.get('storage'))
+
+    def is_session_valid(self):
+        """가벼운 조회 요청으로 API 세션이 살아 있는지 확인 (인증 실패면 False, 그 외 오류는 그대로 발생)"""
+        try:
+            self._send('inventory_search', {'startDate': datetime.now().strftime("%Y-%m-%d"), 'days': 1, 'rooms': []})
+            return True
+        except CMSAuthError:
+            return False
+
+    # ------------------------------------------------------------------
+    # 공통 호출
+    # ------------------------------------------------------------------
+    def _post(self, name, payload):
+        """
+        API 호출 - 인증 실패(세션 만료)면 relogin으로 다시 로그인한 뒤 한 번만 다시 보냄
+        (401/403 응답은 서버가 요청을 처리하지 않은 것이므로 저장 요청도 다시 보내도 안전)
+        """
+        try:
+            return self._send(name, payload)
+        except CMSAuthError as e:
+            if not self.relogin:
+                raise
+            print(f"  ⚠ {e} - 다시 로그인 후 한 번 재시도합니다.")
+            self.relogin()
+            return self._send(name, payload)
+
+    def _send(self, name, payload):
+        url = urljoin(self.base_url, self.endpoints[name])
+        retries = READ_RETRIES if name in READ_ENDPOINTS else 0
+        for attempt in range(retries + 1):
+            try:
+                response = self.session.post(url, data=json.dumps(payload), timeout=self.timeout)
+            except requests.RequestException as e:
+                if attempt < retries:
+                    self.sleep(0.3 * (2 ** attempt))
+                    continue
+                raise CMSApiError(f"{name} 요청 실패: {e}") from e
+            if response.status_code in RETRY_STATUS and attempt < retries:
+                self.sleep(0.3 * (2 ** attempt))
+                continue
+            break
+        if response.status_code in (401, 403):
+            raise CMSAuthError(f"{name} 인증 실패 (HTTP {response.status_code}) - 세션이 만료되었습니다")
+        if not response.ok:
+            raise CMSApiError(f"{name} 실패 (HTTP {response.status_code}): {response.text[:200]}")
+        try:
+            return response.json()
+        except ValueError as e:
+            raise CMSApiError(f"{name} 응답이 JSON이 아닙니다: {response.text[:200]}") from e
+
+    # ------------------------------------------------------------------
+    # 인벤토리 (cm03_0300)
+    # ------------------------------------------------------------------
+    def read_inventory_window(self, start_date, days, room_names):
+        """
+        인벤토리 윈도우 조회
+
+        Returns:
+            HotelCMSController.read_inventory_grid_snapshot과 같은 구조
+            {'start_date', 'rooms': {방 이름: {'found', 'expanded', 'dates': {날짜: {'col', 'remaining', 'booked', 'value', 'disabled'}}}}}
+        """
+        data = self._post('inventory_search', {'startDate': start_date, 'days': days, 'rooms': list(room_names)})
+        base = datetime.strptime(start_date, "%Y-%m-%d")
+        date_cols = {(base + timedelta(days=i)).strftime("%Y-%m-%d"): i for i in range(days)}
+
+        rooms = {name: {'found': False, 'expanded': True, 'dates': {}} for name in room_names}
+        for row in data.get('rows', []):
+            room = rooms.get(row.get('roomName'))
+            col = date_cols.get(row.get('date'))
+            if room is None or col is None:
+                continue
+            limit = row.get('salesLimit')
+            room['found'] = True
+            room['dates'][row['date']] = {
+                'col': col,
+                'remaining': row.get('remaining'),
+                'booked': row.get('booked'),
+                'value': "" if limit is None else str(limit),
+                'disabled': False,
+            }
+        for room in rooms.values():
+            room['dates'] = dict(sorted(room['dates'].items(), key=lambda item: item[1]['col']))
+        return {'start_date': start_date, 'rooms': rooms}
+
+    def save_availability(self, changes):
+        """
+        판매가능객실 저장
+
+        Args:
+            changes: [{'room_name', 'col', 'date', 'value'}] (value None = 빈칸)
+
+        Returns:
+            {'방 이름|컬럼': {'ok', 'actual'}} (apply_availability_changes와 같은 형식)
+        """
+        if not changes:
+            return {}
+        items = [{'roomName': c['room_name'], 'date': c['date'], 'salesLimit': c['value']} for c in changes]
+        data = self._post('inventory_save', {'items': items})
+        saved = {(r.get('roomName'), r.get('date')): r for r in data.get('results', [])}
+        result = {}
+        for c in changes:
+            row = saved.get((c['room_name'], c['date']), {})
+            actual = row.get('salesLimit')
+            result[f"{c['room_name']}|{c['col']}"] = {
+                'ok': bool(row.get('ok')),
+                'actual': "" if actual is None else str(actual),
+            }
+        return result
+
+    # ------------------------------------------------------------------
+    # 요금 (cm03_0200)
+    # ------------------------------------------------------------------
+    def read_rates(self, start_date, days):
+        """
+        요금 조회
+
+        Returns:
+            {방 이름: {'closed': {날짜: bool}, 'channels': {채널: {날짜: 요금}}}}
+        """
+        data = self._post('rate_search', {'startDate': start_date, 'days': days})
+        rates = {}
+        for row in data.get('rows', []):
+            room = rates.setdefault(row['roomName'], {'closed': {}, 'channels': {}})
+            if row.get('closed'):
+                room['closed'][row['date']] = True
+            else:
+                room['closed'].setdefault(row['date'], False)
+            room['channels'].setdefault(row['channel'], {})[row['date']] = row.get('price')
+        return rates
+
+    def save_rates(self, items):
+        """
+        요금 저장
+
+        Args:
+            items: [{'room_name', 'channel', 'date', 'price'}]
+
+        Returns:
+            저장 성공 건수
+        """
+        if not items:
+            return 0
+        payload = [{'roomName': i['room_name'], 'channel': i['channel'], 'date': i['date'], 'price': i['price']}
+                   for i in items]
+        data = self._post('rate_save', {'items': payload})
+        return sum(1 for r in data.get('results', []) if r.get('ok'))
@@ -0,0 +1,236 @@
+"""
+WebDriver 명령 프로파일러
+driver.execute(모든 WebDriver/WebElement 명령), WebDriverWait.until, 컨트롤러가 쓰는 sleep(SLEEP_SCOPE)을 감싸
+호출 수·소요 시간·실패(요소 못 찾음, 타임아웃)를 단계(phase)와 윈도우별로 집계
+(전역 time.sleep은 건드리지 않으며, 단계/윈도우 구분은 스레드별로 유지)
+
+꺼져 있으면 아무것도 감싸지 않고 phase()/window()는 빈 컨텍스트만 돌려줌
+"""
+import csv
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import config
+
+_NULL_CONTEXT = nullcontext()
+# sleep 집계 범위 (컨트롤러의 모든 sleep은 이 경로를 거침 - 브라우저 스레드 밖의 병렬/숙소 시작 분산 대기는 제외)
+SLEEP_SCOPE = "대기 엔진 폴링(CMSWaiter.sleep), 상주 모드 주기 대기(idle 단계), HTTP 조회 재시도 대기"
+
+
+def profiled_phase(name):
+    """메서드 실행 구간을 self.profiler의 단계로 기록하는 데코레이터"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.profiler
+            if not profiler.enabled:
+                return method(self, *args, **kwargs)
+            with profiler.phase(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class CMSProfiler:
+    """명령/대기/sleep 호출을 (윈도우, 단계, 명령)별로 집계"""
+
+    def __init__(self, enabled=None, top_n=None):
+        self.enabled = config.PROFILE_ENABLED if enabled is None else enabled
+        self.top_n = top_n or config.PROFILE_TOP_N
+        self.commands = {}  # (윈도우, 단계, 명령) → [횟수, 합계(s), 실패 횟수]
+        self.phases = {}  # (윈도우, 단계) → [횟수, 합계(s)]
+        self._local = threading.local()  # 스레드별 단계 스택/현재 윈도우
+        self._lock = threading.Lock()
+        self._restore = []
+
+    @property
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @property
+    def _window(self):
+        return getattr(self._local, 'window', '-')
+
+    @_window.setter
+    def _window(self, label):
+        self._local.window = label
+
+    # ------------------------------------------------------------------
+    # 계측 설치/해제
+    # ------------------------------------------------------------------
+    def attach(self, driver, wait=None, waiter=None):
+        """
+        드라이버 명령, WebDriverWait.until, waiter.sleep 감싸기 (꺼져 있으면 아무것도 하지 않음)
+        wait.until 안의 명령/sleep도 각각 따로 집계되므로 명령별 시간은 서로 겹칠 수 있음
+        """
+        if not self.enabled:
+            return
+        execute = driver.execute
+
+        def profiled_execute(driver_command, params=None):
+            return self._timed(driver_command, execute, driver_command, params)
+        driver.execute = profiled_execute
+        self._restore.append(lambda: setattr(driver, 'execute', execute))
+
+        if wait is not None:
+            until = wait.until
+
+            def profiled_until(method, message=""):
+                return self._timed('wait.until', until, method, message)
+            wait.until = profiled_until
+            self._restore.append(lambda: setattr(wait, 'until', until))
+
+        if waiter is not None:
+            self.wrap_sleep(waiter)
+
+    def wrap_sleep(self, owner):
+        """owner.sleep(대기 엔진, HTTP 클라이언트 등의 인스턴스 속성)을 감싸 'sleep'으로 집계"""
+        if not self.enabled:
+            return
+        sleep = owner.sleep
+
+        def profiled_sleep(seconds):
+            return self._timed('sleep', sleep, seconds)
+        owner.sleep = profiled_sleep
+        self._restore.append(lambda: setattr(owner, 'sleep', sleep))
+
+    def detach(self):
+        while self._restore:
+            self._restore.pop()()
+
+    def _timed(self, command, func, *args):
+        started = time.perf_counter()
+        failed = False
+        try:
+            return func(*args)
+        except Exception:
+            failed = True  # find_element 못 찾음, 대기 타임아웃 등
+            raise
+        finally:
+            stack = self._stack
+            key = (self._window, stack[-1] if stack else '-', command)
+            with self._lock:
+                stat = self.commands.get(key)
+                if stat is None:
+                    stat = self.commands[key] = [0, 0.0, 0]
+                stat[0] += 1
+                stat[1] += time.perf_counter() - started
+                stat[2] += failed
+
+    # ------------------------------------------------------------------
+    # 단계/윈도우 구분
+    # ------------------------------------------------------------------
+    def phase(self, name):
+        """단계 구간 (중첩 시 안쪽 단계로 명령을 집계)"""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._phase(name)
+
+    @contextmanager
+    def _phase(self, name):
+        self._stack.append(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            with self._lock:
+                stat = self.phases.setdefault((self._window, name), [0, 0.0])
+                stat[0] += 1
+                stat[1] += time.perf_counter() - started
+
+    def window(self, label):
+        """윈도우 구간 (윈도우 시작일별 집계)"""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._window_context(label)
+
+    @contextmanager
+    def _window_context(self, label):
+        previous, self._window = self._window, label
+        try:
+            yield
+        finally:
+            self._window = previous
+
+    # ------------------------------------------------------------------
+    # 집계/보고
+    # ------------------------------------------------------------------
+    def reset(self):
+        self.commands.clear()
+        self.phases.clear()
+
+    def total_commands(self, include_sleep=False):
+        return sum(stat[0] for (_, _, command), stat in self.commands.items()
+                   if include_sleep or command not in ('sleep', 'wait.until'))
+
+    def command_counts(self):
+        """명령별 호출 수 (sleep/wait.until 제외, 많은 순)"""
+        return [(command, count) for command, (count, _, _) in self._group(lambda key: key[2])
+                if command not in ('sleep', 'wait.until')]
+
+    def _group(self, key_func):
+        grouped = {}
+        for key, (count, total, failed) in self.commands.items():
+            stat = grouped.setdefault(key_func(key), [0, 0.0, 0])
+            stat[0] += count
+            stat[1] += total
+            stat[2] += failed
+        return sorted(grouped.items(), key=lambda item: -item[1][1])
+
+    def report(self):
+        """상위 N개 비용 출력 (명령별, 단계×명령별, 단계별, 윈도우별)"""
+        if not self.enabled or not self.commands:
+            return
+        top = self.top_n
+        print(f"\n🔬 WebDriver 프로파일 (상위 {top}개)")
+        print(f"  sleep 집계 범위: {SLEEP_SCOPE}")
+        print("  [명령별]")
+        for command, (count, total, failed) in self._group(lambda key: key[2])[:top]:
+            print(f"    {command:<28} {count:>6}회 {total:8.2f}s  평균 {total / count * 1000:7.1f}ms  실패 {failed}")
+        print("  [단계 × 명령]")
+        for (phase, command), (count, total, failed) in self._group(lambda key: (key[1], key[2]))[:top]:
+            print(f"    {phase:<18} {command:<28} {count:>6}회 {total:8.2f}s  실패 {failed}")
+        print("  [단계별 소요 시간]")
+        phases = {}
+        for (_, name), (count, total) in self.phases.items():
+            stat = phases.setdefault(name, [0, 0.0])
+            stat[0] += count
+            stat[1] += total
+        for name, (count, total) in sorted(phases.items(), key=lambda item: -item[1][1])[:top]:
+            print(f"    {name:<18} {count:>6}회 {total:8.2f}s")
+        windows = self._group(lambda key: key[0])
+        if len(windows) > 1:
+            print("  [윈도우별]")
+            for label, (count, total, failed) in windows[:top]:
+                print(f"    {label:<12} 명령 {count:>6}회 {total:8.2f}s  실패 {failed}")
+
+    def export(self, path=None):
+        """집계를 CSV(.csv) 또는 JSON으로 저장"""
+        path = path or config.PROFILE_EXPORT_FILE
+        if not self.enabled or not path:
+            return None
+        rows = [
+            {'window': window, 'phase': phase, 'command': command,
+             'count': count, 'seconds': round(total, 4), 'failed': failed}
+            for (window, phase, command), (count, total, failed) in
+            sorted(self.commands.items(), key=lambda item: -item[1][1])
+        ]
+        if path.endswith('.csv'):
+            with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.DictWriter(f, fieldnames=['window', 'phase', 'command', 'count', 'seconds', 'failed'])
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            phases = [{'window': window, 'phase': name, 'count': count, 'seconds': round(total, 4)}
+                      for (window, name), (count, total) in self.phases.items()]
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'commands': rows, 'phases': phases}, f, ensure_ascii=False, indent=2)
+        print(f"  ✓ 프로파일 저장: {path}")
+        return path
@@ -0,0 +1,242 @@
+"""
+CMS 스텁 서버 (실제 CMS 없이 테스트/벤치마크용)
+- cms_http_client.py가 사용하는 인벤토리/요금 조회·저장 JSON 엔드포인트를 메모리 데이터로 흉내냄
+- / 에서 mock_cms/index.html 모의 화면(로그인, cm03_0300 인벤토리, cm03_0200 요금관리)을 제공
+- 세션 만료 흉내: StubCMSState.expire_sessions() 또는 POST /stub/expire-sessions 이후
+  지금까지 쓰인 JSESSIONID로 오는 API 요청은 401 (다시 로그인해 새 쿠키를 받으면 정상 응답)
+
+사용법:
+    python cms_stub_server.py --port 8765 --latency-ms 100 --render-ms 200
+    CMS_BASE_URL=http://127.0.0.1:8765 python hotel_cms_controller.py --option 1
+    CMS_API_BASE_URL=http://127.0.0.1:8765 CMS_API_ENDPOINTS_CONFIRMED=1 python hotel_cms_controller.py --backend http --option 1
+"""
+import argparse
+import json
+from http.cookies import SimpleCookie
+import os
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import config
+
+STUB_CHANNELS = ("Agoda", "Booking.com", "Expedia")
+STUB_EXTRA_ROOMS = ("Economy Double Room", "Family Room 3 person")  # 객실 선택 드롭다운에만 있는 방 (데이터 없음)
+MOCK_PAGE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mock_cms', 'index.html')
+
+
+class StubCMSState:
+    """방 타입×날짜별 인벤토리/요금 메모리 저장소 (날짜별로 항상 같은 예약 수를 생성)"""
+
+    def __init__(self, room_types=None, max_counts=None):
+        self.room_names = list((room_types or config.ROOM_TYPES).values())
+        self.max_counts = {
+            name: (max_counts or config.ROOM_MAX_COUNT).get(key, 10)
+            for key, name in (room_types or config.ROOM_TYPES).items()
+        }
+        self.sales_limits = {}  # (방 이름, 날짜) → 판매가능객실 (없으면 빈칸)
+        self.rates = {}  # (방 이름, 채널, 날짜) → 요금
+        self.lock = threading.Lock()
+        self.sessions = set()  # API 요청에서 본 JSESSIONID
+        self.expired_sessions = set()  # 만료 처리된 JSESSIONID (이 쿠키로 오는 API 요청은 401)
+        self.auth_failures = 0  # 401로 거절한 요청 수
+
+    def expire_sessions(self):
+        """지금까지 쓰인 세션을 모두 만료 처리 (CMS 세션 타임아웃 흉내)"""
+        with self.lock:
+            self.expired_sessions |= self.sessions
+            self.sessions = set()
+            return len(self.expired_sessions)
+
+    def check_session(self, session_id):
+        """API 요청의 세션 확인 (만료된 세션이면 False)"""
+        with self.lock:
+            if session_id in self.expired_sessions:
+                self.auth_failures += 1
+                return False
+            if session_id:
+                self.sessions.add(session_id)
+            return True
+
+    def booked(self, room_name, date_str):
+        seed = zlib.crc32(f"{room_name}|{date_str}".encode('utf-8'))
+        return seed % (self.max_counts[room_name] + 1)
+
+    def inventory_rows(self, start_date, days, rooms=None):
+        base = datetime.strptime(start_date, "%Y-%m-%d")
+        rows = []
+        with self.lock:
+            for name in rooms or self.room_names:
+                if name not in self.max_counts:
+                    continue
+                for i in range(days):
+                    date_str = (base + timedelta(days=i)).strftime("%Y-%m-%d")
+                    booked = self.booked(name, date_str)
+                    rows.append({
+                        'roomName': name,
+                        'date': date_str,
+                        'remaining': self.max_counts[name] - booked,
+                        'booked': booked,
+                        'salesLimit': self.sales_limits.get((name, date_str)),
+                    })
+        return rows
+
+    def save_inventory(self, items):
+        results = []
+        with self.lock:
+            for item in items:
+                key = (item.get('roomName'), item.get('date'))
+                ok = key[0] in self.max_counts
+                if ok:
+                    if item.get('salesLimit') in (None, ""):
+                        self.sales_limits.pop(key, None)
+                    else:
+                        self.sales_limits[key] = int(item['salesLimit'])
+                results.append({'roomName': key[0], 'date': key[1], 'ok': ok,
+                                'salesLimit': self.sales_limits.get(key)})
+        return results
+
+    def rate_rows(self, start_date, days):
+        base = datetime.strptime(start_date, "%Y-%m-%d")
+        rows = []
+        with self.lock:
+            for name in self.room_names:
+                for i in range(days):
+                    date_str = (base + timedelta(days=i)).strftime("%Y-%m-%d")
+                    closed = self.booked(name, date_str) >= self.max_counts[name]
+                    for channel in STUB_CHANNELS:
+                        rows.append({'roomName': name, 'channel': channel, 'date': date_str,
+                                     'price': self.rates.get((name, channel, date_str)), 'closed': closed})
+        return rows
+
+    def save_rates(self, items):
+        results = []
+        with self.lock:
+            for item in items:
+                key = (item.get('roomName'), item.get('channel'), item.get('date'))
+                self.rates[key] = item.get('price')
+                results.append({'roomName': key[0], 'channel': key[1], 'date': key[2], 'ok': True})
+        return results
+
+
+def mock_page_html(state, render_ms=0):
+    """모의 화면 HTML (방 목록, 엔드포인트, 렌더링 지연을 페이지 설정으로 주입)"""
+    mock_config = {
+        'renderMs': render_ms,
+        'days': 15,
+        'salesLabel': "판매가능객실",
+        'rooms': state.room_names,
+        'allRooms': state.room_names + [name for name in STUB_EXTRA_ROOMS if name not in state.room_names],
+        'endpoints': config.CMS_API_ENDPOINTS,
+    }
+    with open(MOCK_PAGE_FILE, encoding='utf-8') as f:
+        return f.read().replace("__MOCK_CONFIG__", json.dumps(mock_config, ensure_ascii=False))
+
+
+def make_handler(state, latency_ms=0, render_ms=0):
+    """
+    엔드포인트 경로(config.CMS_API_ENDPOINTS)에 맞춰 응답하는 요청 핸들러 생성
+
+    Args:
+        latency_ms: API 응답마다 추가할 지연 (XHR 지연)
+        render_ms: 모의 화면에서 응답 후 그리드를 다시 그리기까지의 지연
+    """
+    routes = {path: name for name, path in config.CMS_API_ENDPOINTS.items()}
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive (클라이언트 연결 풀 재사용)
+
+        def _send_json(self, status, body):
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path.split('?')[0] not in ("/", "/index.html"):
+                self._send_json(404, {'error': f'not found {self.path}'})
+                return
+            data = mock_page_html(state, render_ms).encode('utf-8')
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            path = self.path.split('?')[0]
+            if path == "/stub/expire-sessions":
+                self._send_json(200, {'expired': state.expire_sessions()})
+                return
+            name = routes.get(path)
+            length = int(self.headers.get('Content-Length') or 0)
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                self._send_json(400, {'error': 'invalid json'})
+                return
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+
+            session = SimpleCookie(self.headers.get('Cookie', '')).get('JSESSIONID')
+            if name and not state.check_session(session.value if session else None):
+                self._send_json(401, {'error': 'session expired'})
+                return
+            if name == 'inventory_search':
+                body = {'rows': state.inventory_rows(payload['startDate'], int(payload.get('days', 15)),
+                                                     payload.get('rooms'))}
+            elif name == 'inventory_save':
+                body = {'results': state.save_inventory(payload.get('items', []))}
+            elif name == 'rate_search':
+                body = {'rows': state.rate_rows(payload['startDate'], int(payload.get('days', 15)))}
+            elif name == 'rate_save':
+                body = {'results': state.save_rates(payload.get('items', []))}
+            else:
+                self._send_json(404, {'error': f'unknown endpoint {self.path}'})
+                return
+            self._send_json(200, body)
+
+        def log_message(self, format, *args):
+            pass  # 요청마다 로그를 찍지 않음
+
+    return StubHandler
+
+
+def start_stub_server(port=0, latency_ms=0, render_ms=0, state=None):
+    """
+    백그라운드 스레드에서 스텁 서버 시작
+
+    Returns:
+        (server, base_url) - 종료 시 server.shutdown()
+    """
+    state = state or StubCMSState()
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state, latency_ms, render_ms))
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CMS 스텁 서버 (API + 모의 화면)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=int, default=0, help="API 응답마다 추가할 지연(ms)")
+    parser.add_argument("--render-ms", type=int, default=0, help="모의 화면 그리드 렌더링 지연(ms)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port),
+                                 make_handler(StubCMSState(), args.latency_ms, args.render_ms))
+    print(f"✓ CMS 스텁 서버 실행 중: http://127.0.0.1:{args.port} (종료: Ctrl+C)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✓ 스텁 서버 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+CMS 화면 대기 엔진
+고정 time.sleep 대신 조건(요소 표시, 스피너 사라짐, DOM 변경 없음, XHR 0건)을 폴링하고
+작업별 실제 대기 시간을 기록
+"""
+import time
+import config
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+
+# XHR/fetch 진행 건수와 마지막 DOM 변경 시각을 기록하는 모니터 (문서당 1회 설치)
+MONITOR_JS = r"""
+(function () {
+    if (window.__hcmsMonitor) { return; }
+    var now = function () { return performance.now(); };
+    var m = window.__hcmsMonitor = {pending: 0, lastNet: now(), lastDom: now(), installed: now()};
+    function done() { m.pending = Math.max(0, m.pending - 1); m.lastNet = now(); }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        m.pending++; m.lastNet = now();
+        this.addEventListener('loadend', done);
+        try { return send.apply(this, arguments); } catch (e) { done(); throw e; }
+    };
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function () {
+            m.pending++; m.lastNet = now();
+            return origFetch.apply(this, arguments).then(
+                function (r) { done(); return r; },
+                function (e) { done(); throw e; });
+        };
+    }
+    new MutationObserver(function () { m.lastDom = now(); })
+        .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+})();
+"""
+
+# 현재 화면 상태를 한 번의 호출로 조회 (모니터가 없으면 설치)
+PAGE_STATE_JS = MONITOR_JS + r"""
+var m = window.__hcmsMonitor, t = performance.now(), sels = arguments[0] || [], spinner = false;
+for (var i = 0; i < sels.length && !spinner; i++) {
+    var els = document.querySelectorAll(sels[i]);
+    for (var j = 0; j < els.length; j++) {
+        if (els[j].offsetParent !== null || els[j].getClientRects().length) { spinner = true; break; }
+    }
+}
+return {
+    ready: document.readyState,
+    pending: m.pending,
+    since_net: t - m.lastNet,
+    since_dom: t - m.lastDom,
+    spinner: spinner
+};
+"""
+
+
+class CMSWaiter:
+    """조건 기반 대기 (작업별 타임아웃, 실제 대기 시간 기록)"""
+
+    def __init__(self, driver, timeouts=None, poll_interval=None, quiet_ms=None, verbose=None, page_load_strategy=None):
+        self.driver = driver
+        self.timeouts = dict(config.WAIT_TIMEOUTS)
+        self.timeouts.update(timeouts or {})
+        self.poll_interval = poll_interval or config.WAIT_POLL_INTERVAL
+        self.quiet_ms = quiet_ms or config.WAIT_QUIET_MS
+        self.verbose = config.WAIT_VERBOSE if verbose is None else verbose
+        self.last_waited = 0.0
+        self.sleep = time.sleep  # 폴링 간 대기 (프로파일러가 이 인스턴스의 sleep만 감쌈)
+        self.stats = {}  # action -> {'count', 'total', 'max', 'timeouts'}
+        if page_load_strategy is None:
+            try:
+                page_load_strategy = driver.capabilities.get('pageLoadStrategy')
+            except Exception:
+                page_load_strategy = None
+        # eager 로드 전략은 하위 리소스를 기다리지 않으므로 'interactive'도 로드 완료로 보고 XHR/DOM 조건으로 판단
+        self.ready_states = ('interactive', 'complete') if page_load_strategy == 'eager' else ('complete',)
+
+    def install(self):
+        """새 문서마다 네트워크/DOM 모니터가 먼저 실행되도록 등록 (CDP 미지원 시 현재 문서에만 설치)"""
+        try:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': MONITOR_JS})
+        except Exception:
+            pass
+        try:
+            self.driver.execute_script(MONITOR_JS)
+        except Exception:
+            pass
+
+    def timeout_for(self, action):
+        return self.timeouts.get(action, self.timeouts['default'])
+
+    def until(self, condition, action='default', timeout=None, description=None):
+        """
+        condition(driver)이 참이 될 때까지 폴링
+
+        Returns:
+            조건의 반환값 (타임아웃이면 None, 예외는 발생시키지 않음)
+        """
+        timeout = self.timeout_for(action) if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        value = None
+        while True:
+            try:
+                value = condition(self.driver)
+            except Exception:
+                value = None
+            if value or time.monotonic() >= deadline:
+                break
+            self.sleep(self.poll_interval)
+
+        waited = time.monotonic() - started
+        self._record(action, waited, timed_out=not value)
+        if self.verbose or not value:
+            status = "완료" if value else "⚠ 타임아웃"
+            print(f"    ⏱ [{action}] {description or '조건'} 대기 {status}: {waited:.2f}s")
+        return value
+
+    def _record(self, action, waited, timed_out):
+        self.last_waited = waited
+        stat = self.stats.setdefault(action, {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+        stat['count'] += 1
+        stat['total'] += waited
+        stat['max'] = max(stat['max'], waited)
+        if timed_out:
+            stat['timeouts'] += 1
+
+    def page_state(self):
+        return self.driver.execute_script(PAGE_STATE_JS, config.WAIT_SPINNER_SELECTORS)
+
+    def _is_settled(self, quiet_ms, network=True, dom=True):
+        state = self.page_state()
+        if state['ready'] not in self.ready_states or state['spinner']:
+            return False
+        if network and (state['pending'] > 0 or state['since_net'] < quiet_ms):
+            return False
+        if dom and state['since_dom'] < quiet_ms:
+            return False
+        return True
+
+    def settled(self, action='default', quiet_ms=None, timeout=None):
+        """문서 로드 완료(eager 전략은 interactive 포함) + XHR 0건 + 스피너 없음 + DOM 변경이 quiet_ms 동안 없음"""
+        quiet_ms = quiet_ms or self.quiet_ms
+        return self.until(lambda d: self._is_settled(quiet_ms), action, timeout, "화면 안정")
+
+    def dom_quiet(self, action='default', quiet_ms=None, timeout=None):
+        """DOM 변경이 quiet_ms 동안 없을 때까지 대기 (드롭다운/패널 애니메이션 등)"""
+        quiet_ms = quiet_ms or self.quiet_ms
+        return self.until(lambda d: self._is_settled(quiet_ms, network=False), action, timeout, "DOM 안정")
+
+    def network_idle(self, action='default', quiet_ms=None, timeout=None):
+        """진행 중인 XHR/fetch가 0건이 될 때까지 대기"""
+        quiet_ms = quiet_ms or self.quiet_ms
+        return self.until(lambda d: self._is_settled(quiet_ms, dom=False), action, timeout, "네트워크 유휴")
+
+    def spinner_gone(self, action='default', timeout=None):
+        return self.until(lambda d: not self.page_state()['spinner'], action, timeout, "스피너 사라짐")
+
+    def element(self, locator, action='default', timeout=None):
+        """요소가 DOM에 나타날 때까지 대기"""
+        return self.until(EC.presence_of_element_located(locator), action, timeout, f"요소 {locator[1]}")
+
+    def visible(self, locator, action='default', timeout=None):
+        return self.until(EC.visibility_of_element_located(locator), action, timeout, f"표시 {locator[1]}")
+
+    def clickable(self, locator, action='default', timeout=None):
+        return self.until(EC.element_to_be_clickable(locator), action, timeout, f"클릭 가능 {locator[1]}")
+
+    def grid_rendered(self, action='search', timeout=None):
+        """인벤토리 그리드 행이 렌더링되고 화면이 안정될 때까지 대기"""
+        rows = self.until(
+            lambda d: d.find_elements(By.CSS_SELECTOR, "span.expandable"), action, timeout, "그리드 행"
+        )
+        return bool(rows) and bool(self.settled(action, timeout=timeout))
+
+    def report(self):
+        """작업별 대기 시간 요약 출력"""
+        if not self.stats:
+            return
+        print("\n⏱ 대기 시간 요약")
+        total = 0.0
+        for action, stat in sorted(self.stats.items(), key=lambda item: -item[1]['total']):
+            total += stat['total']
+            print(f"  {action:<10} {stat['count']:>4}회  합계 {stat['total']:7.2f}s  "
+                  f"최대 {stat['max']:5.2f}s  타임아웃 {stat['timeouts']}회")
+        print(f"  {'전체':<10} {total:7.2f}s")
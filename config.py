@@ -7,11 +7,19 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # CMS 접속 정보
-CMS_URL = os.getenv('CMS_URL', 'https://wingscms.com/#/app/zz/zz03_0100')
+CMS_BASE_URL = os.getenv('CMS_BASE_URL', 'https://wingscms.com')  # 스텁 서버로 시험할 때는 http://127.0.0.1:8765
+CMS_URL = os.getenv('CMS_URL', CMS_BASE_URL + '/#/app/zz/zz03_0100')
 CMS_COMPANY_ID = os.getenv('CMS_COMPANY_ID', 'GRIDINN')
 CMS_USERNAME = os.getenv('CMS_USERNAME', 'gridpsp')
 CMS_PASSWORD = os.getenv('CMS_PASSWORD', 'zbfl=726331')
 
+# 기준가격 엑셀 파일 (첫 열: 날짜, 나머지 열: 방 타입별 기준가)
+BASE_PRICE_FILE = os.getenv('BASE_PRICE_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), '기준가격.xlsx'))
+
+# CMS 행 라벨 → 기준가격.xlsx 방 타입 별칭 (라벨에 엑셀 방 타입명이 그대로 들어있지 않을 때만 추가)
+# 예: {'스탠다드 트윈': 'Twin Room'}
+ROOM_LABEL_ALIASES = {}
+
 # 방 타입 정의
 
 ROOM_TYPES = {
@@ -32,3 +40,143 @@ ROOM_MAX_COUNT = {
 # 브라우저 설정
 HEADLESS = False  # True로 설정하면 브라우저 창이 보이지 않음
 IMPLICIT_WAIT = 10  # 요소를 찾을 때 대기 시간(초)
+
+# 대기 설정 - 고정 sleep 대신 조건(네트워크/DOM 안정, 스피너, 요소 표시)을 기다림
+# 작업별 최대 대기 시간(초)
+WAIT_TIMEOUTS = {
+    'default': 10,
+    'page_load': 20,   # driver.get 이후 화면 로드
+    'search': 20,      # 조회/검색 버튼 이후 그리드 갱신
+    'dropdown': 3,     # 드롭다운/옵션 토글
+    'calendar': 3,     # 달력 열기/월 이동
+    'expand': 5,       # 방 타입 하위 메뉴 펼치기
+    'input': 2,        # 입력 필드 값 반영
+    'rmo': 3,          # RMO 입력란 활성화
+    'save': 10,        # 저장/확인 팝업
+    'login': 15,       # 로그인 후 화면 전환
+}
+WAIT_POLL_INTERVAL = 0.05  # 조건 확인 간격(초)
+WAIT_QUIET_MS = 300  # 네트워크/DOM 변경이 이 시간(ms) 동안 없으면 안정된 것으로 간주
+WAIT_SPINNER_SELECTORS = ['.loader', '.spinner-border', '.block-ui-overlay', '.loading']
+WAIT_VERBOSE = False  # True면 대기할 때마다 실제 대기 시간 출력
+
+# 날짜 설정 방식
+# 'direct': startDatePicker 입력 필드에 값을 직접 설정 후 확인 (날짜 거리와 무관하게 일정한 시간)
+# 'calendar': 달력을 열어 월 단위로 이동 후 일(day) 클릭
+DATE_SET_MODE = 'direct'
+
+# 요금 자동입력 윈도우 크기 (한 번의 페이지 로드로 입력할 최대 일수, 화면 컬럼 수 이하)
+RATE_WINDOW_DAYS = 15
+
+# 요금 입력 방식
+# 'script': 요금 매트릭스를 계산해 한 번의 스크립트 실행으로 RMO 활성화 + 전체 입력 (실패 시 'element'로 재시도)
+# 'element': RMO 버튼/입력란을 하나씩 클릭·입력
+RATE_FILL_MODE = 'script'
+
+# 병렬 실행 (객실수 자동조정) - 워커마다 헤드리스 Chrome을 띄워 윈도우를 나눠 처리
+PARALLEL_WORKERS = 1  # 1이면 단일 브라우저로 순차 처리
+MAX_PARALLEL_WORKERS = 4  # CMS 부하를 고려한 동시 워커 수 상한
+PARALLEL_START_STAGGER = 3  # 워커별 로그인 시작 간격(초)
+PARALLEL_DRIVER_PROFILE = 'fast-batch'  # 병렬 워커가 사용하는 드라이버 프로필 (DRIVER_PROFILES 참고)
+
+# 세션 재사용 - 로그인 후 쿠키/웹 스토리지를 저장해 다음 실행에서 로그인 과정 생략
+SESSION_REUSE = True
+SESSION_FILE = os.getenv('CMS_SESSION_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cms_session.json'))
+CHROME_USER_DATA_DIR = os.getenv('CHROME_USER_DATA_DIR')  # 지정하면 전용 Chrome 프로필로 로그인 상태 유지
+
+# 백엔드 선택: 'browser'(화면 조작) 또는 'http'(CMS JSON API 직접 호출, 브라우저는 로그인에만 사용)
+CMS_BACKEND = os.getenv('CMS_BACKEND', 'browser')
+CMS_API_BASE_URL = os.getenv('CMS_API_BASE_URL', CMS_BASE_URL)
+# CMS 화면이 사용하는 JSON API 경로 (실제 경로는 개발자 도구 Network 탭에서 확인 후 수정)
+CMS_API_ENDPOINTS = {
+    'inventory_search': '/api/cm/cm03_0300/search',
+    'inventory_save': '/api/cm/cm03_0300/save',
+    'rate_search': '/api/cm/cm03_0200/search',
+    'rate_save': '/api/cm/cm03_0200/save',
+}
+# 위 경로를 실제 CMS에서 확인했으면 True (확인 전에는 --backend http 실행을 거부, 스텁 서버로 시험할 때는 환경변수로 지정)
+CMS_API_ENDPOINTS_CONFIRMED = os.getenv('CMS_API_ENDPOINTS_CONFIRMED', '').lower() in ('1', 'true', 'yes')
+CMS_API_TOKEN_STORAGE_KEY = None  # 인증 토큰이 웹 스토리지에 있으면 해당 키 (Authorization: Bearer 헤더로 전송)
+HTTP_POOL_SIZE = 10  # 연결 풀 크기
+HTTP_TIMEOUT = 15  # 요청 타임아웃(초)
+
+# 요금 저장 여부 (False: 입력만 하고 저장하지 않는 테스트 모드)
+RATE_SAVE_ENABLED = False
+
+# 판매가능객실 규칙표 (방 타입별로 위에서부터 처음 맞는 규칙 적용, 조건은 경계 포함)
+# action: 'open'(빈칸 = 모두 오픈), 'booked_plus'(예약+value), 'fixed'(value), 'alert'(수동 확인 알림)
+# 새 방 타입은 ROOM_TYPES/ROOM_MAX_COUNT에 추가하면 '*' 기본 규칙이 적용되며, 필요하면 전용 규칙을 위에 추가
+AVAILABILITY_RULES = [
+    {'name': '싱글룸 잔여 4 이하, 모두 오픈', 'room': 'SINGLE', 'remaining_max': 4, 'action': 'open'},
+    {'name': '싱글룸 예약+4', 'room': 'SINGLE', 'action': 'booked_plus', 'value': 4},
+    {'name': '트윈룸 잔여 4 이하, 모두 오픈', 'room': 'TWIN', 'remaining_max': 4, 'action': 'open'},
+    {'name': '트윈룸 예약 6이상, 예약+2', 'room': 'TWIN', 'booked_min': 6, 'action': 'booked_plus', 'value': 2},
+    {'name': '트윈룸 예약 6미만, 예약+4', 'room': 'TWIN', 'action': 'booked_plus', 'value': 4},
+    {'name': '더블룸 예약 3 이상, 모두 오픈', 'room': 'DOUBLE', 'booked_min': 3, 'action': 'open'},
+    {'name': '더블룸 예약+2', 'room': 'DOUBLE', 'action': 'booked_plus', 'value': 2},
+    {'name': '트리플룸 예약 5 이상, 수동 확인', 'room': 'TRIPLE', 'booked_min': 5, 'action': 'alert',
+     'message': '트리플룸 예약 {booked}건 - 수동 확인 필요'},
+    {'name': '트리플룸 예약=4, +1', 'room': 'TRIPLE', 'booked_min': 4, 'booked_max': 4, 'action': 'booked_plus', 'value': 1},
+    {'name': '트리플룸 예약<4, +2', 'room': 'TRIPLE', 'action': 'booked_plus', 'value': 2},
+    {'name': '기본값', 'room': '*', 'action': 'fixed', 'value': 2},
+]
+AVAILABILITY_RULES_FILE = os.getenv('AVAILABILITY_RULES_FILE')  # 지정하면 같은 형식의 JSON 규칙표 사용
+
+# 판매가능객실 변경 저널 (윈도우 저장 직후 한 줄씩 추가 기록, 엑셀 변환: python change_journal.py)
+CHANGE_JOURNAL_FILE = os.getenv('CHANGE_JOURNAL_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'change_journal.jsonl'))
+
+# WebDriver 명령 프로파일러 (켜면 명령/대기/sleep을 단계·윈도우별로 집계해 종료 시 출력, 끄면 오버헤드 없음)
+PROFILE_ENABLED = os.getenv('CMS_PROFILE', '').lower() in ('1', 'true', 'yes')
+PROFILE_TOP_N = 15  # 보고서에 표시할 상위 항목 수
+PROFILE_EXPORT_FILE = os.getenv('CMS_PROFILE_EXPORT')  # 지정하면 집계를 CSV(.csv) 또는 JSON으로 저장
+
+# 객실수 자동조정 체크포인트 (완료 윈도우 기록, --resume으로 이어서 실행)
+CHECKPOINT_FILE = os.getenv('CMS_CHECKPOINT_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cms_checkpoint.json'))
+
+# Chrome 드라이버 프로필 (--driver-profile 또는 CMS_DRIVER_PROFILE로 선택)
+# headless None이면 HEADLESS 설정을 따름, window_size None이면 최대화
+DRIVER_PROFILE = os.getenv('CMS_DRIVER_PROFILE', 'interactive')
+DRIVER_PROFILES = {
+    'interactive': {
+        'headless': None,
+        'page_load_strategy': 'normal',
+        'window_size': None,
+        'arguments': [],
+        'blocked_urls': [],
+    },
+    'fast-batch': {
+        'headless': True,
+        'page_load_strategy': 'eager',  # DOMContentLoaded까지만 대기 (이미지 등 하위 리소스는 기다리지 않음)
+        'window_size': (2560, 1600),
+        'arguments': ['--disable-extensions', '--disable-gpu', '--blink-settings=imagesEnabled=false'],
+        'blocked_urls': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico', '*.woff', '*.woff2', '*.ttf',
+                         '*google-analytics.com*', '*googletagmanager.com*', '*facebook.net*', '*hotjar.com*'],
+    },
+}
+CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH')  # 지정하면 해당 chromedriver를 바로 사용 (Selenium Manager 탐색 생략)
+
+# 백그라운드 파일 I/O 워커 (엑셀 하이라이트/기준가 읽기/변경 저널/체크포인트/변경 이력 엑셀)
+# False면 브라우저 스레드에서 바로 실행
+IO_WORKER_ENABLED = os.getenv('CMS_IO_WORKER', '1') != '0'
+IO_QUEUE_SIZE = 32  # 대기 작업이 이 수를 넘으면 브라우저 스레드가 자리가 날 때까지 대기
+
+# 여러 숙소 동시 처리 (--properties all 또는 --properties 이름1,이름2)
+# 숙소마다 name(필수)과 필요한 항목만 지정, 나머지는 위 기본 설정 사용
+# 지정 가능 항목: company_id, username, password, room_types, room_max_count, base_price_file,
+#                room_label_aliases, availability_rules, availability_rules_file, chrome_user_data_dir
+# 예: {'name': 'gridinn', 'company_id': 'GRIDINN', 'username': 'gridpsp', 'password': os.getenv('GRIDINN_PASSWORD')}
+PROPERTIES = []
+PROPERTIES_FILE = os.getenv('PROPERTIES_FILE')  # 지정하면 같은 형식의 JSON 숙소 목록 사용
+MAX_PARALLEL_PROPERTIES = 3  # 동시에 처리할 숙소 수 상한 (숙소마다 헤드리스 Chrome + 로그인)
+
+# 상주 모드 (--daemon): 브라우저/로그인/인벤토리 화면을 유지한 채 주기적으로 객실수 자동조정
+DAEMON_INTERVAL_MINUTES = 5  # 동기화 시작 간격(분, --interval로 변경)
+
+# 인벤토리 스냅샷 저장소 (SQLite): 윈도우별 그리드 해시와 방 타입×날짜별 마지막 잔여/예약/판매가능객실 값
+# 그리드가 지난 실행과 같으면(규칙표 포함) 해당 윈도우의 규칙 평가·입력·저장을 생략
+SNAPSHOT_STORE_ENABLED = True
+SNAPSHOT_STORE_FILE = os.getenv('CMS_SNAPSHOT_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cms_snapshots.sqlite3'))
+SNAPSHOT_SKIP_UNCHANGED = True  # False(또는 --full)면 비교 없이 모두 평가 (기록은 계속)
+
+# 저장 후 확인: 저장한 윈도우를 한 번 다시 읽어 계획과 비교하고, 반영되지 않은 셀만 한 번 재입력·저장
+VERIFY_AFTER_SAVE = True
@@ -8,106 +8,364 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+import argparse
+import json
 import time
 import random
+import re
 import config
+from availability_rules import AvailabilityRules
+from change_journal import ChangeJournal, new_run_id
+from cms_profiler import CMSProfiler, profiled_phase
+from cms_wait import CMSWaiter
+from io_worker import IOWorker
+from price_sheet import BasePriceTable, ClosedRoomHighlighter
+from run_checkpoint import RunCheckpoint
+from snapshot_store import SnapshotStore, applied_snapshot, rules_signature, stale_cells, window_hash
 from datetime import datetime, timedelta
 import pandas as pd
 import os
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill
 
 
+# 인벤토리 그리드(cm03_0300) 공통 JS 헬퍼
+# - 방 이름으로 expandable 행을 찾고, 다음 expandable 전까지의 형제 행에서
+#   잔여/예약(REMANING) 행과 판매가능객실 입력 행을 찾는다.
+GRID_JS_HELPERS = r"""
+function hcmsFindRoomBlock(roomName, salesLabel) {
+    var spans = document.querySelectorAll('span.expandable');
+    var span = null;
+    for (var i = 0; i < spans.length; i++) {
+        if ((spans[i].textContent || '').indexOf(roomName) !== -1) { span = spans[i]; break; }
+    }
+    if (!span) { return null; }
+    var td = span.closest('td');
+    var icon = td ? td.querySelector('i.closes') : null;
+    var block = {
+        span: span,
+        expanded: !!(icon && icon.offsetParent !== null),
+        remainRow: null,
+        salesRow: null
+    };
+    var tr = span.closest('tr');
+    var lastRemain = null;
+    for (var n = 0; n < 20 && tr; n++) {
+        tr = tr.nextElementSibling;
+        if (!tr || tr.querySelector('span.expandable')) { break; }
+        if (tr.getAttribute('data-field') === 'REMANING') { lastRemain = tr; }
+        if ((tr.textContent || '').indexOf(salesLabel) !== -1 &&
+                tr.querySelector("input[type='text']")) {
+            block.salesRow = tr;
+            block.remainRow = lastRemain;
+            break;
+        }
+    }
+    return block;
+}
+function hcmsSalesInputs(block) {
+    return block && block.salesRow
+        ? Array.prototype.slice.call(block.salesRow.querySelectorAll("input[type='text']"))
+        : [];
+}
+"""
+
+# 인벤토리 그리드 전체를 한 번의 execute_script로 읽는 스크립트
+# arguments[0]: 방 이름 목록, arguments[1]: 판매가능객실 행 라벨
+INVENTORY_GRID_SNAPSHOT_JS = GRID_JS_HELPERS + r"""
+var roomNames = arguments[0], salesLabel = arguments[1];
+function toInt(span) {
+    if (!span) { return null; }
+    var v = parseInt((span.textContent || '').trim(), 10);
+    return isNaN(v) ? null : v;
+}
+var picker = document.getElementById('startDatePicker');
+var result = {start_date: picker ? picker.value : null, rooms: {}};
+roomNames.forEach(function (name) {
+    var block = hcmsFindRoomBlock(name, salesLabel);
+    if (!block) { result.rooms[name] = {found: false, expanded: false, cells: []}; return; }
+    var remainTds = block.remainRow
+        ? Array.prototype.slice.call(block.remainRow.querySelectorAll('td')).slice(2)
+        : [];
+    var cells = hcmsSalesInputs(block).map(function (input, col) {
+        var spans = remainTds[col] ? remainTds[col].querySelectorAll('span') : [];
+        return {
+            col: col,
+            remaining: toInt(spans[0]),
+            booked: toInt(spans[1]),
+            value: input.value,
+            disabled: input.disabled || input.readOnly
+        };
+    });
+    result.rooms[name] = {found: true, expanded: block.expanded, cells: cells};
+});
+return result;
+"""
+
+# 접혀 있는 방 타입의 expandable을 한 번에 펼치는 스크립트
+EXPAND_ROOMS_JS = GRID_JS_HELPERS + r"""
+var roomNames = arguments[0], salesLabel = arguments[1], clicked = [];
+roomNames.forEach(function (name) {
+    var block = hcmsFindRoomBlock(name, salesLabel);
+    if (block && !block.expanded) { block.span.click(); clicked.push(name); }
+});
+return clicked;
+"""
+
+# 판매가능객실 입력 필드 하나를 (방 이름, 컬럼)으로 찾는 스크립트
+FIND_SALES_INPUT_JS = GRID_JS_HELPERS + r"""
+var inputs = hcmsSalesInputs(hcmsFindRoomBlock(arguments[0], arguments[2]));
+return inputs[arguments[1]] || null;
+"""
+
+# 판매가능객실 변경 목록을 한 번의 execute_script로 입력하는 스크립트
+# arguments[0]: [{room, col, value}] (value ''는 빈칸), arguments[1]: 판매가능객실 행 라벨
+# React 제어 컴포넌트가 값을 인식하도록 네이티브 value setter + input/change 이벤트 사용
+APPLY_AVAILABILITY_JS = GRID_JS_HELPERS + r"""
+var changes = arguments[0], salesLabel = arguments[1];
+var setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+var inputsByRoom = {}, result = {};
+changes.forEach(function (change) {
+    var key = change.room + '|' + change.col;
+    if (!(change.room in inputsByRoom)) {
+        inputsByRoom[change.room] = hcmsSalesInputs(hcmsFindRoomBlock(change.room, salesLabel));
+    }
+    var input = inputsByRoom[change.room][change.col];
+    if (!input) { result[key] = {ok: false, actual: null, error: 'input not found'}; return; }
+    try {
+        input.removeAttribute('readonly');
+        input.removeAttribute('disabled');
+        input.focus();
+        setter.call(input, change.value);
+        input.dispatchEvent(new Event('input', {bubbles: true}));
+        input.dispatchEvent(new Event('change', {bubbles: true}));
+        input.blur();
+        result[key] = {ok: input.value === change.value, actual: input.value};
+    } catch (e) {
+        result[key] = {ok: false, actual: input.value, error: String(e)};
+    }
+});
+return result;
+"""
+
+# react-datepicker 입력 필드에 날짜를 직접 설정하는 스크립트
+# arguments[0]: startDatePicker input, arguments[1]: 'YYYY-MM-DD'
+SET_DATE_INPUT_JS = r"""
+var input = arguments[0], value = arguments[1];
+var setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+input.focus();
+setter.call(input, value);
+input.dispatchEvent(new Event('input', {bubbles: true}));
+input.dispatchEvent(new Event('change', {bubbles: true}));
+input.dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true}));
+return input.value;
+"""
+
+# 열려 있는 달력 팝업 닫기 (Escape + blur)
+CLOSE_DATEPICKER_JS = r"""
+var input = document.getElementById('startDatePicker');
+if (input) {
+    input.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', code: 'Escape', keyCode: 27, which: 27, bubbles: true}));
+    input.blur();
+}
+"""
+
+# 요금관리 그리드(cm03_0200) 공통 JS 헬퍼
+# - RMO 버튼이 있는 행(td[id])을 방 블록의 기준으로 삼고, 그 뒤 형제 행에서
+#   판매 상태(CLOSE_YN)/RMO 입력(RM_RA) 행을, class child-{id}로 OTA별 요금 행을 찾는다.
+RATE_GRID_JS_HELPERS = r"""
+function hcmsRmoSpan(tr) {
+    var spans = tr.querySelectorAll('span');
+    for (var i = spans.length - 1; i >= 0; i--) {
+        if ((spans[i].textContent || '').indexOf('RMO') !== -1) { return spans[i]; }
+    }
+    return null;
+}
+function hcmsNextField(tr, field) {
+    for (var row = tr.nextElementSibling; row; row = row.nextElementSibling) {
+        if (row.getAttribute('data-field') === field) { return row; }
+    }
+    return null;
+}
+function hcmsChildRows(parentId) {
+    return Array.prototype.filter.call(document.querySelectorAll("tr[data-field='RM_RA']"), function (row) {
+        return row.classList.contains('child-' + parentId);
+    });
+}
+function hcmsTextInputs(row) {
+    return row ? Array.prototype.slice.call(row.querySelectorAll("input[type='text']")) : [];
+}
+"""
+
+# 요금관리 그리드의 방 블록 구조를 한 번에 읽는 스크립트
+# 반환: [{parent_id, label, column_count, status_texts, rmo_value, children: [{label, inputs}]}]
+RATE_GRID_SNAPSHOT_JS = RATE_GRID_JS_HELPERS + r"""
+var blocks = [], seen = {};
+Array.prototype.forEach.call(document.querySelectorAll('span'), function (span) {
+    if ((span.textContent || '').indexOf('RMO') === -1) { return; }
+    var tr = span.closest('tr'), td = tr ? tr.querySelector('td[id]') : null;
+    if (!td || seen[td.id]) { return; }
+    seen[td.id] = true;
+    var statusRow = hcmsNextField(tr, 'CLOSE_YN'), rmoInputs = hcmsTextInputs(hcmsNextField(tr, 'RM_RA'));
+    blocks.push({
+        parent_id: td.id,
+        label: (tr.innerText || '').trim(),
+        column_count: rmoInputs.length,
+        status_texts: statusRow ? Array.prototype.map.call(statusRow.querySelectorAll('td'), function (cell) {
+            return (cell.textContent || '').trim();
+        }) : null,
+        rmo_value: rmoInputs.length ? rmoInputs[0].value : null,
+        children: hcmsChildRows(td.id).map(function (row) {
+            return {label: (row.innerText || '').trim(), inputs: hcmsTextInputs(row).length};
+        })
+    });
+});
+return blocks;
+"""
+
+# 요금 매트릭스 전체를 한 번의 execute_async_script로 입력하는 스크립트
+# arguments[0]: [{parent_id, rows: [{child, label, values: {col: '12,000'}}]}], arguments[1]: RMO 활성화 대기(ms)
+# 모든 블록의 RMO를 한꺼번에 활성화하고 입력란이 열리면 네이티브 value setter + input/change 이벤트로 입력
+FILL_RATE_MATRIX_JS = RATE_GRID_JS_HELPERS + r"""
+var plan = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+function isEnabled(row) { return !!(row && row.querySelector("input[type='text']:not([disabled])")); }
+var blocks = plan.map(function (block) {
+    var td = document.getElementById(block.parent_id), tr = td ? td.closest('tr') : null;
+    var rmoRow = tr ? hcmsNextField(tr, 'RM_RA') : null, span = tr ? hcmsRmoSpan(tr) : null;
+    if (span && !isEnabled(rmoRow)) {
+        span.scrollIntoView({block: 'center'});
+        span.click();
+    }
+    return {plan: block, rmoRow: rmoRow};
+});
+function fill() {
+    var results = [];
+    blocks.forEach(function (block) {
+        var active = isEnabled(block.rmoRow), children = hcmsChildRows(block.plan.parent_id);
+        block.plan.rows.forEach(function (rowPlan) {
+            var result = {parent_id: block.plan.parent_id, child: rowPlan.child, label: rowPlan.label,
+                          filled: 0, skipped: 0, failed: 0, error: null, ok: false};
+            results.push(result);
+            if (!active) { result.error = 'RMO 입력란 비활성'; return; }
+            var row = children[rowPlan.child];
+            if (!row) { result.error = '요금 행 없음'; return; }
+            var inputs = hcmsTextInputs(row);
+            Object.keys(rowPlan.values).forEach(function (col) {
+                var input = inputs[col], value = rowPlan.values[col];
+                if (!input || window.getComputedStyle(input).display === 'none') { result.skipped++; return; }
+                try {
+                    input.removeAttribute('readonly');
+                    input.focus();
+                    setter.call(input, value);
+                    input.dispatchEvent(new Event('input', {bubbles: true}));
+                    input.dispatchEvent(new Event('change', {bubbles: true}));
+                    input.blur();
+                    if (input.value === value) { result.filled++; } else { result.failed++; }
+                } catch (e) {
+                    result.failed++;
+                    result.error = String(e);
+                }
+            });
+            result.ok = !result.error && result.failed === 0;
+        });
+    });
+    return results;
+}
+var started = Date.now();
+(function poll() {
+    try {
+        var pending = blocks.some(function (block) { return block.rmoRow && !isEnabled(block.rmoRow); });
+        if (pending && Date.now() - started < timeoutMs) { setTimeout(poll, 50); return; }
+        done({ok: true, rows: fill(), waited_ms: Date.now() - started});
+    } catch (e) {
+        done({ok: false, error: String(e)});
+    }
+})();
+"""
+
+# 세션 저장/복원용 localStorage/sessionStorage 읽기/쓰기
+READ_WEB_STORAGE_JS = r"""
+function dump(storage) {
+    var data = {};
+    for (var i = 0; i < storage.length; i++) { var k = storage.key(i); data[k] = storage.getItem(k); }
+    return data;
+}
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+WRITE_WEB_STORAGE_JS = r"""
+var data = arguments[0];
+Object.keys(data.local || {}).forEach(function (k) { window.localStorage.setItem(k, data.local[k]); });
+Object.keys(data.session || {}).forEach(function (k) { window.sessionStorage.setItem(k, data.session[k]); });
+"""
+SESSION_COOKIE_KEYS = ('name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry', 'sameSite')
+
+SALES_ROW_LABEL = "판매가능객실"
+
+INVENTORY_PAGE = "#/app/cm/cm03_0300"  # 인벤토리 관리_객실별
+RATE_PAGE = "#/app/cm/cm03_0200"  # 요금관리
+
+INVENTORY_WINDOW_DAYS = 15  # 인벤토리 화면 한 번에 표시되는 일수
+
+
+def cms_page_url(page):
+    """CMS 화면 주소 (config.CMS_BASE_URL 기준)"""
+    return f"{config.CMS_BASE_URL.rstrip('/')}/{page}"
+
+
+def calc_ota_rate(label, base_price):
+    """OTA 매핑: 기준가를 기반으로 계산 (아고다=기준가, 나머지=기준가+5,000~10,000원 랜덤)"""
+    if base_price is None:
+        return None
+    label = label.lower()
+    if 'agoda' in label or '아고다' in label:
+        return base_price
+    # 그 외 모든 OTA: 기준가 + 5,000~10,000원 범위의 랜덤 값 (천원 단위)
+    random_addon = random.randint(5, 10) * 1000  # 5000, 6000, 7000, ..., 10000
+    return base_price + random_addon
 
 
 class HotelCMSController:
     """호텔 CMS를 제어하는 클래스"""
 
-    def highlight_closed_rooms_in_excel(self, target_date, closed_rooms):
-        """마감된 방 타입을 엑셀 파일에서 노란색으로 하이라이트"""
-        try:
-            excel_path = os.path.join(os.path.dirname(__file__), "기준가격.xlsx")
-            if not os.path.exists(excel_path):
-                print(f"  ⚠ 하이라이트 대상 파일 없음: {excel_path}")
-                return
-            
-            # openpyxl로 엑셀 파일 열기
-            wb = load_workbook(excel_path)
-            ws = wb.active
-            
-            # 첫 번째 열에서 대상 날짜 행 찾기
-            target_row = None
-            for row_idx, cell in enumerate(ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=1), 1):
-                try:
-                    cell_date = pd.Timestamp(cell[0].value).strftime("%Y-%m-%d")
-                    if cell_date == target_date:
-                        target_row = row_idx
-                        break
-                except Exception:
-                    continue
-            
-            if target_row is None:
-                print(f"  ⚠ 엑셀에서 {target_date} 행을 찾지 못했습니다.")
-                return
-            
-            # 노란색 하이라이트 설정
-            yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-            
-            # 마감된 방에 해당하는 셀에 하이라이트 적용
-            for col_idx, cell in enumerate(ws.iter_rows(min_row=target_row, max_row=target_row, min_col=1, max_col=ws.max_column), 1):
-                room_type = ws.cell(row=1, column=col_idx).value
-                if room_type in closed_rooms:
-                    cell[0].fill = yellow_fill
-                    print(f"    → '{room_type}' 셀을 노란색으로 하이라이트함")
-            
-            # 파일 저장
-            wb.save(excel_path)
-            print(f"  ✓ {len(closed_rooms)}개 마감 방에 대해 엑셀 파일 업데이트 완료")
-        except Exception as e:
-            print(f"  ⚠ 엑셀 하이라이트 작업 실패: {e}")
+    def highlight_closed_rooms_in_excel(self, target_date, closed_rooms, observed_rooms=()):
+        """
+        마감된 방 타입 하이라이트 요청 등록 (flush_closed_room_highlights에서 한 번에 엑셀 저장)
+        observed_rooms 중 마감이 아닌 방은 기존 하이라이트 해제
+        """
+        self.closed_room_highlighter.add(target_date, closed_rooms, observed_rooms)
+
+    def queue_closed_room_highlights(self, closed_rooms_by_date):
+        """{날짜: {엑셀 방 타입: 마감 여부}}를 하이라이트 요청으로 등록 (확인한 방만 해제 대상)"""
+        closed_count = sum(closed for rooms in closed_rooms_by_date.values() for closed in rooms.values())
+        if closed_count:
+            print(f"\n📊 마감된 방 {closed_count}건 하이라이트 예약")
+        for date_key, rooms in closed_rooms_by_date.items():
+            self.highlight_closed_rooms_in_excel(
+                date_key, [room for room, closed in rooms.items() if closed], list(rooms))
+
+    def flush_closed_room_highlights(self):
+        """모아 둔 마감 방 하이라이트를 엑셀에 한 번에 반영 (다시 판매 중인 방은 하이라이트 해제, 백그라운드 I/O 워커에서 저장)"""
+        if not len(self.closed_room_highlighter):
+            return
+        print(f"\n📊 마감 방 하이라이트 {len(self.closed_room_highlighter)}일치 엑셀 파일 업데이트 예약")
+        self.io.submit("엑셀 하이라이트", self.closed_room_highlighter.detach().flush)
 
     def load_base_prices_from_excel(self, target_date=None):
-        """엑셀 파일에서 특정 날짜의 기준가 로드 (방 타입별 기준가)"""
+        """엑셀 파일에서 특정 날짜의 기준가 로드 (방 타입별 기준가, 워크북은 실행당 한 번만 읽음)"""
         try:
-            excel_path = os.path.join(os.path.dirname(__file__), "기준가격.xlsx")
-            if not os.path.exists(excel_path):
-                print(f"  ⚠ 기준가격.xlsx 파일을 찾지 못했습니다: {excel_path}")
+            if not self.price_table.exists():
+                print(f"  ⚠ 기준가격.xlsx 파일을 찾지 못했습니다: {self.price_table.path}")
                 return {}
             
             # 기준값이 될 날짜 (기본: 오늘)
             if not target_date:
                 target_date = datetime.now().strftime("%Y-%m-%d")
             
-            df = pd.read_excel(excel_path, sheet_name=0)
-            
-            # 첫 번째 열이 날짜 열이므로 날짜 형식으로 변환
-            date_col = df.iloc[:, 0]
-            
-            # 일치하는 날짜 찾기
-            matching_row = None
-            for idx, date_val in enumerate(date_col):
-                try:
-                    # 날짜 값을 문자열로 변환해서 비교
-                    date_str = pd.Timestamp(date_val).strftime("%Y-%m-%d")
-                    if date_str == target_date:
-                        matching_row = df.iloc[idx]
-                        break
-                except Exception:
-                    continue
-            
-            if matching_row is None:
+            if target_date in self.price_table:
+                base_prices = self.price_table.prices_for(target_date)
+            else:
                 print(f"  ⚠ 엑셀에서 {target_date}에 해당하는 행을 찾지 못했습니다. 첫 번째 행을 사용합니다.")
-                matching_row = df.iloc[0]
-            
-            # 방 타입과 기준가 매핑
-            base_prices = {}
-            for col_idx in range(1, len(df.columns)):
-                room_type = df.columns[col_idx]
-                try:
-                    price = int(float(matching_row.iloc[col_idx]))
-                    base_prices[room_type] = price
-                except (ValueError, TypeError):
-                    continue
+                base_prices = self.price_table.first_prices()
             
             print(f"  ✓ {target_date}의 기준가 {len(base_prices)}개 로드: {base_prices}")
             return base_prices
@@ -115,342 +373,624 @@ class HotelCMSController:
             print(f"  ⚠ 기준가 로드 실패: {e}")
             return {}
 
-    def auto_set_rates_by_rmo(self, start_date=None):
-        """요금관리 메뉴에서 기준가를 기반으로 OTA별 요금 자동입력 (아고다=기준가, 나머지=기준가+5,000)"""
+    @profiled_phase('rate_input')
+    def auto_set_rates_by_rmo(self, start_date=None, window_days=None, mode=None):
+        """
+        요금관리 메뉴에서 기준가를 기반으로 OTA별 요금 자동입력 (아고다=기준가, 나머지=기준가+5,000~10,000)
+
+        Args:
+            start_date: 조회 시작일 (기본: 오늘)
+            window_days: None이면 모든 컬럼에 시작일 기준가 적용 (1일 모드),
+                         숫자면 시작일부터 최대 window_days개 컬럼에 컬럼별 날짜의 기준가 적용 (윈도우 모드)
+            mode: 'script'(요금 매트릭스를 한 번의 스크립트로 입력) 또는 'element'(행/입력란별 입력).
+                  기본값은 config.RATE_FILL_MODE
+
+        Returns:
+            입력을 처리한 날짜(컬럼) 수 (윈도우 모드에서 다음 윈도우 시작일 계산용)
+        """
         try:
             # 날짜 설정
             if not start_date:
                 start_date = datetime.now().strftime("%Y-%m-%d")
+            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
             
-            # 해당 날짜의 기준가 로드
+            # 해당 날짜의 기준가 로드 (윈도우 모드에서는 엑셀에 없는 날짜의 대체값)
             base_prices = self.load_base_prices_from_excel(start_date)
             if not base_prices:
                 print("  ⚠ 기준가를 로드하지 못했습니다. 계속 진행합니다.")
             
-            # 마감된 방을 추적할 리스트
-            closed_rooms_list = []
+            # 마감된 방을 날짜별로 추적
+            closed_rooms_by_date = {}
 
-            print("\n📋 요금관리 메뉴로 이동 중...")
-            rate_url = "https://wingscms.com/#/app/cm/cm03_0200"
-            self.driver.get(rate_url)
-            time.sleep(3)
+            self._open_rate_page(start_date)
+
+            mode = mode or config.RATE_FILL_MODE
+            covered_days = None
+            if mode == 'script':
+                covered_days = self._fill_rates_by_script(start_dt, window_days, base_prices, closed_rooms_by_date)
+                if covered_days is None:
+                    print("  → 한 번에 입력 실패, 행별 입력으로 재시도")
+                    closed_rooms_by_date = {}
+            if covered_days is None:
+                covered_days = self._fill_rates_by_element(start_dt, window_days, base_prices, closed_rooms_by_date)
+
+            # 저장 버튼 클릭 (테스트 버전: 저장 생략)
+            # try:
+            #     save_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(),'저장')]")))
+            #     save_btn.click()
+            #     print("  ✓ 저장 버튼 클릭")
+            #     self.waiter.settled('save')
+            # except Exception as e:
+            #     print(f"  ⚠ 저장 버튼 클릭 실패: {e}")
+
+            print("✓ 요금 자동입력 완료 (테스트 버전: 저장 미수행)")
             
-            # 시작일 input 찾기 및 값 입력
-            try:
-                date_input = self.wait.until(EC.presence_of_element_located((By.ID, "startDatePicker")))
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", date_input)
-                date_input.click()
-                time.sleep(0.2)
-                # 안전하게 초기화 후 값 세팅
-                self.driver.execute_script("arguments[0].value = '';", date_input)
-                self.driver.execute_script("arguments[0].focus();", date_input)
-                date_input.clear()
-                date_input.send_keys(start_date)
-                # input/change 이벤트 트리거
-                self.driver.execute_script("arguments[0].dispatchEvent(new Event('input', {bubbles:true}));", date_input)
-                self.driver.execute_script("arguments[0].dispatchEvent(new Event('change', {bubbles:true}));", date_input)
-                date_input.send_keys(Keys.ENTER)
-                print(f"  ✓ 시작일 입력: {start_date}")
-            except Exception as e:
-                print(f"  ⚠ 시작일 입력 실패: {e}")
+            # 마감 방 하이라이트 요청 (판매 중으로 확인된 방은 기존 하이라이트를 해제)
+            if not window_days:
+                merged = {}
+                for rooms in closed_rooms_by_date.values():
+                    for room, closed in rooms.items():
+                        merged[room] = merged.get(room, False) or closed
+                closed_rooms_by_date = {start_date: merged}
+            self.queue_closed_room_highlights(closed_rooms_by_date)
+            return covered_days
+        except Exception as e:
+            print(f"❌ 요금 자동입력 전체 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            return 0
 
-            time.sleep(1)
+    def _fill_rates_by_script(self, start_dt, window_days, base_prices, closed_rooms_by_date):
+        """
+        요금 매트릭스(방 블록 → OTA 행 → 컬럼 → 가격)를 계산해 한 번의 스크립트 실행으로 입력
+        (그리드 구조 읽기 1회 + RMO 활성화/마감 제외/전체 입력 1회)
 
-            # 전체 객실 선택 (드롭다운 방식) — 드롭다운 열기 + selectall 클릭
+        Returns:
+            처리한 날짜(컬럼) 수, 스크립트 실행이 실패하면 None
+        """
+        try:
+            blocks = self.driver.execute_script(RATE_GRID_SNAPSHOT_JS)
+        except Exception as e:
+            print(f"  ⚠ 요금 그리드 읽기 실패: {e}")
+            return None
+        print(f"  ✓ RMO 버튼 {len(blocks)}개 발견")
+
+        covered_days = 1
+        plan = []
+        labels = {}
+        for block in blocks:
+            parent_label = block['label']
+
+            column_count = block['column_count']
+            if window_days:
+                column_count = min(column_count, window_days) if column_count else window_days
+            column_dates = [(start_dt + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(max(column_count, 1))]
+            if window_days:
+                covered_days = max(covered_days, len(column_dates))
+
+            closed_cols = set()
+            if block['status_texts'] is not None:
+                closed_cols = self._closed_rate_columns(block['status_texts'], column_count if window_days else 0)
+            if self._record_closed_rate_columns(closed_rooms_by_date, parent_label, column_dates, closed_cols):
+                print(f"    ⊘ '{parent_label}': 마감 상태 - 스킵")
+                continue
+            if closed_cols:
+                print(f"    ⊘ '{parent_label}': {len(closed_cols)}일 마감 - 해당 날짜 스킵")
+
+            matched_room, base_price = self._match_base_price(parent_label, base_prices)
+            if base_price is None:
+                # 엑셀에서 못 찾으면 RMO 입력값 사용 (첫 번째 컬럼)
+                val = (block['rmo_value'] or '').replace(',', '').strip()
+                if val.isdigit():
+                    base_price = int(val)
+                    print(f"    → RMO 입력값 사용: {base_price:,}원")
+            if base_price is None:
+                print(f"    ⚠ '{parent_label}'에 대한 기준가를 찾지 못해 건너뜁니다.")
+                continue
+            column_prices = self._rate_column_prices(column_dates, closed_cols, matched_room, base_price, window_days)
+
+            rows = []
+            for child, child_row in enumerate(block['children']):
+                label = child_row['label']
+                row_price = calc_ota_rate(label, base_price) if column_prices is None else None  # 1일 모드: 행 전체에 같은 값
+                values = {}
+                for col in range(child_row['inputs']):
+                    if column_prices is not None:
+                        # 윈도우 모드: 컬럼 날짜별 기준가 (윈도우 밖/마감 컬럼은 건너뜀)
+                        if col >= len(column_prices) or column_prices[col] is None:
+                            continue
+                        values[str(col)] = f"{calc_ota_rate(label, column_prices[col]):,}"
+                    else:
+                        values[str(col)] = f"{row_price:,}"
+                if values:
+                    rows.append({'child': child, 'label': label, 'values': values})
+            if not rows:
+                print(f"    ⚠ 하위 요금 행(child-{block['parent_id']})을 찾지 못했습니다.")
+                continue
+            plan.append({'parent_id': block['parent_id'], 'rows': rows})
+            labels[block['parent_id']] = parent_label
+
+        if not plan:
+            return covered_days
+
+        started = time.time()
+        try:
+            outcome = self.driver.execute_async_script(
+                FILL_RATE_MATRIX_JS, plan, int(self.waiter.timeout_for('rmo') * 1000))
+        except Exception as e:
+            print(f"  ⚠ 요금 입력 스크립트 실행 실패: {e}")
+            return None
+        if not outcome or not outcome.get('ok'):
+            print(f"  ⚠ 요금 입력 스크립트 오류: {(outcome or {}).get('error')}")
+            return None
+        self.waiter.dom_quiet('input')
+
+        rows_by_parent = {block['parent_id']: [] for block in plan}
+        for row in outcome['rows']:
+            rows_by_parent.setdefault(row['parent_id'], []).append(row)
+        for parent_id, rows in rows_by_parent.items():
+            filled = sum(row['filled'] for row in rows)
+            failed = sum(row['failed'] for row in rows)
+            errors = sorted({row['error'] for row in rows if row['error']})
+            if errors:
+                print(f"    ⚠ '{labels[parent_id]}': {', '.join(errors)}")
+            print(f"    → '{labels[parent_id]}': {len(rows)}개 행 {filled}칸 입력"
+                  + (f", 실패 {failed}칸" if failed else ""))
+        total = sum(row['filled'] for row in outcome['rows'])
+        print(f"  ✓ 요금 {total}칸 입력 ({time.time() - started:.2f}s, RMO 대기 {outcome['waited_ms'] / 1000:.2f}s)")
+
+        # RMO 입력란이 비활성이었거나 입력에 실패한 행이 있는 블록은 행별 입력으로 다시 처리
+        failed_ids = {parent_id for parent_id, rows in rows_by_parent.items()
+                      if not rows or not all(row.get('ok') for row in rows)}
+        if failed_ids:
+            retry_labels = [labels[block['parent_id']] for block in plan if block['parent_id'] in failed_ids]
+            print(f"  → 입력하지 못한 블록 {len(failed_ids)}개 행별 입력으로 재시도: {', '.join(retry_labels)}")
+            self._fill_rates_by_element(start_dt, window_days, base_prices, closed_rooms_by_date, parent_ids=failed_ids)
+        return covered_days
+
+    def _fill_rates_by_element(self, start_dt, window_days, base_prices, closed_rooms_by_date, parent_ids=None):
+        """
+        RMO 버튼을 하나씩 클릭하고 하위 요금 행의 입력란에 차례로 입력 (스크립트 입력이 실패할 때의 대체 경로)
+
+        Args:
+            parent_ids: 지정하면 해당 블록만 처리 (스크립트가 입력하지 못한 블록 재시도)
+
+        Returns:
+            처리한 날짜(컬럼) 수
+        """
+        covered_days = 1
+        # 각 객실별 RMO 버튼 클릭 및 요금 입력 (하위 child 행에 반영)
+        rmo_buttons = self.driver.find_elements(By.XPATH, "//span[contains(.,'RMO')]")
+        print(f"  ✓ RMO 버튼 {len(rmo_buttons)}개 발견")
+        for rmo_btn in rmo_buttons:
             try:
-                print("  → 전체 객실 선택 중...")
-                # 드롭다운 열기
+                # RMO 버튼이 속한 행의 parent_id 먼저 파악
+                parent_tr = rmo_btn.find_element(By.XPATH, "ancestor::tr")
+                parent_id = None
                 try:
-                    dropdown_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(@id,'searchRoomType') and contains(@id,'button')]")))
+                    parent_td = parent_tr.find_element(By.XPATH, ".//td[@id]")
+                    parent_id = parent_td.get_attribute("id")
                 except Exception:
-                    dropdown_btn = None
-                
-                if dropdown_btn:
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", dropdown_btn)
-                    time.sleep(0.5)
-                    dropdown_btn.click()
-                    time.sleep(0.8)  # 드롭다운 메뉴 열릴 때까지 대기
-                    print("  ✓ 드롭다운 열음")
-
-                # selectall 요소 찾기
-                sel_candidates = [
-                    "[data-testid='selectall']",
-                    "input[data-testid='selectall-checkbox']",
-                    "span[data-testid='select-all-text']",
-                    "#searchRoomType-option-selectall",
-                ]
-                select_all_el = None
-                for sel in sel_candidates:
-                    try:
-                        select_all_el = self.driver.find_element(By.CSS_SELECTOR, sel)
-                        if select_all_el:
-                            break
-                    except Exception:
-                        continue
+                    pass
 
-                if select_all_el:
-                    try:
-                        aria_sel = select_all_el.get_attribute("aria-selected")
-                        data_sel = select_all_el.get_attribute("data-selected")
-                        if aria_sel == "true" or (data_sel and data_sel != ""):
-                            print("  ✓ 전체 객실 선택 (이미 선택됨)")
-                        else:
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", select_all_el)
-                            time.sleep(0.3)
-                            try:
-                                select_all_el.click()
-                            except Exception:
-                                self.driver.execute_script("arguments[0].click();", select_all_el)
-                            print("  ✓ 전체 객실 선택 (클릭함)")
-                            time.sleep(0.5)
-                    except Exception:
-                        try:
-                            self.driver.execute_script("arguments[0].click();", select_all_el)
-                            print("  ✓ 전체 객실 선택 (JS 강제)")
-                            time.sleep(0.5)
-                        except Exception as e2:
-                            print(f"  ⚠ 전체 객실 선택 실패: {e2}")
-                else:
-                    print("  ⚠ 전체 객실 selectall 요소를 찾지 못했습니다.")
-            except Exception as e:
-                print(f"  ⚠ 전체 객실 선택 실패: {e}")
+                if not parent_id:
+                    print("    ⚠ parent_id를 찾지 못해 건너뜁니다.")
+                    continue
+                if parent_ids is not None and parent_id not in parent_ids:
+                    continue
 
-            time.sleep(1)
+                parent_label = parent_tr.text.strip()
 
-            # 조회 버튼 클릭
-            try:
-                # 조회 버튼 찾기 (여러 방법으로 시도)
-                search_btn = None
+                # 화면의 날짜 컬럼 수 (RMO 입력 행의 입력란 수, 비활성 상태에서도 존재)
+                rate_row_locator = "following-sibling::tr[@data-field='RM_RA'][1]"
                 try:
-                    search_btn = self.driver.find_element(By.ID, "searchBtn")
+                    column_count = len(parent_tr.find_element(By.XPATH, rate_row_locator)
+                                       .find_elements(By.CSS_SELECTOR, "input[type='text']"))
                 except Exception:
-                    try:
-                        search_btn = self.driver.find_element(By.XPATH, "//button[@id='searchBtn']")
-                    except Exception:
-                        try:
-                            search_btn = self.driver.find_element(By.XPATH, "//button[contains(@class, 'btn-primary') and .//i[contains(@class, 'search')]]")
-                        except Exception:
-                            pass
-                
-                if not search_btn:
-                    print("  ⚠ 조회 버튼을 찾지 못했습니다.")
-                else:
-                    # 버튼이 클릭 가능할 때까지 대기
-                    self.wait.until(EC.element_to_be_clickable((By.ID, "searchBtn")))
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", search_btn)
-                    time.sleep(0.5)
-                    
-                    # 클릭 시도 (일반 클릭 → JS 클릭)
-                    try:
-                        search_btn.click()
-                    except Exception:
-                        self.driver.execute_script("arguments[0].click();", search_btn)
-                    
-                    print("  ✓ 조회 버튼 클릭")
-                    print("  ⏳ 페이지 로드 대기 중...")
-                    # 페이지가 제대로 로드될 때까지 충분히 기다림
-                    time.sleep(5)
-                    # 추가로 RMO 버튼이 나타날 때까지 대기
-                self.wait.until(EC.presence_of_all_elements_located((By.XPATH, "//span[contains(.,'RMO')]")))
-                print("  ✓ 페이지 로드 완료")
-            except Exception as e:
-                print(f"  ⚠ 조회 버튼 클릭 또는 페이지 로드 실패: {e}")
+                    column_count = 0
+                if window_days:
+                    column_count = min(column_count, window_days) if column_count else window_days
+                column_dates = [(start_dt + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(max(column_count, 1))]
+                if window_days:
+                    covered_days = max(covered_days, len(column_dates))
 
-            # 각 객실별 RMO 버튼 클릭 및 요금 입력 (하위 child 행에 반영)
-            rmo_buttons = self.driver.find_elements(By.XPATH, "//span[contains(.,'RMO')]")
-            print(f"  ✓ RMO 버튼 {len(rmo_buttons)}개 발견")
-            for rmo_btn in rmo_buttons:
+                # 판매 상태 확인 (같은 방 타입의 판매 상태 행 찾기)
+                closed_cols = set()
                 try:
-                    # RMO 버튼이 속한 행의 parent_id 먼저 파악
-                    parent_tr = rmo_btn.find_element(By.XPATH, "ancestor::tr")
-                    parent_id = None
-                    try:
-                        parent_td = parent_tr.find_element(By.XPATH, ".//td[@id]")
-                        parent_id = parent_td.get_attribute("id")
-                    except Exception:
-                        pass
+                    # parent_tr의 바로 다음 행에서 data-field='CLOSE_YN' 찾기
+                    status_row = parent_tr.find_element(By.XPATH, "following-sibling::tr[@data-field='CLOSE_YN'][1]")
+                    status_texts = self.driver.execute_script(
+                        "return Array.prototype.map.call(arguments[0].querySelectorAll('td'), "
+                        "function (td) { return (td.textContent || '').trim(); });", status_row)
+                    closed_cols = self._closed_rate_columns(status_texts, column_count if window_days else 0)
+                except Exception:
+                    # 판매 상태 행을 찾지 못하면 계속 진행
+                    pass
 
-                    if not parent_id:
-                        print("    ⚠ parent_id를 찾지 못해 건너뜁니다.")
-                        continue
+                if self._record_closed_rate_columns(closed_rooms_by_date, parent_label, column_dates, closed_cols):
+                    print(f"    ⊘ '{parent_label}': 마감 상태 - 스킵")
+                    continue
+                if closed_cols:
+                    print(f"    ⊘ '{parent_label}': {len(closed_cols)}일 마감 - 해당 날짜 스킵")
 
-                    # 판매 상태 확인 (같은 방 타입의 판매 상태 행 찾기)
-                    try:
-                        # parent_tr의 바로 다음 행에서 data-field='CLOSE_YN' 찾기
-                        status_row = parent_tr.find_element(By.XPATH, "following-sibling::tr[@data-field='CLOSE_YN'][1]")
-                        status_text = status_row.text.strip()
-                        
-                        # "마감" 또는 "Close" 같은 텍스트 확인
-                        if '마감' in status_text or 'close' in status_text.lower():
-                            parent_label = parent_tr.text.strip()
-                            # 방 타입명만 추출 (OTA 정보 제거)
-                            room_type_for_excel = parent_label.split('-')[0].strip() if '-' in parent_label else parent_label
-                            closed_rooms_list.append(room_type_for_excel)
-                            print(f"    ⊘ '{parent_label}': 마감 상태 - 스킵")
-                            continue
-                    except Exception:
-                        # 판매 상태 행을 찾지 못하면 계속 진행
-                        pass
+                # RMO 입력란이 활성화되었는지 확인 (disabled 속성 확인)
+                def rmo_row_enabled(driver):
+                    row = parent_tr.find_element(By.XPATH, rate_row_locator)
+                    if row.find_elements(By.CSS_SELECTOR, "input[type='text']:not([disabled])"):
+                        return row
+                    return None
 
+                # 이미 활성화된 블록(스크립트가 토글한 경우)은 다시 클릭하면 비활성화되므로 클릭하지 않음
+                try:
+                    already_enabled = rmo_row_enabled(self.driver) is not None
+                except Exception:
+                    already_enabled = False
+
+                if not already_enabled:
                     print(f"    → RMO 버튼 활성화 중 (parent_id: {parent_id})...")
-                    
+
                     # RMO 버튼을 스크롤해서 보이게 하고 클릭
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", rmo_btn)
-                    time.sleep(0.3)
-                    
+
                     # RMO 버튼 클릭 (여러 방법으로 시도)
                     try:
                         rmo_btn.click()
                     except Exception:
                         self.driver.execute_script("arguments[0].click();", rmo_btn)
-                    
-                    time.sleep(0.5)
-                    
-                    # RMO 버튼 클릭 후 입력란 활성화 확인 (최대 3초 대기)
-                    rmo_input_row = None
-                    for attempt in range(6):  # 0.5초 × 6 = 최대 3초
-                        try:
-                            rmo_input_row = parent_tr.find_element(By.XPATH, "following-sibling::tr[@data-field='RM_RA'][1]")
-                            # 입력란이 실제로 활성화되었는지 확인 (disabled 속성 확인)
-                            rmo_inputs_check = rmo_input_row.find_elements(By.CSS_SELECTOR, "input[type='text']:not([disabled])")
-                            if rmo_inputs_check:
-                                print(f"    ✓ RMO 입력란 활성화 확인됨")
-                                break
-                        except Exception:
-                            pass
-                        if attempt < 5:
-                            time.sleep(0.5)
-                        rmo_input_row = None
 
-                    if not rmo_input_row:
-                        print("    ⚠ RMO 입력 행을 찾지 못해 건너뜁니다.")
-                        continue
+                # RMO 버튼 클릭 후 입력란이 활성화될 때까지 대기
+                rmo_input_row = self.waiter.until(rmo_row_enabled, 'rmo', description="RMO 입력란 활성화")
+                if rmo_input_row:
+                    print(f"    ✓ RMO 입력란 활성화 확인됨")
 
-                    rmo_inputs = rmo_input_row.find_elements(By.CSS_SELECTOR, "input[type='text']")
-                    if not rmo_inputs:
-                        print("    ⚠ RMO 입력란 없음, 건너뜀")
-                        continue
-                    
-                    # RMO 행의 기준가를 엑셀에서 찾기
-                    parent_label = parent_tr.text.strip()
-                    base_price = None
-                    
-                    # 엑셀에서 해당 방 타입의 기준가 찾기 (정확한 매칭)
-                    for room_type, price in base_prices.items():
-                        # 방 타입명이 parent_label에 포함되어 있는지 확인
-                        if room_type in parent_label:
-                            base_price = price
-                            print(f"    → 엑셀 기준가 매칭: '{room_type}' = {price:,}원")
-                            break
-                    
-                    # 엑셀에서 못 찾으면 RMO 입력값 사용 (첫 번째 컬럼)
-                    if base_price is None:
-                        try:
-                            val = (rmo_inputs[0].get_attribute('value') or '').replace(',', '').strip()
-                            if val.isdigit():
-                                base_price = int(val)
-                                print(f"    → RMO 입력값 사용: {base_price:,}원")
-                        except Exception:
-                            pass
-                    
-                    if base_price is None:
-                        print(f"    ⚠ '{parent_label}'에 대한 기준가를 찾지 못해 건너뜁니다.")
-                        continue
+                if not rmo_input_row:
+                    print("    ⚠ RMO 입력 행을 찾지 못해 건너뜁니다.")
+                    continue
+
+                rmo_inputs = rmo_input_row.find_elements(By.CSS_SELECTOR, "input[type='text']")
+                if not rmo_inputs:
+                    print("    ⚠ RMO 입력란 없음, 건너뜀")
+                    continue
+
+                # RMO 행의 기준가를 엑셀에서 찾기
+                matched_room, base_price = self._match_base_price(parent_label, base_prices)
 
-                    # 하위 child tr들 찾기 (같은 parent_id) — parent_id는 이미 확인됨
+                # 엑셀에서 못 찾으면 RMO 입력값 사용 (첫 번째 컬럼)
+                if base_price is None:
                     try:
-                        child_trs = self.driver.find_elements(By.XPATH, f"//tr[contains(@class,'child-{parent_id}') and @data-field='RM_RA']")
+                        val = (rmo_inputs[0].get_attribute('value') or '').replace(',', '').strip()
+                        if val.isdigit():
+                            base_price = int(val)
+                            print(f"    → RMO 입력값 사용: {base_price:,}원")
                     except Exception:
-                        child_trs = []
+                        pass
 
-                    if not child_trs:
-                        print(f"    ⚠ 하위 요금 행(child-{parent_id})을 찾지 못했습니다.")
-                        continue
+                if base_price is None:
+                    print(f"    ⚠ '{parent_label}'에 대한 기준가를 찾지 못해 건너뜁니다.")
+                    continue
+
+                column_prices = self._rate_column_prices(column_dates, closed_cols, matched_room, base_price, window_days)
+
+                # 하위 child tr들 찾기 (같은 parent_id) — parent_id는 이미 확인됨
+                try:
+                    child_trs = self.driver.find_elements(By.XPATH, f"//tr[contains(@class,'child-{parent_id}') and @data-field='RM_RA']")
+                except Exception:
+                    child_trs = []
+
+                if not child_trs:
+                    print(f"    ⚠ 하위 요금 행(child-{parent_id})을 찾지 못했습니다.")
+                    continue
+                else:
+                    print(f"    → child-{parent_id} 행 {len(child_trs)}개 대상 (기준가: {base_price:,}원)")
+
+                for child_tr in child_trs:
+                    try:
+                        label = child_tr.text.strip()
+                        inputs = child_tr.find_elements(By.CSS_SELECTOR, "input[type='text']")
+                        if not inputs:
+                            continue
+
+                        # 스크롤해서 해당 행이 화면에 보이도록
+                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", child_tr)
+
+                        # 1일 모드: 모든 input에 동일한 기준가 기반 OTA 가격 적용
+                        new_val = calc_ota_rate(label, base_price)
+                        if new_val is None:
+                            continue
+
+                        for idx, inp in enumerate(inputs):
+                            try:
+                                # 윈도우 모드: 컬럼 날짜별 기준가 (윈도우 밖/마감 컬럼은 건너뜀)
+                                if column_prices is not None:
+                                    if idx >= len(column_prices) or column_prices[idx] is None:
+                                        continue
+                                    new_val = calc_ota_rate(label, column_prices[idx])
+
+                                # 요소가 실제로 상호작용 가능한지 확인
+                                self.driver.execute_script("arguments[0].removeAttribute('readonly');", inp)
+                                # 요소가 display:none이면 스킵
+                                display = self.driver.execute_script("return window.getComputedStyle(arguments[0]).display;", inp)
+                                if display == 'none':
+                                    continue
+
+
+                                # 포커스를 먼저 설정
+                                self.driver.execute_script("arguments[0].focus();", inp)
+                                inp.clear()
+                                inp.send_keys(f"{new_val:,}")
+                            except Exception as e_input:
+                                # 개별 입력 실패는 무시하고 계속 진행
+                                pass
+
+                        display_status = self.driver.execute_script("return window.getComputedStyle(arguments[0]).display;", child_tr)
+                        if display_status != 'none':
+                            print(f"    → {label}: 입력 완료" if label else "    → (공백 행): 입력 완료")
+                    except Exception as e_child:
+                        pass  # 개별 child 행 실패는 조용히 무시
+
+                self.waiter.dom_quiet('input')
+            except Exception as e:
+                print(f"    ⚠ RMO 처리 중 오류: {e}")
+        return covered_days
+
+    def _record_closed_rate_columns(self, closed_rooms_by_date, label, column_dates, closed_cols):
+        """
+        컬럼 날짜별 판매/마감 상태를 엑셀 하이라이트용으로 기록 ("마감" 또는 "Close")
+        CMS 라벨은 RoomLabelMatcher로 엑셀 방 타입에 매칭하며, 매칭되지 않은 라벨은 기록하지 않음
+
+        Returns:
+            모든 컬럼이 마감이면 True
+        """
+        room_type = self.price_table.label_matcher().match(label)
+        if room_type is not None:
+            for col, date_key in enumerate(column_dates):
+                rooms = closed_rooms_by_date.setdefault(date_key, {})
+                rooms[room_type] = rooms.get(room_type, False) or closed_cols is None or col in closed_cols
+        return closed_cols is None or bool(closed_cols and len(closed_cols) >= len(column_dates))
+
+    def _match_base_price(self, parent_label, base_prices):
+        """엑셀에서 해당 방 타입의 기준가 찾기 (RoomLabelMatcher: 가장 긴 방 타입명/별칭 우선)"""
+        room_type, price = self.price_table.label_matcher().price(parent_label, base_prices)
+        if price is None:
+            return None, None
+        print(f"    → 엑셀 기준가 매칭: '{room_type}' = {price:,}원")
+        return room_type, price
+
+    def _rate_column_prices(self, column_dates, closed_cols, matched_room, base_price, window_days):
+        """컬럼별 기준가: 윈도우 모드는 컬럼 날짜의 기준가 (엑셀에 없으면 시작일 기준가), 1일 모드는 None (모두 같은 값)"""
+        if not window_days:
+            return None
+        return [
+            None if col in closed_cols else
+            (self.price_table.price(column_dates[col], matched_room) if matched_room else None) or base_price
+            for col in range(len(column_dates))
+        ]
+
+    def auto_set_rates_for_range(self, start_date_str, end_date_str, window_days=None):
+        """
+        시작일~종료일 요금 자동입력 (윈도우 모드: 페이지를 window_days일마다 한 번만 로드)
+
+        Args:
+            window_days: 한 페이지에서 처리할 최대 일수 (기본: config.RATE_WINDOW_DAYS)
+        """
+        window_days = window_days or config.RATE_WINDOW_DAYS
+        current_date = datetime.strptime(start_date_str, "%Y-%m-%d")
+        end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
+        page_loads = 0
+        while current_date <= end_date:
+            days = min(window_days, (end_date - current_date).days + 1)
+            print(f"\n===== 요금 {current_date.strftime('%Y-%m-%d')} ~ {(current_date + timedelta(days=days - 1)).strftime('%Y-%m-%d')} 처리 시작 =====")
+            with self.profiler.window(current_date.strftime("%Y-%m-%d")):
+                if self.http_client:
+                    covered = self.auto_set_rates_via_http(current_date.strftime("%Y-%m-%d"), days)
+                else:
+                    covered = self.auto_set_rates_by_rmo(current_date.strftime("%Y-%m-%d"), window_days=days)
+            page_loads += 1
+            # 화면 컬럼이 윈도우보다 적으면 처리한 날짜만큼만 이동
+            current_date += timedelta(days=covered or days)
+        print(f"\n✓ 요금 자동입력 {page_loads}회 {'API 조회' if self.http_client else '페이지 로드'}로 완료")
+        return page_loads
+
+    @profiled_phase('rate_input')
+    def auto_set_rates_via_http(self, start_date, window_days):
+        """
+        HTTP 백엔드로 요금 자동입력 (auto_set_rates_by_rmo와 같은 규칙을 API 조회/저장으로 처리)
+
+        Returns:
+            처리한 날짜 수
+        """
+        try:
+            base_prices = self.load_base_prices_from_excel(start_date)
+            rates = self.http_client.read_rates(start_date, window_days)
+            print(f"  ✓ 요금 조회: {len(rates)}개 객실")
+
+            closed_rooms_by_date = {}
+            items = []
+            for room_name, room in rates.items():
+                matched_room, _ = self.price_table.label_matcher().price(room_name, base_prices)
+                if matched_room not in base_prices:
+                    matched_room = None
+                dates = list(room['closed'])
+                self._record_closed_rate_columns(closed_rooms_by_date, room_name, dates,
+                                                 {col for col, date_key in enumerate(dates) if room['closed'][date_key]})
+                if matched_room is None:
+                    print(f"    ⚠ '{room_name}'에 대한 기준가를 찾지 못해 건너뜁니다.")
+                    continue
+                for channel, prices in room['channels'].items():
+                    for date_key in prices:
+                        if room['closed'].get(date_key):
+                            continue
+                        base_price = self.price_table.price(date_key, matched_room) or base_prices[matched_room]
+                        items.append({'room_name': room_name, 'channel': channel, 'date': date_key,
+                                      'price': calc_ota_rate(channel, base_price)})
+
+            if config.RATE_SAVE_ENABLED:
+                saved = self.http_client.save_rates(items)
+                if saved < len(items):
+                    print(f"❌ 요금 저장 실패: {len(items) - saved}/{len(items)}건 (저장 {saved}건)")
+                else:
+                    print(f"✓ 요금 저장 완료: {saved}/{len(items)}건")
+            else:
+                print(f"✓ 요금 {len(items)}건 계산 완료 (테스트 버전: 저장 미수행)")
+
+            self.queue_closed_room_highlights(closed_rooms_by_date)
+            return window_days
+        except Exception as e:
+            print(f"❌ 요금 자동입력(HTTP) 실패: {e}")
+            return 0
+
+    @staticmethod
+    def _closed_rate_columns(status_texts, column_count):
+        """
+        판매 상태(CLOSE_YN) 행의 셀 텍스트로 마감 컬럼 찾기
+
+        Returns:
+            마감 컬럼 인덱스 set (마감 없음: 빈 set), 컬럼별 판단이 불가능하면 None (행 전체 마감으로 처리)
+        """
+        def is_closed(text):
+            return '마감' in text or 'close' in text.lower()
+
+        if not any(is_closed(text) for text in status_texts):
+            return set()
+        if not column_count or len(status_texts) < column_count:
+            return None
+        cells = status_texts[-column_count:]
+        return {col for col, text in enumerate(cells) if is_closed(text)}
+
+    @profiled_phase('rate_page')
+    def _open_rate_page(self, start_date):
+        """요금관리(cm03_0200) 페이지 로드 → 시작일 입력 → 전체 객실 선택 → 조회"""
+        print("\n📋 요금관리 메뉴로 이동 중...")
+        self.open_page(cms_page_url(RATE_PAGE))
+        self._inventory_page_ready = False  # 인벤토리 화면을 벗어났으므로 다음에는 객실/필터부터 다시 설정
+        self._displayed_window = None
+        
+        # 시작일 입력
+        if self.set_date(start_date):
+            print(f"  ✓ 시작일 입력: {start_date}")
+        else:
+            print(f"  ⚠ 시작일 입력 실패: {start_date}")
+
+        # 전체 객실 선택 (드롭다운 방식) — 드롭다운 열기 + selectall 클릭
+        try:
+            print("  → 전체 객실 선택 중...")
+            # 드롭다운 열기
+            try:
+                dropdown_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(@id,'searchRoomType') and contains(@id,'button')]")))
+            except Exception:
+                dropdown_btn = None
+
+            if dropdown_btn:
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", dropdown_btn)
+                dropdown_btn.click()
+                # 드롭다운 메뉴 열릴 때까지 대기
+                self.waiter.visible((By.CSS_SELECTOR, "[data-testid='selectall'], #searchRoomType-option-selectall"), 'dropdown')
+                print("  ✓ 드롭다운 열음")
+
+            # selectall 요소 찾기
+            sel_candidates = [
+                "[data-testid='selectall']",
+                "input[data-testid='selectall-checkbox']",
+                "span[data-testid='select-all-text']",
+                "#searchRoomType-option-selectall",
+            ]
+            select_all_el = None
+            for sel in sel_candidates:
+                try:
+                    select_all_el = self.driver.find_element(By.CSS_SELECTOR, sel)
+                    if select_all_el:
+                        break
+                except Exception:
+                    continue
+
+            if select_all_el:
+                try:
+                    aria_sel = select_all_el.get_attribute("aria-selected")
+                    data_sel = select_all_el.get_attribute("data-selected")
+                    if aria_sel == "true" or (data_sel and data_sel != ""):
+                        print("  ✓ 전체 객실 선택 (이미 선택됨)")
                     else:
-                        print(f"    → child-{parent_id} 행 {len(child_trs)}개 대상 (기준가: {base_price:,}원)")
-
-                    # OTA 매핑: 기준가를 기반으로 계산 (아고다=기준가, 나머지=기준가+5,000~10,000원 랜덤)
-                    def calc_new_val(label, base_price):
-                        if base_price is None:
-                            return None
-                        label = label.lower()
-                        if 'agoda' in label or '아고다' in label:
-                            return base_price
-                        # 그 외 모든 OTA: 기준가 + 5,000~10,000원 범위의 랜덤 값 (천원 단위)
-                        random_addon = random.randint(5, 10) * 1000  # 5000, 6000, 7000, ..., 10000
-                        return base_price + random_addon
-
-                    for child_tr in child_trs:
+                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", select_all_el)
                         try:
-                            label = child_tr.text.strip()
-                            inputs = child_tr.find_elements(By.CSS_SELECTOR, "input[type='text']")
-                            if not inputs:
-                                continue
-                            
-                            # 스크롤해서 해당 행이 화면에 보이도록
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", child_tr)
-                            time.sleep(0.3)
-                            
-                            # 모든 input에 동일한 기준가 기반 OTA 가격 적용
-                            new_val = calc_new_val(label, base_price)
-                            if new_val is None:
-                                continue
-                            
-                            for idx, inp in enumerate(inputs):
-                                try:
-                                    # 요소가 실제로 상호작용 가능한지 확인
-                                    self.driver.execute_script("arguments[0].removeAttribute('readonly');", inp)
-                                    # 요소가 display:none이면 스킵
-                                    display = self.driver.execute_script("return window.getComputedStyle(arguments[0]).display;", inp)
-                                    if display == 'none':
-                                        continue
-                                    
-
-                                    # 포커스를 먼저 설정
-                                    self.driver.execute_script("arguments[0].focus();", inp)
-                                    time.sleep(0.1)
-                                    inp.clear()
-                                    inp.send_keys(f"{new_val:,}")
-                                except Exception as e_input:
-                                    # 개별 입력 실패는 무시하고 계속 진행
-                                    pass
-                            
-                            display_status = self.driver.execute_script("return window.getComputedStyle(arguments[0]).display;", child_tr)
-                            if display_status != 'none':
-                                print(f"    → {label}: 입력 완료" if label else "    → (공백 행): 입력 완료")
-                        except Exception as e_child:
-                            pass  # 개별 child 행 실패는 조용히 무시
+                            select_all_el.click()
+                        except Exception:
+                            self.driver.execute_script("arguments[0].click();", select_all_el)
+                        print("  ✓ 전체 객실 선택 (클릭함)")
+                        self.waiter.dom_quiet('dropdown')
+                except Exception:
+                    try:
+                        self.driver.execute_script("arguments[0].click();", select_all_el)
+                        print("  ✓ 전체 객실 선택 (JS 강제)")
+                        self.waiter.dom_quiet('dropdown')
+                    except Exception as e2:
+                        print(f"  ⚠ 전체 객실 선택 실패: {e2}")
+            else:
+                print("  ⚠ 전체 객실 selectall 요소를 찾지 못했습니다.")
+        except Exception as e:
+            print(f"  ⚠ 전체 객실 선택 실패: {e}")
 
-                    time.sleep(0.5)
-                except Exception as e:
-                    print(f"    ⚠ RMO 처리 중 오류: {e}")
+        # 조회 버튼 클릭
+        try:
+            # 조회 버튼 찾기 (여러 방법으로 시도)
+            search_btn = None
+            try:
+                search_btn = self.driver.find_element(By.ID, "searchBtn")
+            except Exception:
+                try:
+                    search_btn = self.driver.find_element(By.XPATH, "//button[@id='searchBtn']")
+                except Exception:
+                    try:
+                        search_btn = self.driver.find_element(By.XPATH, "//button[contains(@class, 'btn-primary') and .//i[contains(@class, 'search')]]")
+                    except Exception:
+                        pass
 
-            # 저장 버튼 클릭 (테스트 버전: 저장 생략)
-            # try:
-            #     save_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(),'저장')]")))
-            #     save_btn.click()
-            #     print("  ✓ 저장 버튼 클릭")
-            #     time.sleep(2)
-            # except Exception as e:
-            #     print(f"  ⚠ 저장 버튼 클릭 실패: {e}")
+            if not search_btn:
+                print("  ⚠ 조회 버튼을 찾지 못했습니다.")
+            else:
+                # 버튼이 클릭 가능할 때까지 대기
+                self.wait.until(EC.element_to_be_clickable((By.ID, "searchBtn")))
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", search_btn)
 
-            print("✓ 요금 자동입력 완료 (테스트 버전: 저장 미수행)")
-            
-            # 마감된 방이 있으면 엑셀 파일 업데이트
-            if closed_rooms_list:
-                print(f"\n📊 마감된 방 {len(closed_rooms_list)}개에 대해 엑셀 파일 업데이트 중...")
-                self.highlight_closed_rooms_in_excel(start_date, closed_rooms_list)
+                # 클릭 시도 (일반 클릭 → JS 클릭)
+                try:
+                    search_btn.click()
+                except Exception:
+                    self.driver.execute_script("arguments[0].click();", search_btn)
+
+                print("  ✓ 조회 버튼 클릭")
+                print("  ⏳ 페이지 로드 대기 중...")
+            # RMO 버튼이 나타나고 조회 응답이 끝날 때까지 대기
+            if not self.waiter.element((By.XPATH, "//span[contains(.,'RMO')]"), 'search'):
+                raise TimeoutError("RMO 버튼이 표시되지 않았습니다")
+            self.waiter.settled('search')
+            print("  ✓ 페이지 로드 완료")
         except Exception as e:
-            print(f"❌ 요금 자동입력 전체 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            print(f"  ⚠ 조회 버튼 클릭 또는 페이지 로드 실패: {e}")
 
-    def __init__(self):
-        """브라우저 초기화"""
+    def __init__(self, run_id=None):
+        """브라우저 초기화 (run_id: 변경 저널의 실행 ID, 병렬 워커는 부모 실행 ID를 공유)"""
         self.driver = None
         self.wait = None
-        self.change_history = []  # (date, room_type, index, old_value, new_value)
+        self.waiter = None  # 조건 기반 대기 엔진 (setup_driver에서 생성)
+        self.profiler = CMSProfiler()  # WebDriver 명령 프로파일러 (config.PROFILE_ENABLED)
+        self.driver_profile = None  # 사용 중인 드라이버 프로필 이름
+        self.driver_startup = None  # 드라이버 시작 시간(초)
+        self.page_load_times = []  # open_page 페이지 로드 시간(초)
+        self.change_journal = ChangeJournal(run_id=run_id)  # 변경 이력 (윈도우 저장 때마다 파일에 추가)
+        self.io = IOWorker()  # 엑셀/저널/체크포인트 파일 작업을 브라우저 스레드 밖에서 실행
+        self.availability_rules = AvailabilityRules()  # 판매가능객실 규칙표 (config.AVAILABILITY_RULES)
+        # 윈도우별 해시 저장소 (지난 실행과 그리드가 같으면 규칙 평가/입력/저장 생략)
+        self.snapshot_store = SnapshotStore() if config.SNAPSHOT_STORE_ENABLED else None
+        self._rules_signature = rules_signature(self.availability_rules.rules)
+        self.price_table = BasePriceTable()  # 기준가격.xlsx (최초 조회 시 한 번 로드)
+        self.closed_room_highlighter = ClosedRoomHighlighter()  # 마감 방 하이라이트 (실행 끝에 한 번 저장)
+        self.http_client = None  # HTTP 백엔드 (setup_http_backend에서 생성, None이면 화면 조작)
+        self._inventory_page_ready = False  # 인벤토리 화면 객실/필터 설정 완료 여부
+        self._displayed_window = None  # 인벤토리 화면에 조회되어 있는 윈도우 시작일
+        self.checkpoint = None  # 실행 중인 체크포인트 (run_inventory_windows에서 설정)
+        self.completed_windows = []  # 저장까지 끝났거나 변경이 없어 완료된 윈도우 (병렬 워커 → 부모 체크포인트)
 
+    @profiled_phase('search')
     def search_rooms_by_date(self):
         """조회 버튼을 눌러 해당 날짜의 내역을 조회"""
         try:
@@ -458,32 +998,92 @@ class HotelCMSController:
                 EC.element_to_be_clickable((By.ID, "searchBtn"))
             )
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", search_button)
-            time.sleep(0.5)
             search_button.click()
             print("  ✓ 조회 버튼 클릭 - 방 목록 로딩 중...")
-            time.sleep(3)
+            self.waiter.grid_rendered('search')
             return True
         except Exception as e:
             print(f"  ⚠ 조회 버튼 클릭 실패: {e}")
             return False
 
-    def setup_driver(self):
-        """크롬 드라이버 설정 및 초기화"""
+    def setup_driver(self, profile_name=None):
+        """
+        크롬 드라이버 설정 및 초기화
+
+        Args:
+            profile_name: config.DRIVER_PROFILES의 프로필 이름 (기본: config.DRIVER_PROFILE)
+        """
+        profile_name = profile_name or config.DRIVER_PROFILE
+        if profile_name not in config.DRIVER_PROFILES:
+            print(f"  ⚠ 알 수 없는 드라이버 프로필 '{profile_name}' - interactive로 진행")
+            profile_name = 'interactive'
+        profile = config.DRIVER_PROFILES[profile_name]
         chrome_options = Options()
         
-        if config.HEADLESS:
-            chrome_options.add_argument('--headless')
+        headless = config.HEADLESS if profile.get('headless') is None else profile['headless']
+        if headless:
+            chrome_options.add_argument('--headless=new')
         
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--start-maximized')
+        if profile.get('window_size'):
+            # 고정된 큰 화면: 그리드 전체가 한 화면에 들어와 스크롤이 필요 없음
+            chrome_options.add_argument('--window-size={},{}'.format(*profile['window_size']))
+        else:
+            chrome_options.add_argument('--start-maximized')
+        for argument in profile.get('arguments', []):
+            chrome_options.add_argument(argument)
+        chrome_options.page_load_strategy = profile.get('page_load_strategy', 'normal')
+        if config.CHROME_USER_DATA_DIR:
+            # 전용 프로필 디렉터리를 쓰면 브라우저 자체에 로그인 상태가 유지됨
+            chrome_options.add_argument(f'--user-data-dir={os.path.abspath(config.CHROME_USER_DATA_DIR)}')
         
-        # Selenium 4의 자동 드라이버 관리 사용
-        self.driver = webdriver.Chrome(options=chrome_options)
+        started = time.time()
+        if config.CHROMEDRIVER_PATH:
+            # 드라이버 경로 고정: 실행마다 Selenium Manager가 드라이버를 찾는 과정 생략
+            self.driver = webdriver.Chrome(options=chrome_options, service=Service(config.CHROMEDRIVER_PATH))
+        else:
+            # Selenium 4의 자동 드라이버 관리 사용
+            self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver_startup = time.time() - started
+
+        if profile.get('blocked_urls'):
+            # 이미지/폰트/분석 스크립트 요청 차단
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': profile['blocked_urls']})
+            except Exception as e:
+                print(f"  ⚠ 리소스 차단 설정 실패: {e}")
+
         self.wait = WebDriverWait(self.driver, config.IMPLICIT_WAIT)
+        self.waiter = CMSWaiter(self.driver, page_load_strategy=chrome_options.page_load_strategy)
+        self.profiler.attach(self.driver, self.wait, self.waiter)
+        self.waiter.install()
+        self.driver_profile = profile_name
         
-        print("✓ 브라우저 초기화 완료")
+        print(f"✓ 브라우저 초기화 완료 (프로필: {profile_name}, 시작 {self.driver_startup:.2f}s)")
+
+    def open_page(self, url):
+        """페이지 이동 후 로드 완료까지 대기 (페이지 로드 시간 기록)"""
+        started = time.time()
+        self.driver.get(url)
+        self.waiter.settled('page_load')
+        elapsed = time.time() - started
+        self.page_load_times.append(elapsed)
+        return elapsed
+
+    def report_driver_timings(self):
+        """드라이버 시작 시간과 페이지 로드 시간 요약 (프로필 비교용)"""
+        if self.driver_startup is None:
+            return
+        print(f"\n🌐 드라이버 프로필 {self.driver_profile}: 시작 {self.driver_startup:.2f}s", end="")
+        if self.page_load_times:
+            loads = self.page_load_times
+            print(f", 페이지 로드 {len(loads)}회 평균 {sum(loads) / len(loads):.2f}s / 최대 {max(loads):.2f}s")
+        else:
+            print()
         
+    @profiled_phase('login')
     def login(self, company_id=None, username=None, password=None):
         """CMS 로그인"""
         company_id = company_id or config.CMS_COMPANY_ID
@@ -498,7 +1098,7 @@ class HotelCMSController:
             print("\n🔐 로그인 확인 중...")
             
             # 먼저 이미 로그인되어 있는지 확인
-            time.sleep(2)
+            self.waiter.settled('page_load')
             current_url = self.driver.current_url
             
             # URL에 #/app이 있으면 이미 로그인된 상태
@@ -555,15 +1155,17 @@ class HotelCMSController:
             except Exception as e:
                 print(f"  ⚠ 로그인 유지 체크 실패: {e}")
             
-            time.sleep(0.5)
-            
             # 로그인 버튼 클릭
             login_button = self.driver.find_element(By.XPATH, "//button[contains(text(), '로그인')]")
             login_button.click()
             print("  ✓ 로그인 버튼 클릭")
             
-            # 로그인 완료 대기 (페이지 전환 또는 특정 요소 로드 확인)
-            time.sleep(3)
+            # 로그인 완료 대기 (앱 화면으로 전환되고 비밀번호 입력란이 사라질 때까지)
+            self.waiter.until(
+                lambda d: "#/app" in d.current_url and not d.find_elements(By.CSS_SELECTOR, "input[type='password']"),
+                'login', description="로그인 화면 전환"
+            )
+            self.waiter.settled('page_load')
             print("✓ 로그인 완료")
             return True
             
@@ -574,21 +1176,133 @@ class HotelCMSController:
             traceback.print_exc()
             return False
     
+    @profiled_phase('navigate')
     def navigate_to_cms(self):
         """CMS 페이지로 이동"""
-        self.driver.get(config.CMS_URL)
-        print(f"✓ CMS 페이지 접속: {config.CMS_URL}")
-        time.sleep(3)  # 페이지 로드 대기
+        elapsed = self.open_page(config.CMS_URL)
+        print(f"✓ CMS 페이지 접속: {config.CMS_URL} ({elapsed:.2f}s)")
     
+    def save_session(self, path=None):
+        """로그인된 세션(쿠키 + localStorage/sessionStorage)을 파일로 저장"""
+        path = path or config.SESSION_FILE
+        try:
+            session = {
+                'saved_at': datetime.now().isoformat(timespec='seconds'),
+                'url': self.driver.current_url,
+                'cookies': self.driver.get_cookies(),
+                'storage': self.driver.execute_script(READ_WEB_STORAGE_JS),
+            }
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(session, f, ensure_ascii=False)
+            try:
+                os.chmod(path, 0o600)  # 인증 정보이므로 본인만 읽기
+            except OSError:
+                pass
+            print(f"  ✓ 세션 저장: {path}")
+            return True
+        except Exception as e:
+            print(f"  ⚠ 세션 저장 실패: {e}")
+            return False
+
+    @profiled_phase('login')
+    def restore_session(self, path=None):
+        """
+        저장된 세션을 현재 브라우저에 복원 후 유효성 확인
+
+        CMS 페이지(navigate_to_cms)에 접속한 상태에서 호출해야 쿠키 도메인이 일치합니다.
+        """
+        path = path or config.SESSION_FILE
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, encoding='utf-8') as f:
+                session = json.load(f)
+
+            now = time.time()
+            restored = 0
+            for cookie in session.get('cookies', []):
+                if cookie.get('expiry') and cookie['expiry'] < now:
+                    continue
+                cookie = {k: v for k, v in cookie.items() if k in SESSION_COOKIE_KEYS}
+                try:
+                    self.driver.add_cookie(cookie)
+                    restored += 1
+                except Exception:
+                    continue
+            self.driver.execute_script(WRITE_WEB_STORAGE_JS, session.get('storage') or {})
+            print(f"  → 저장된 세션 복원 ({session.get('saved_at')}, 쿠키 {restored}개)")
+
+            # 앱 화면을 다시 열어 세션이 살아 있는지 확인
+            self.open_page(config.CMS_URL)
+            return self.is_session_valid()
+        except Exception as e:
+            print(f"  ⚠ 세션 복원 실패: {e}")
+            return False
+
+    def is_session_valid(self):
+        """현재 화면이 로그인된 앱 화면인지 확인 (로그인 폼이 보이면 만료)"""
+        state = self.waiter.until(
+            lambda d: ('login' if d.find_elements(By.CSS_SELECTOR, "input[type='password']")
+                       else 'app' if "#/app" in d.current_url else None),
+            'login', description="로그인 상태 확인"
+        )
+        return state == 'app'
+
+    def ensure_logged_in(self, save=True):
+        """저장된 세션을 먼저 복원하고, 만료된 경우에만 로그인 (성공 시 세션 저장)"""
+        if config.SESSION_REUSE and self.restore_session():
+            print("✓ 저장된 세션으로 로그인 생략")
+            return True
+        if not self.login():
+            return False
+        if config.SESSION_REUSE and save:
+            self.save_session()
+        return True
+
+    def setup_http_backend(self):
+        """
+        HTTP 백엔드 준비: 로그인된 브라우저(없으면 저장된 세션 파일)의 쿠키를 API 세션에 등록
+
+        Returns:
+            성공 여부 (실패 시 화면 조작 방식 유지)
+        """
+        from cms_http_client import CMSHttpClient, endpoints_ready
+
+        ready, reason = endpoints_ready()
+        if not ready:
+            print(f"  ⚠ HTTP 백엔드를 사용할 수 없음 - 화면 조작 방식으로 진행: {reason}")
+            return False
+        try:
+            client = CMSHttpClient()
+            if self.driver:
+                count = self._import_browser_cookies(client)
+            else:
+                count = client.load_session_file()
+            client.relogin = self.refresh_http_session
+            self.http_client = client
+            self.profiler.wrap_sleep(client)
+            print(f"✓ HTTP 백엔드 사용: {client.base_url} (쿠키 {count}개)")
+            return True
+        except Exception as e:
+            print(f"  ⚠ HTTP 백엔드 준비 실패 - 화면 조작 방식으로 진행: {e}")
+            return False
+
+    def _import_browser_cookies(self, client):
+        """로그인된 브라우저의 쿠키/웹 스토리지(토큰)를 HTTP 클라이언트 세션에 등록 (이전 쿠키는 지움)"""
+        client.session.cookies.clear()
+        storage = self.driver.execute_script(READ_WEB_STORAGE_JS)
+        return client.import_browser_session(self.driver, storage)
+
+    @profiled_phase('navigate')
     def navigate_to_inventory_page(self, date_str=None, do_select_rooms=True):
         """인벤토리 관리_객실별 페이지로 이동"""
         try:
             print("\n📋 인벤토리 관리 페이지로 이동 중...")
             # 직접 URL로 이동
-            inventory_url = "https://wingscms.com/#/app/cm/cm03_0300"
-            self.driver.get(inventory_url)
-            print(f"  ✓ 인벤토리 관리_객실별 페이지 이동: {inventory_url}")
-            time.sleep(3)  # 페이지 로드 대기
+            inventory_url = cms_page_url(INVENTORY_PAGE)
+            elapsed = self.open_page(inventory_url)
+            self.waiter.element((By.ID, "startDatePicker"), 'page_load')  # 페이지 로드 대기
+            print(f"  ✓ 인벤토리 관리_객실별 페이지 이동: {inventory_url} ({elapsed:.2f}s)")
 
             # 입력받은 시작일이 없으면 오늘 날짜로 셋팅
             if not date_str or str(date_str).strip() == "":
@@ -604,74 +1318,162 @@ class HotelCMSController:
             traceback.print_exc()
             return False
     
-    def set_date(self, date_str):
-        """날짜 설정 (형식: YYYY-MM-DD)"""
+    @profiled_phase('set_date')
+    def set_date(self, date_str, mode=None):
+        """
+        날짜 설정 (형식: YYYY-MM-DD)
+
+        Args:
+            date_str: 설정할 날짜
+            mode: 'direct'(입력 필드에 값 직접 설정) 또는 'calendar'(달력 클릭). 기본값은 config.DATE_SET_MODE
+        """
+        mode = mode or config.DATE_SET_MODE
         try:
             print(f"\n📅 날짜 설정 중: {date_str}")
-            
-            # 날짜 입력 필드 찾기 및 클릭
-            date_input = self.wait.until(
-                EC.element_to_be_clickable((By.ID, "startDatePicker"))
-            )
-            date_input.click()
-            print("  ✓ 달력 열기")
-            time.sleep(1)
-            
+            datetime.strptime(date_str, "%Y-%m-%d")  # 형식 검증
 
-            # 입력받은 날짜 파싱
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            target_year = str(dt.year)
-            target_month = dt.strftime("%B")  # 영어 월명
-            target_day = str(dt.day)
-
-            # 달력 네비게이션으로 목표 년월로 이동
-            max_clicks = 50
-            clicks = 0
-            print(f"  달력을 {target_year}년 {target_month}로 이동 중...")
-            while clicks < max_clicks:
-                try:
-                    current_month_year = self.driver.find_element(
-                        By.CSS_SELECTOR,
-                        ".react-datepicker__current-month"
-                    ).text
-                    print(f"    현재: {current_month_year}")
-                    if target_month in current_month_year and target_year in current_month_year:
-                        print(f"  ✓ 목표 도달: {current_month_year}")
-                        break
-                    next_button = self.driver.find_element(
-                        By.CSS_SELECTOR,
-                        ".react-datepicker__navigation--next"
-                    )
-                    next_button.click()
-                    time.sleep(0.5)
-                    clicks += 1
-                except Exception as e:
-                    print(f"  ⚠ 네비게이션 중 오류: {e}")
-                    break
+            if mode == 'direct':
+                if self._set_date_direct(date_str):
+                    return True
+                print("  → 직접 입력 실패, 달력 선택으로 재시도")
+
+            return self._set_date_by_calendar(date_str)
 
-            # 해당 일(day) 클릭
-            time.sleep(0.5)
-            day_element = self.wait.until(
-                EC.element_to_be_clickable((
-                    By.XPATH,
-                    f"//div[contains(@class, 'react-datepicker__day') and not(contains(@class, 'outside-month')) and text()='{target_day}']"
-                ))
-            )
-            day_element.click()
-            print(f"  ✓ {date_str} 날짜 선택 완료")
-            time.sleep(1)
-            
-            return True
-            
         except Exception as e:
             print(f"⚠ 날짜 설정 실패: {e}")
             print("수동으로 날짜를 선택해주세요.")
             import traceback
             traceback.print_exc()
             return False
+
+    def _read_date_input(self):
+        try:
+            return self.driver.find_element(By.ID, "startDatePicker").get_attribute("value")
+        except Exception:
+            return None
+
+    def _set_date_direct(self, date_str):
+        """startDatePicker에 값을 직접 설정하고 다시 읽어 확인 (날짜 거리와 무관하게 일정한 비용)"""
+        date_input = self.waiter.element((By.ID, "startDatePicker"), 'calendar')
+        if not date_input:
+            return False
+        if self._read_date_input() == date_str:
+            print(f"  ✓ {date_str} 이미 선택되어 있음")
+            return True
+
+        # 1차: 네이티브 value setter + input/change 이벤트 (react-datepicker가 입력값을 파싱)
+        self.driver.execute_script(SET_DATE_INPUT_JS, date_input, date_str)
+        if self._confirm_date(date_str):
+            print(f"  ✓ {date_str} 날짜 직접 입력 완료")
+            return True
+
+        # 2차: 키 입력 + Enter
+        try:
+            date_input.click()
+            date_input.send_keys(Keys.CONTROL, "a")
+            date_input.send_keys(date_str)
+            date_input.send_keys(Keys.ENTER)
+        except Exception as e:
+            print(f"  ⚠ 날짜 키 입력 실패: {e}")
+            return False
+        if self._confirm_date(date_str):
+            print(f"  ✓ {date_str} 날짜 키 입력 완료")
+            return True
+        return False
+
+    def _confirm_date(self, date_str):
+        """입력 필드 값이 목표 날짜로 바뀌었는지 확인하고 달력 팝업을 닫음"""
+        confirmed = self.waiter.until(
+            lambda d: self._read_date_input() == date_str, 'calendar', description="날짜 입력 확인"
+        )
+        if not confirmed:
+            print(f"  ⚠ 날짜 확인 불일치: 기대={date_str}, 실제={self._read_date_input()}")
+            return False
+        if self.driver.find_elements(By.CSS_SELECTOR, ".react-datepicker-popper"):
+            self.driver.execute_script(CLOSE_DATEPICKER_JS)
+        self.waiter.dom_quiet('calendar')
+        return True
+
+    @staticmethod
+    def _parse_calendar_month(text):
+        """달력 헤더("November 2026", "Nov 2026", "2026년 11월", "2026.11")를 (년, 월)로 변환"""
+        text = (text or "").strip()
+        match = re.search(r"(\d{4})\s*년\s*(\d{1,2})\s*월", text) or re.search(r"(\d{4})[.\-/](\d{1,2})", text)
+        if match:
+            return int(match.group(1)), int(match.group(2))
+        year = re.search(r"\d{4}", text)
+        lowered = text.lower()
+        for month in range(1, 13):
+            name = datetime(2000, month, 1).strftime("%B").lower()
+            if name in lowered or re.search(rf"\b{name[:3]}\b", lowered):
+                return (int(year.group()) if year else None), month
+        return None, None
+
+    def _set_date_by_calendar(self, date_str):
+        """달력을 열어 목표 월까지 앞/뒤로 이동한 후 일(day) 클릭"""
+        # 날짜 입력 필드 찾기 및 클릭
+        date_input = self.wait.until(
+            EC.element_to_be_clickable((By.ID, "startDatePicker"))
+        )
+        date_input.click()
+        self.waiter.visible((By.CSS_SELECTOR, ".react-datepicker__current-month"), 'calendar')
+        print("  ✓ 달력 열기")
+
+        # 입력받은 날짜 파싱
+        dt = datetime.strptime(date_str, "%Y-%m-%d")
+        target_day = str(dt.day)
+
+        # 달력 네비게이션으로 목표 년월로 이동 (앞/뒤 모두 가능)
+        max_clicks = 50
+        clicks = 0
+        print(f"  달력을 {dt.year}년 {dt.month}월로 이동 중...")
+        while clicks < max_clicks:
+            try:
+                current_month_year = self.driver.find_element(
+                    By.CSS_SELECTOR,
+                    ".react-datepicker__current-month"
+                ).text
+                year, month = self._parse_calendar_month(current_month_year)
+                if year is None or month is None:
+                    print(f"  ⚠ 달력 헤더를 해석할 수 없음: {current_month_year}")
+                    break
+                diff = (dt.year - year) * 12 + (dt.month - month)
+                print(f"    현재: {current_month_year}")
+                if diff == 0:
+                    print(f"  ✓ 목표 도달: {current_month_year}")
+                    break
+                direction = "next" if diff > 0 else "previous"
+                nav_button = self.driver.find_element(
+                    By.CSS_SELECTOR,
+                    f".react-datepicker__navigation--{direction}"
+                )
+                nav_button.click()
+                # 달력 헤더가 바뀔 때까지 대기
+                self.waiter.until(
+                    lambda d: d.find_element(By.CSS_SELECTOR, ".react-datepicker__current-month").text != current_month_year,
+                    'calendar', description="달력 월 이동"
+                )
+                clicks += 1
+            except Exception as e:
+                print(f"  ⚠ 네비게이션 중 오류: {e}")
+                break
+
+        # 해당 일(day) 클릭
+        day_element = self.wait.until(
+            EC.element_to_be_clickable((
+                By.XPATH,
+                f"//div[contains(@class, 'react-datepicker__day') and not(contains(@class, 'outside-month')) and text()='{target_day}']"
+            ))
+        )
+        day_element.click()
+        print(f"  ✓ {date_str} 날짜 선택 완료")
+        self.waiter.dom_quiet('calendar')
+
+        return True
     
+    @profiled_phase('select_all_rooms')
     def select_all_rooms(self):
-        """Single Room, Twin Room, Triple Room만 선택"""
+        """config.ROOM_TYPES의 방 이름만 선택 (숙소별 방 타입 설정을 따름)"""
         try:
             print("\n🏨 호텔 객실 선택 중...")
             
@@ -680,8 +1482,8 @@ class HotelCMSController:
                 EC.element_to_be_clickable((By.ID, "hotelRoomSearch__button__button"))
             )
             dropdown_button.click()
+            self.waiter.element((By.XPATH, "//div[@role='option' and contains(@id, 'hotelRoomSearch-option-')]"), 'dropdown')
             print("  ✓ 객실 선택 드롭다운 열기")
-            time.sleep(1.5)
             
             # 먼저 모든 옵션 찾기 (전체 체크 해제용)
             all_options = self.driver.find_elements(By.XPATH, "//div[@role='option' and contains(@id, 'hotelRoomSearch-option-')]")
@@ -697,12 +1499,13 @@ class HotelCMSController:
                     option_text = option.text
                     self.driver.execute_script("arguments[0].click();", option)
                     print(f"  → '{option_text}' 체크 해제")
-                    time.sleep(0.3)
             
-            time.sleep(1)
+            self.waiter.dom_quiet('dropdown')
             
-            # Single Room, Twin Room, Double Room, Triple Room 선택
-            target_rooms = ["Single Room", "Twin Room", "Double Room", "Triple Room"]
+            # 자동조정 대상 방 타입 선택
+            target_rooms = list(config.ROOM_TYPES.values())
+            selected_rooms = []
+            missing_rooms = []
             
             for room_name in target_rooms:
                 try:
@@ -720,14 +1523,15 @@ class HotelCMSController:
                     if is_selected != "true" and (not data_selected or data_selected == ""):
                         self.driver.execute_script("arguments[0].click();", room_option)
                         print(f"  ✓ {room_name} 선택")
-                        time.sleep(0.5)
                     else:
                         print(f"  ✓ {room_name} 이미 선택됨")
+                    selected_rooms.append(room_name)
                         
                 except Exception as e:
                     print(f"  ⚠ {room_name} 선택 실패: {e}")
+                    missing_rooms.append(room_name)
             
-            time.sleep(1)
+            self.waiter.dom_quiet('dropdown')
             
             # 조회 버튼 클릭
             search_button = self.wait.until(
@@ -735,9 +1539,12 @@ class HotelCMSController:
             )
             search_button.click()
             print("  ✓ 조회 버튼 클릭 - 방 목록 로딩 중...")
-            time.sleep(3)  # 방 목록이 로드될 때까지 대기
+            self.waiter.grid_rendered('search')  # 방 목록이 로드될 때까지 대기
             
-            print("✅ Single Room, Twin Room, Triple Room 목록이 표시되었습니다!")
+            if selected_rooms:
+                print(f"✅ {', '.join(selected_rooms)} 목록이 표시되었습니다!")
+            if missing_rooms:
+                print(f"⚠ 객실 목록에서 찾지 못한 방 타입: {', '.join(missing_rooms)} (config.ROOM_TYPES 확인)")
             
             # 필터 설정 (필수)
             self.apply_filter()
@@ -751,6 +1558,7 @@ class HotelCMSController:
             traceback.print_exc()
             return False
     
+    @profiled_phase('apply_filter')
     def apply_filter(self):
         """필터에서 판매가능객실만 선택 (재시도 로직 포함)"""
         print("\n🔍 필터 설정 시도 중...")
@@ -760,7 +1568,7 @@ class HotelCMSController:
             try:
                 if attempt > 0:
                     print(f"  ⟳ 재시도 {attempt}/{max_retries-1}...")
-                    time.sleep(3)
+                    self.waiter.settled('page_load')
                 
                 # 1단계: 필터 아이콘 클릭하여 사이드 패널 열기
                 try:
@@ -773,10 +1581,11 @@ class HotelCMSController:
                     )
                 
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", filter_button)
-                time.sleep(1)
                 self.driver.execute_script("arguments[0].click();", filter_button)
                 print("  ✓ 필터 패널 열기")
-                time.sleep(3)  # 패널이 완전히 열릴 때까지 대기
+                # 패널이 완전히 열릴 때까지 대기
+                self.waiter.visible((By.ID, "COMN_CN__button__button"), 'dropdown')
+                self.waiter.dom_quiet('dropdown')
                 
                 # 2단계: 노출정보 드롭다운 클릭
                 exposure_dropdown = self.wait.until(
@@ -784,7 +1593,7 @@ class HotelCMSController:
                 )
                 self.driver.execute_script("arguments[0].click();", exposure_dropdown)
                 print("  ✓ 노출정보 드롭다운 열기")
-                time.sleep(2)
+                self.waiter.element((By.ID, "COMN_CN-option-0"), 'dropdown')
                 
                 # 3단계: 모든 체크박스 해제 후 "판매가능객실"만 체크
                 # 먼저 모든 옵션 찾기
@@ -801,9 +1610,8 @@ class HotelCMSController:
                         option_text = option.text
                         self.driver.execute_script("arguments[0].click();", option)
                         print(f"  → '{option_text}' 체크 해제")
-                        time.sleep(0.3)
                 
-                time.sleep(1)
+                self.waiter.dom_quiet('dropdown')
                 
                 # "판매가능객실"만 체크
                 sales_room_option = self.wait.until(
@@ -816,10 +1624,9 @@ class HotelCMSController:
                 if is_selected != "true" and (not data_selected or data_selected == ""):
                     self.driver.execute_script("arguments[0].click();", sales_room_option)
                     print("  ✓ 판매가능객실 체크")
-                    time.sleep(2)
+                    self.waiter.dom_quiet('dropdown')
                 else:
                     print("  ✓ 판매가능객실 이미 체크됨")
-                    time.sleep(1)
                 
                 # 4단계: 검색 버튼 클릭 (여러 방법 시도)
                 search_button = None
@@ -847,7 +1654,6 @@ class HotelCMSController:
                 
                 # 스크롤하여 버튼이 보이도록
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", search_button)
-                time.sleep(1)
                 
                 # 여러 방법으로 클릭 시도
                 try:
@@ -857,356 +1663,560 @@ class HotelCMSController:
                     self.driver.execute_script("arguments[0].click();", search_button)
                     print("  ✓ 검색 버튼 클릭 (JavaScript)")
                 
-                time.sleep(5)  # 결과 로딩 충분히 대기
+                # 결과 그리드가 다시 그려질 때까지 대기
+                if not self.waiter.grid_rendered('search'):
+                    raise TimeoutError("필터 적용 후 그리드가 표시되지 않았습니다")
                 
                 print("✅ 필터 적용 완료 - 판매가능객실만 표시됨!")
                 return True
                 
             except Exception as e:
-                print(f"  ✗ 시도 실패: {e}")
-                if attempt == max_retries - 1:
-                    print(f"\n❌ 필터 적용 {max_retries}회 시도 후 실패")
-                    raise Exception(f"필터 적용 실패 - 입력칸이 생성되지 않아 작업을 계속할 수 없습니다: {e}")
-                continue
-        
-        return False
-    
-    def calculate_available_rooms(self, room_type, remaining, booked, max_count):
+                print(f"  ✗ 시도 실패: {e}")
+                if attempt == max_retries - 1:
+                    print(f"\n❌ 필터 적용 {max_retries}회 시도 후 실패")
+                    raise Exception(f"필터 적용 실패 - 입력칸이 생성되지 않아 작업을 계속할 수 없습니다: {e}")
+                continue
+        
+        return False
+    
+    def calculate_available_rooms(self, room_type, remaining, booked, max_count):
+        """
+        판매가능객실 수량 계산 (셀 하나, 규칙표는 config.AVAILABILITY_RULES)
+        
+        Args:
+            room_type: 'SINGLE', 'TWIN', 'TRIPLE'
+            remaining: 잔여 수
+            booked: 예약 수
+            max_count: 최대 수량 (잔여/예약을 읽지 못한 셀의 대체값 계산에 사용)
+        
+        Returns:
+            판매가능객실 수량 (None이면 빈칸 = 모두 오픈), 또는 'ALERT:메시지'
+        """
+        if remaining is None or booked is None:
+            remaining, booked = max_count, 0
+        val = self.availability_rules.evaluate_cell(room_type, remaining, booked)
+        print(f"[정책결과] room_type={room_type}, remaining={remaining}, booked={booked} => {val}")
+        return val
+    
+    @profiled_phase('read')
+    def read_inventory_grid_snapshot(self, expand=True, window_start=None):
+        """
+        인벤토리 그리드(cm03_0300) 전체를 한 번의 스크립트 호출로 읽기
+
+        Args:
+            expand: 접혀 있는 방 타입을 펼친 뒤 다시 읽을지 여부
+            window_start: HTTP 백엔드에서 조회할 윈도우 시작일 (화면 조작 시에는 화면의 시작일 사용)
+
+        Returns:
+            {'start_date': 'YYYY-MM-DD',
+             'rooms': {방 이름: {'found': bool, 'expanded': bool,
+                               'dates': {날짜: {'col', 'remaining', 'booked', 'value', 'disabled'}}}}}
+            날짜 dict는 화면 컬럼 순서를 유지하며, 'col'이 입력 필드 위치(locator)입니다.
+        """
+        room_names = list(config.ROOM_TYPES.values())
+        if self.http_client:
+            return self.http_client.read_inventory_window(window_start, INVENTORY_WINDOW_DAYS, room_names)
+
+        raw = self.driver.execute_script(INVENTORY_GRID_SNAPSHOT_JS, room_names, SALES_ROW_LABEL)
+
+        collapsed = [name for name, room in raw['rooms'].items() if room['found'] and not room['expanded']]
+        if expand and collapsed:
+            self.driver.execute_script(EXPAND_ROOMS_JS, collapsed, SALES_ROW_LABEL)
+            print(f"  ✓ 하위 메뉴 펼침: {', '.join(collapsed)}")
+
+            # 펼친 방 타입의 판매가능객실 입력 필드가 나타날 때까지 대기
+            def expanded_snapshot(driver):
+                snap = driver.execute_script(INVENTORY_GRID_SNAPSHOT_JS, room_names, SALES_ROW_LABEL)
+                return snap if all(snap['rooms'][name]['cells'] for name in collapsed) else None
+
+            raw = (self.waiter.until(expanded_snapshot, 'expand', description="하위 메뉴 펼침")
+                   or self.driver.execute_script(INVENTORY_GRID_SNAPSHOT_JS, room_names, SALES_ROW_LABEL))
+
+        return self._index_grid_snapshot(raw)
+
+    @staticmethod
+    def _index_grid_snapshot(raw):
+        """스크립트 결과의 컬럼 목록을 날짜 키 dict로 변환"""
+        start_date = raw.get('start_date')
+        try:
+            base_date = datetime.strptime(start_date, "%Y-%m-%d")
+        except (TypeError, ValueError):
+            base_date = None
+
+        rooms = {}
+        for room_name, room in raw.get('rooms', {}).items():
+            dates = {}
+            for cell in room.get('cells', []):
+                col = cell['col']
+                if base_date:
+                    date_key = (base_date + timedelta(days=col)).strftime("%Y-%m-%d")
+                else:
+                    date_key = f"#{col + 1}"
+                dates[date_key] = cell
+            rooms[room_name] = {
+                'found': room.get('found', False),
+                'expanded': room.get('expanded', False),
+                'dates': dates,
+            }
+        return {'start_date': start_date, 'rooms': rooms}
+
+    def set_room_availability_by_date(self, window_start=None):
+        """날짜별로 각 방 타입의 판매가능객실 설정 (현재 윈도우를 계획 → 변경이 있을 때만 입력/저장)"""
+        plan = self.plan_inventory_window(window_start)
+        if plan is None:
+            return {}
+        self.apply_inventory_window(plan)
+        return plan['results']
+
+    def plan_inventory_window(self, window_start=None):
+        """
+        현재 윈도우의 그리드 스냅샷을 읽고 변경 계획 작성 (읽기 전용)
+
+        Returns:
+            {'window_start', 'changes': [...], 'alerts': [...], 'results': {방 이름: bool}}, 실패 시 None
+        """
+        try:
+            print("\n🏨 판매가능객실 변경 계획 작성 중...")
+            if not self.http_client:
+                self.waiter.grid_rendered('search')
+
+            started = time.time()
+            snapshot = self.read_inventory_grid_snapshot(window_start=window_start)
+            print(f"  ✓ 그리드 스냅샷 읽기 완료 ({(time.time() - started) * 1000:.0f}ms)")
+            window_start = window_start or snapshot.get('start_date')
+
+            if self.snapshot_store and config.SNAPSHOT_SKIP_UNCHANGED:
+                alerts = self.snapshot_store.unchanged_alerts(
+                    window_start, window_hash(snapshot, self._rules_signature))
+                if alerts is not None:
+                    print("  ✓ 지난 실행 이후 잔여/예약/판매가능객실 변화 없음 - 규칙 평가 생략")
+                    return {'window_start': window_start, 'changes': [], 'alerts': alerts, 'unchanged': True,
+                            'results': {name: room['found'] for name, room in snapshot['rooms'].items()}}
+
+            self.record_observation(snapshot)
+            plan = self.plan_room_availability(snapshot)
+            plan['window_start'] = window_start
+            plan['snapshot'] = snapshot
+            if not plan['changes']:
+                self.record_window_snapshot(plan)
+            return plan
+        except Exception as e:
+            print(f"❌ 판매가능객실 계획 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+
+    @profiled_phase('plan')
+    def plan_room_availability(self, snapshot):
+        """
+        그리드 스냅샷으로 방 타입×날짜별 변경 계획 계산 (화면/CMS는 건드리지 않음)
+
+        Returns:
+            {'changes': [{'room_key', 'room_name', 'col', 'date', 'value', 'old_value', 'remaining', 'booked'}],
+             'alerts': [{'room_name', 'date', 'message'}],
+             'results': {방 이름: 행 발견 여부}}
+        """
+        results = {}
+        changes = []
+        alerts = []
+
+        # 1) 방 타입×날짜 잔여/예약 행렬 구성
+        planned_rooms = []
+        for room_key, room_name in config.ROOM_TYPES.items():
+            max_count = config.ROOM_MAX_COUNT.get(room_key, 10)
+            room = snapshot['rooms'].get(room_name)
+            if not room or not room['found']:
+                print(f"  ❌ {room_name} 행을 찾을 수 없음")
+                results[room_name] = False
+                continue
+            if not room['dates']:
+                print(f"  ⚠ {room_name}의 판매가능객실 행을 찾을 수 없음")
+                results[room_name] = False
+                continue
+            planned_rooms.append((room_key, room_name, max_count, room['dates']))
+
+        remaining = pd.DataFrame(
+            {room_key: {d: (max_count if c['remaining'] is None or c['booked'] is None else c['remaining'])
+                        for d, c in dates.items()}
+             for room_key, _, max_count, dates in planned_rooms}
+        ).T
+        booked = pd.DataFrame(
+            {room_key: {d: (0 if c['remaining'] is None or c['booked'] is None else c['booked'])
+                        for d, c in dates.items()}
+             for room_key, _, max_count, dates in planned_rooms}
+        ).T
+
+        # 2) 규칙표를 전체 행렬에 한 번에 적용
+        evaluated = None
+        if planned_rooms:
+            started = time.time()
+            evaluated = self.availability_rules.evaluate(
+                list(remaining.index), remaining.to_numpy(dtype=float), booked.to_numpy(dtype=float))
+            print(f"  ✓ 규칙 평가 완료: {remaining.shape[0]}개 방 타입 × {remaining.shape[1]}일 ({(time.time() - started) * 1000:.1f}ms)")
+        date_cols = {d: i for i, d in enumerate(remaining.columns)}
+
+        # 3) 현재 값과 비교해 변경 목록 작성
+        for row, (room_key, room_name, max_count, dates) in enumerate(planned_rooms):
+            print(f"\n📝 {room_name} 처리 중 (최대: {max_count}개)")
+            print(f"  → {room_name}의 판매가능객실 행 발견: {len(dates)}개 입력 필드")
+
+            count = 0
+            alert_count = 0
+            skip_count = 0
+            for real_date, cell in dates.items():
+                idx = cell['col']
+                current_value = cell['value']
+                col = date_cols[real_date]
+                cell_remaining = int(remaining.iat[row, col])
+                cell_booked = int(booked.iat[row, col])
+                if cell['remaining'] is None or cell['booked'] is None:
+                    print(f"[잔여/예약 진단] idx={idx+1}, room={room_key}, 잔여/예약 파싱 실패")
+                elif idx < 3:
+                    print(f"    [{idx+1}] 전여:{cell_remaining}, 예약:{cell_booked}")
+
+                # 판매가능객실 수량 (규칙 평가 결과)
+                available = self.availability_rules.cell_value(
+                    evaluated, row, col, room_key, cell_remaining, cell_booked)
+
+                # ALERT 메시지 처리
+                if isinstance(available, str) and available.startswith('ALERT:'):
+                    alert_msg = available.replace('ALERT:', '')
+                    print(f"    [{idx+1}] ⚠️ {alert_msg}")
+                    alerts.append({'room_name': room_name, 'date': real_date, 'message': alert_msg})
+                    alert_count += 1
+                    continue
+
+                # ★ 빈칸→빈칸이면 완전 생략
+                if (current_value is None or str(current_value).strip() == "") and available is None:
+                    skip_count += 1
+                    if skip_count <= 3:
+                        print(f"    [{idx+1}] ✓ 건너뛰기: 빈칸→빈칸 (예약:{cell_booked})")
+                    count += 1
+                    continue
+
+                # 값이 있고 정책 기대값과 같으면 건너뛰기
+                if current_value and str(current_value).strip():
+                    try:
+                        existing_val = int(current_value)
+                        if available is not None and existing_val == available:
+                            skip_count += 1
+                            if skip_count <= 3:
+                                print(f"    [{idx+1}] ✓ 건너뛰기: {existing_val} (정책 기대값과 동일)")
+                            count += 1
+                            continue
+                    except ValueError:
+                        pass
+
+                print(f"    [{idx+1}] {real_date}: {current_value or '빈칸'} → {'빈칸' if available is None else available}"
+                      f" ({self.availability_rules.describe(evaluated['rule'][row, col])})")
+                changes.append({
+                    'room_key': room_key,
+                    'room_name': room_name,
+                    'col': idx,
+                    'date': real_date,
+                    'value': available,
+                    'old_value': current_value,
+                    'remaining': cell_remaining,
+                    'booked': cell_booked,
+                })
+                count += 1
+
+            print(f"  ✓ {room_name}: {count}개 처리 (변경: {count - skip_count}개, 건너뛰기: {skip_count}개)")
+            if alert_count > 0:
+                print(f"  ⚠️ {room_name}: {alert_count}개 알림 - 수동 확인 필요")
+            results[room_name] = True
+
+        return {'changes': changes, 'alerts': alerts, 'results': results}
+
+    def apply_inventory_window(self, plan, window_start=None):
+        """
+        계획된 변경을 현재 윈도우에 입력하고 저장 (변경이 없으면 저장/확인 팝업 생략)
+
+        Args:
+            window_start: 지정하면 저장 후 저널 기록에 성공했을 때 해당 윈도우를 완료로 기록
+
+        Returns:
+            저장까지 진행했으면 True
+        """
+        changes = plan['changes']
+        if not changes:
+            print("\n✓ 변경 없음 - 저장 생략")
+            return False
+
+        # 변경된 셀만 한 번에 입력
+        written = self.apply_availability_changes(changes)
+
+        # 저장 버튼 클릭 및 확인
+        saved = self.save_inventory()
+        if saved and self.http_client:
+            # HTTP 백엔드는 저장 응답에서 실패한 셀이 있으면 저장 실패로 처리 (저장 요청은 재시도하지 않음)
+            failed = [key for key, result in written.items() if not result['ok']]
+            if failed:
+                print(f"  ❌ API 저장 실패 {len(failed)}개: {', '.join(failed[:5])}{' 외' if len(failed) > 5 else ''}")
+                saved = False
+        if saved:
+            print("✅ 저장 완료!")
+        else:
+            print("⚠ 저장이 확인되지 않음 - 변경은 저장되지 않은 것으로 기록")
+            self.forget_window_snapshot(plan.get('window_start'))
+
+        # 저장 후 윈도우를 한 번 다시 읽어 반영되지 않은 셀만 재입력
+        verified_snapshot = None
+        if saved and config.VERIFY_AFTER_SAVE:
+            verified_snapshot = self.verify_inventory_window(plan)
+
+        # 저장 직후 변경 저널에 기록 (실제 값이 바뀌는 셀만)
+        recorded = [
+            change for change in changes
+            if str(change['old_value']) != ("" if change['value'] is None else str(change['value']))
+        ]
+        self.io.submit("변경 저널 기록", self._record_window_changes, recorded, saved,
+                       window_start if saved else None)
+        if saved:
+            self.record_window_snapshot(plan, verified_snapshot)
+        return saved
+
+    def verify_inventory_window(self, plan):
+        """
+        저장 후 검증: 윈도우 전체를 한 번 다시 읽어 계획과 비교하고, 반영되지 않은 셀만 한 번 재입력/저장
+
+        결과는 plan['verification'] = {'verified', 'retried', 'failed'}에 기록
+
+        Returns:
+            모든 셀이 반영된 윈도우 스냅샷 (미반영 셀이 남거나 다시 읽지 못하면 None)
+        """
+        changes = plan['changes']
+        try:
+            snapshot = self._reread_inventory_window(plan['window_start'])
+        except Exception as e:
+            print(f"  ⚠ 저장 확인 실패 (다시 읽기): {e}")
+            plan['verification'] = {'verified': 0, 'retried': 0, 'failed': len(changes)}
+            self.forget_window_snapshot(plan['window_start'])
+            return None
+
+        missed = self._unsaved_changes(changes, snapshot)
+        retried = len(missed)
+        if missed:
+            print(f"  ⚠ 저장 후 미반영 셀 {len(missed)}개 → 해당 셀만 재입력")
+            try:
+                self.apply_availability_changes(missed)
+                if self.save_inventory():
+                    snapshot = self._reread_inventory_window(plan['window_start'])
+                    missed = self._unsaved_changes(missed, snapshot)
+            except Exception as e:
+                print(f"  ⚠ 미반영 셀 재입력 실패: {e}")
+
+        plan['verification'] = {'verified': len(changes) - len(missed), 'retried': retried, 'failed': len(missed)}
+        print(f"🔎 저장 확인: {len(changes) - len(missed)}/{len(changes)}개 반영 (재입력 {retried}개, 미반영 {len(missed)}개)")
+        for change in missed:
+            print(f"    ❌ {change['date']} {change['room_name']}: 기대={self._expected_cell_value(change) or '빈칸'}, "
+                  f"실제={change['actual'] if change['actual'] is not None else '없음'}")
+        if missed:
+            self.forget_window_snapshot(plan['window_start'])
+            return None
+        return snapshot
+
+    def _reread_inventory_window(self, window_start):
+        """저장 후 현재 윈도우를 다시 조회해 스냅샷으로 읽기 (접힌 방 타입은 펼침)"""
+        if not self.http_client:
+            self.search_rooms_by_date()
+        return self.read_inventory_grid_snapshot(window_start=window_start)
+
+    @staticmethod
+    def _expected_cell_value(change):
+        return "" if change['value'] is None else str(change['value'])
+
+    def _unsaved_changes(self, changes, snapshot):
+        """스냅샷 값이 계획 값과 다른 변경 목록 (각 항목에 'actual' 추가)"""
+        missed = []
+        for change in changes:
+            cell = snapshot['rooms'].get(change['room_name'], {}).get('dates', {}).get(change['date'])
+            actual = None if cell is None else ("" if cell['value'] is None else str(cell['value']).strip())
+            if actual != self._expected_cell_value(change):
+                missed.append(dict(change, actual=actual))
+        return missed
+
+    def record_observation(self, snapshot):
+        """규칙 평가 전에 읽은 윈도우 값을 이번 실행 ID로 관측 이력에 기록 (규칙 백테스트용)"""
+        if not self.snapshot_store:
+            return
+        try:
+            self.snapshot_store.observe(self.change_journal.run_id, snapshot)
+        except Exception as e:
+            print(f"  ⚠ 관측 이력 기록 실패: {e}")
+
+    def forget_window_snapshot(self, window_start):
+        """저장/확인에 실패한 윈도우의 해시 삭제 (다음 실행에서 '변화 없음'으로 생략되지 않도록)"""
+        if not self.snapshot_store or not window_start:
+            return
+        try:
+            self.snapshot_store.forget(window_start)
+        except Exception as e:
+            print(f"  ⚠ 스냅샷 저장소 기록 삭제 실패: {e}")
+
+    def record_window_snapshot(self, plan, verified_snapshot=None):
         """
-        판매가능객실 수량 계산
-        
+        윈도우의 (저장 후) 상태와 알림을 스냅샷 저장소에 기록
+        (저장 확인에서 미반영 셀이 남은 윈도우는 다음 실행에서 다시 평가하도록 기록하지 않음)
+        """
+        if not self.snapshot_store or 'snapshot' not in plan:
+            return
+        if plan.get('verification', {}).get('failed'):
+            return
+        try:
+            applied = verified_snapshot or applied_snapshot(plan['snapshot'], plan['changes'])
+            self.snapshot_store.record(plan['window_start'], applied,
+                                       window_hash(applied, self._rules_signature), plan['alerts'])
+        except Exception as e:
+            print(f"  ⚠ 스냅샷 저장소 기록 실패: {e}")
+
+    @profiled_phase('write')
+    def apply_availability_changes(self, changes):
+        """
+        한 윈도우의 판매가능객실 변경 목록을 한 번의 스크립트 실행으로 입력
+
         Args:
-            room_type: 'SINGLE', 'TWIN', 'TRIPLE'
-            remaining: 잔여 수
-            booked: 예약 수
-            max_count: 최대 수량
-        
+            changes: [{'room_name', 'col', 'value', ...}] (value None이면 빈칸)
+
         Returns:
-            판매가능객실 수량 (None이면 빈칸 = 모두 오픈), 또는 'ALERT:메시지'
+            {'방 이름|컬럼': {'ok': bool, 'actual': 입력 후 값}} 셀별 성공 여부
         """
-        print(f"[정책진단] room_type={room_type}, remaining={remaining}, booked={booked}, max_count={max_count}")
+        if not changes:
+            return {}
 
-        if room_type in ('SINGLE', 'TWIN', 'DOUBLE'):
-            # 더블룸: 예약 3개 이상이면 모두 오픈(빈칸), 아니면 예약+2~3개(랜덤)
-            if room_type == 'DOUBLE':
-                if booked >= 3:
-                    print(f"[정책결과] => None (더블룸 예약 3 이상, 모두 오픈)")
-                    return None
-                else:
-                    val = booked + 2
-                    print(f"[정책결과] => {val} (더블룸 예약+2 고정)")
-                    return val
-
-        if room_type == 'SINGLE':
-            if remaining <= 4:
-                print(f"[정책결과] => None (싱글룸 잔여 4 이하, 모두 오픈)")
-                return None
-            val = booked + 4
-            print(f"[정책결과] => {val} (싱글룸 예약+4 고정)")
-            return val
-
-        elif room_type == 'TWIN':
-            if remaining <= 4:
-                print(f"[정책결과] => None (트윈룸 잔여 4 이하, 모두 오픈)")
-                return None
-            if remaining >= 3 and booked >= 6:
-                print(f"[정책결과] => {booked + 2} (트윈룸 잔여 3이상 & 예약 6이상, 예약+2)")
-                return booked + 2
-            if remaining >= 3 and booked < 6:
-                print(f"[정책결과] => {booked + 4} (트윈룸 잔여 3이상 & 예약 6미만, 예약+4)")
-                return booked + 4
-
-        elif room_type == 'TRIPLE':
-            if booked >= 5:
-                print(f"[정책결과] => ALERT:트리플룸 예약 {booked}건 - 수동 확인 필요")
-                return f"ALERT:트리플룸 예약 {booked}건 - 수동 확인 필요"
-            elif booked == 4:
-                print(f"[정책결과] => {booked + 1} (예약=4, +1)")
-                return booked + 1  # 5
-            else:
-                print(f"[정책결과] => {booked + 2} (예약<4, +2)")
-                return booked + 2
+        if self.http_client:
+            print(f"\n✏️ 변경 {len(changes)}개 API 저장 중...")
+            started = time.time()
+            result = self.http_client.save_availability(changes)
+            saved = sum(1 for r in result.values() if r['ok'])
+            print(f"  ✓ API 저장 완료: {saved}/{len(changes)}개 성공 ({(time.time() - started) * 1000:.0f}ms)")
+            return result
 
-        val = random.randint(2, 3)
-        print(f"[정책결과] => {val} (기본값)")
-        return val
-    
-    def set_room_availability_by_date(self):
-        from datetime import datetime, timedelta
-        run_date = datetime.now().strftime('%Y-%m-%d')
-        # 현재 날짜 추출 (달력에서 선택된 값)
+        print(f"\n✏️ 변경 {len(changes)}개 일괄 입력 중...")
+        payload = [
+            {'room': c['room_name'], 'col': c['col'], 'value': "" if c['value'] is None else str(c['value'])}
+            for c in changes
+        ]
+        started = time.time()
+        try:
+            result = self.driver.execute_script(APPLY_AVAILABILITY_JS, payload, SALES_ROW_LABEL) or {}
+        except Exception as e:
+            print(f"  ⚠ 일괄 입력 스크립트 실패: {e}")
+            result = {}
+        elapsed_ms = (time.time() - started) * 1000
+
+        failed = [c for c in changes if not result.get(f"{c['room_name']}|{c['col']}", {}).get('ok')]
+        print(f"  ✓ 일괄 입력 완료: {len(changes) - len(failed)}/{len(changes)}개 성공 ({elapsed_ms:.0f}ms)")
+
+        # 일괄 입력이 반영되지 않은 셀만 키 입력 방식으로 재시도
+        for change in failed:
+            key = f"{change['room_name']}|{change['col']}"
+            print(f"    [{change['col']+1}] {change['room_name']} 일괄 입력 실패 → 개별 입력 재시도")
+            ok = self._write_availability_cell(change)
+            result[key] = {'ok': ok, 'actual': None, 'retried': True}
+        return result
+
+    @profiled_phase('save')
+    def save_inventory(self):
+        """인벤토리 저장 버튼 클릭 후 "저장되었습니다" 팝업 확인 (확인까지 완료되면 True)"""
+        if self.http_client:
+            # HTTP 백엔드는 apply_availability_changes의 저장 요청으로 이미 반영됨
+            return True
+        print("\n💾 저장 중...")
+        save_button = self.driver.find_element(
+            By.CSS_SELECTOR,
+            "#scrollArea > div:nth-child(1) > div.app-main > div.app-main__outer > div > div > div.app-footer.fixFooter.TabsAnimation-appear.TabsAnimation-appear-active > div > div > button.btn-wide.btn-shadow.w140.btn.btn-primary.btn-lg"
+        )
+        save_button.click()
+
+        # "저장되었습니다" 팝업의 확인 버튼 클릭
+        confirm_locator = (By.XPATH, "//button[contains(@class, 'btn-primary') and contains(., '확인')]")
+        confirm_button = self.waiter.clickable(confirm_locator, 'save')
+        if not confirm_button:
+            print("  ⚠ 확인 버튼 클릭 건너뜀: 저장 확인 팝업이 표시되지 않음")
+            return False
         try:
-            date_input = self.driver.find_element(By.ID, "startDatePicker")
-            current_date = date_input.get_attribute("value")
-        except:
-            current_date = None
-        """날짜별로 각 방 타입의 판매가능객실 설정"""
+            confirm_button.click()
+        except Exception as e:
+            print(f"  ⚠ 확인 버튼 클릭 건너뜀: {e}")
+            return False
+        print("  ✓ 저장 확인 완료")
+        # 팝업이 닫히고 저장 응답이 끝날 때까지 대기
+        self.waiter.until(lambda d: not d.find_elements(*confirm_locator), 'save', description="확인 팝업 닫힘")
+        self.waiter.network_idle('save')
+        return True
+
+    def _write_availability_cell(self, change):
+        """스냅샷 locator(방 이름, 컬럼)로 입력 필드를 찾아 값 하나를 입력 (일괄 입력 실패 시 대체 경로)"""
+        idx = change['col']
+        available = change['value']
         try:
-            print("\n🏨 판매가능객실 자동 설정 중...")
-            time.sleep(3)
-            
-            results = {}
-            
-            for room_key, room_name in config.ROOM_TYPES.items():
-                max_count = config.ROOM_MAX_COUNT.get(room_key, 10)
-                print(f"\n📝 {room_name} 처리 중 (최대: {max_count}개)")
-                
+            input_field = self.driver.execute_script(
+                FIND_SALES_INPUT_JS, change['room_name'], idx, SALES_ROW_LABEL
+            )
+            if input_field is None:
+                print(f"    [{idx+1}] ⚠️ 입력 필드를 찾을 수 없음 ({change['room_name']})")
+                return False
+
+            # 입력 필드가 화면에 보이도록 스크롤
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", input_field)
+
+            # 입력 필드 활성화 및 포커스
+            self.driver.execute_script("arguments[0].removeAttribute('readonly');", input_field)
+            self.driver.execute_script("arguments[0].removeAttribute('disabled');", input_field)
+            input_field.click()
+
+            if available is None:
+                # 빈칸 (모두 오픈)
                 try:
-                    # 1. 먼저 룸 타입의 expandable 버튼 찾기 (여러 방법 시도)
-                    expandable_span = None
-                    try:
-                        # 방법 1: class와 텍스트로 찾기
-                        expandable_span = self.driver.find_element(
-                            By.XPATH,
-                            f"//span[contains(@class, 'expandable') and contains(text(), '{room_name}')]"
-                        )
-                    except:
-                        # 방법 2: 아이콘 포함된 span으로 찾기
-                        expandable_span = self.driver.find_element(
-                            By.XPATH,
-                            f"//span[@class='expandable' and contains(., '{room_name}')]"
-                        )
-                    
-                    # 2. expandable 버튼 클릭하여 하위 메뉴 펼치기
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", expandable_span)
-                    time.sleep(1)
-                    
-                    # 이미 펼쳐져 있는지 확인 (closes 아이콘이 보이는지)
-                    parent_element = expandable_span.find_element(By.XPATH, "./ancestor::td")
-                    closes_icon = parent_element.find_elements(By.CSS_SELECTOR, "i.closes")
-                    
-                    if not closes_icon or not closes_icon[0].is_displayed():
-                        # 펼쳐져 있지 않으면 클릭
-                        self.driver.execute_script("arguments[0].click();", expandable_span)
-                        print(f"  ✓ {room_name} 하위 메뉴 펼침")
-                        time.sleep(2)  # 하위 메뉴가 펼쳐질 때까지 대기
-                    else:
-                        print(f"  ✓ {room_name} 이미 펼쳐져 있음")
-                    
-                    # 3. 펼쳐진 하위 행들 중 "판매가능객실" 행의 입력 필드만 찾기
-                    input_fields = []
+                    input_field.clear()
+                except Exception:
+                    self.driver.execute_script("arguments[0].value = '';", input_field)
+                print(f"    [{idx+1}] 빈칸으로 설정 (모두 오픈)")
+                return True
+
+            value_str = str(available)
+            # 저장 후 확인(VERIFY_AFTER_SAVE)이 켜져 있으면 미반영 셀을 윈도우 단위로 다시 입력하므로 한 번만 시도
+            attempts = 1 if config.VERIFY_AFTER_SAVE else 3
+            for attempt in range(attempts):
+                # 방법 1: clear + send_keys
+                try:
+                    input_field.clear()
+                    input_field.send_keys(value_str)
+                except Exception as e1:
+                    print(f"    방법1 실패, 방법2 시도: {e1}")
+                    # 방법 2: JavaScript로 직접 설정
                     try:
-                        # expandable span이 있는 tr 찾기
-                        expandable_tr = expandable_span.find_element(By.XPATH, "./ancestor::tr")
-                        
-                        # 다음 형제 tr들을 순회하면서 "판매가능객실"이 있는 tr 찾기
-                        next_tr = expandable_tr
-                        found_sales_row = False
-                        
-                        for i in range(20):  # 최대 20개 행 확인
-                            try:
-                                next_tr = next_tr.find_element(By.XPATH, "./following-sibling::tr[1]")
-                                
-                                # 다음 expandable을 만나면 중단 (다른 룸 타입 시작)
-                                if next_tr.find_elements(By.CSS_SELECTOR, "span.expandable"):
-                                    print(f"  → 다음 룸 타입 도달, 검색 중단")
-                                    break
-                                
-                                # 이 tr에 "판매가능객실" 텍스트가 있는지 확인
-                                tr_text = next_tr.text
-                                if "판매가능객실" in tr_text:
-                                    # 이 tr의 input 필드들 찾기
-                                    row_inputs = next_tr.find_elements(By.CSS_SELECTOR, "input[type='text']")
-                                    if row_inputs:
-                                        input_fields = row_inputs
-                                        found_sales_row = True
-                                        print(f"  → {room_name}의 판매가능객실 행 발견: {len(input_fields)}개 입력 필드")
-                                        break
-                                
-                            except:
-                                break
-                        
-                        if not found_sales_row:
-                            print(f"  ⚠ {room_name}의 판매가능객실 행을 찾을 수 없음")
-                            results[room_name] = False
-                            continue
-                        
-                    except Exception as e:
-                        print(f"  ⚠ 판매가능객실 행 찾기 실패: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        results[room_name] = False
-                        continue
-                    
-                    count = 0
-                    alert_count = 0
-                    skip_count = 0
-                    # 잔여/예약 tr 찾기: 판매가능객실 tr의 이전 형제 tr 중 data-field="REMANING"인 tr
-                    sales_tr = input_fields[0].find_element(By.XPATH, "./ancestor::tr")
-                    remain_tr = sales_tr.find_element(By.XPATH, "./preceding-sibling::tr[@data-field='REMANING'][1]")
-                    remain_tds = remain_tr.find_elements(By.TAG_NAME, "td")[2:]  # 앞 2개는 라벨/헤더
-
-                    for idx, input_field in enumerate(input_fields):
-                        try:
-                            current_value = input_field.get_attribute('value')
-                            remain_td = remain_tds[idx]
-                            spans = remain_td.find_elements(By.TAG_NAME, "span")
-                            remaining = int(spans[0].text.strip())
-                            booked = int(spans[1].text.strip())
-                            if idx < 3:
-                                print(f"    [{idx+1}] 전여:{remaining}, 예약:{booked}")
-                            print(f"[잔여/예약 진단] idx={idx+1}, room={room_key}, remaining={remaining}, booked={booked}, current_value={current_value}")
-                        except Exception as e:
-                            print(f"[잔여/예약 진단] idx={idx+1}, room={room_key}, remain_td 파싱 실패: {e}")
-                            remaining = max_count
-                            booked = 0
-                        
-                        try:
-                            # 판매가능객실 수량 계산
-                            available = self.calculate_available_rooms(
-                                room_key, remaining, booked, max_count
-                            )
-
-                            # ALERT 메시지 처리
-                            if isinstance(available, str) and available.startswith('ALERT:'):
-                                alert_msg = available.replace('ALERT:', '')
-                                print(f"    [{idx+1}] ⚠️ {alert_msg}")
-                                alert_count += 1
-                                continue
-
-                            # ★ 빈칸→빈칸이면 완전 생략
-                            if (current_value is None or str(current_value).strip() == "") and available is None:
-                                skip_count += 1
-                                if skip_count <= 3:
-                                    print(f"    [{idx+1}] ✓ 건너뛰기: 빈칸→빈칸 (예약:{booked})")
-                                count += 1
-                                continue
-
-                            # 값이 있고 조건에 맞으면 즉시 건너뛰기 (스크롤/클릭 없이)
-                            # 기존 값과 기대값이 다르면 반드시 값을 입력하도록 수정
-                            if current_value and str(current_value).strip():
-                                try:
-                                    existing_val = int(current_value)
-                                    if available is not None and existing_val == available:
-                                        skip_count += 1
-                                        if skip_count <= 3:
-                                            print(f"    [{idx+1}] ✓ 건너뛰기: {existing_val} (정책 기대값과 동일)")
-                                        count += 1
-                                        continue
-                                except:
-                                    pass
-
-                            # 변경 이력 기록 (변경 발생 시)
-                            if str(current_value) != ("" if available is None else str(available)):
-                                # index에 따라 실제 날짜 계산
-                                try:
-                                    base_date = datetime.strptime(current_date, "%Y-%m-%d")
-                                    real_date = (base_date + timedelta(days=idx)).strftime("%Y-%m-%d")
-                                except Exception as e:
-                                    real_date = current_date
-                                self.change_history.append({
-                                    'run_date': run_date,
-                                    'date': real_date,
-                                    'room_type': room_name,
-                                    'old_value': current_value,
-                                    'new_value': available
-                                })
-                            
-                            # 입력 필드가 화면에 보이도록 스크롤
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", input_field)
-                            time.sleep(0.5)
-                            
-                            # 입력 필드 활성화 및 포커스
-                            self.driver.execute_script("arguments[0].removeAttribute('readonly');", input_field)
-                            self.driver.execute_script("arguments[0].removeAttribute('disabled');", input_field)
-                            input_field.click()
-                            time.sleep(0.3)
-                            
-                            # 입력 필드에 값 설정 (여러 방법 시도)
-                            if available is None:
-                                # 빈칸 (모두 오픈)
-                                try:
-                                    input_field.clear()
-                                except:
-                                    self.driver.execute_script("arguments[0].value = '';", input_field)
-                                print(f"    [{idx+1}] 빈칸으로 설정 (모두 오픈)")
-
-                            else:
-                                value_str = str(available)
-                                success = False
-                                for attempt in range(3):
-                                    # 방법 1: clear + send_keys
-                                    try:
-                                        input_field.clear()
-                                        time.sleep(0.2)
-                                        input_field.send_keys(value_str)
-                                        time.sleep(0.2)
-                                    except Exception as e1:
-                                        print(f"    방법1 실패, 방법2 시도: {e1}")
-                                        # 방법 2: JavaScript로 직접 설정
-                                        try:
-                                            self.driver.execute_script(f"arguments[0].value = '';", input_field)
-                                            time.sleep(0.1)
-                                            self.driver.execute_script(f"arguments[0].value = '{value_str}';", input_field)
-                                        except Exception as e2:
-                                            print(f"    방법2도 실패: {e2}")
-                                    # 변경 이벤트 트리거
-                                    self.driver.execute_script("""
-                                        arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
-                                        arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
-                                    """, input_field)
-                                    # blur 이벤트로 완료
-                                    input_field.send_keys(Keys.TAB)
-                                    time.sleep(0.2)
-                                    # 입력값 검증
-                                    actual_val = input_field.get_attribute('value')
-                                    if actual_val == value_str:
-                                        print(f"    [{idx+1}] 값 입력 성공: {value_str} (예약:{booked}, 잔여:{remaining})")
-                                        success = True
-                                        break
-                                    else:
-                                        print(f"    [{idx+1}] 값 입력 불일치: 기대={value_str}, 실제={actual_val} (재시도 {attempt+1}/3)")
-                                if not success:
-                                    print(f"    [{idx+1}] ⚠️ 최종 입력 실패: {value_str} (예약:{booked}, 잔여:{remaining})")
-                                count += 1
-                            
-                        except Exception as e:
-                            print(f"  ⚠ 입력 필드 {idx+1} 설정 실패: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            continue
-                    
-                    print(f"  ✓ {room_name}: {count}개 처리 완료 (건너뛰기: {skip_count}개)")
-                    if alert_count > 0:
-                        print(f"  ⚠️ {room_name}: {alert_count}개 알림 - 수동 확인 필요")
-                    results[room_name] = True
-                    
-                except Exception as e:
-                    print(f"  ❌ {room_name} 설정 실패: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    results[room_name] = False
-            
-            # 저장 버튼 클릭
-            print("\n💾 저장 중...")
-            save_button = self.driver.find_element(
-                By.CSS_SELECTOR,
-                "#scrollArea > div:nth-child(1) > div.app-main > div.app-main__outer > div > div > div.app-footer.fixFooter.TabsAnimation-appear.TabsAnimation-appear-active > div > div > button.btn-wide.btn-shadow.w140.btn.btn-primary.btn-lg"
-            )
-            save_button.click()
-            time.sleep(2)
-            
-            # "저장되었습니다" 팝업의 확인 버튼 클릭
-            try:
-                confirm_button = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'btn-primary') and contains(., '확인')]"))
-                )
-                confirm_button.click()
-                print("  ✓ 저장 확인 완료")
-                time.sleep(1)
-            except Exception as e:
-                print(f"  ⚠ 확인 버튼 클릭 건너뜀: {e}")
-            
-            print("✅ 저장 완료!")
-            
-            return results
-            
+                        self.driver.execute_script("arguments[0].value = '';", input_field)
+                        self.driver.execute_script("arguments[0].value = arguments[1];", input_field, value_str)
+                    except Exception as e2:
+                        print(f"    방법2도 실패: {e2}")
+                # 변경 이벤트 트리거
+                self.driver.execute_script("""
+                    arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
+                    arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
+                """, input_field)
+                # blur 이벤트로 완료
+                input_field.send_keys(Keys.TAB)
+                # 입력값 검증 (값이 반영될 때까지 짧게 대기)
+                actual_val = self.waiter.until(
+                    lambda d: input_field.get_attribute('value') == value_str and value_str,
+                    'input', description="입력값 반영"
+                ) or input_field.get_attribute('value')
+                if actual_val == value_str:
+                    print(f"    [{idx+1}] 값 입력 성공: {value_str} (예약:{change['booked']}, 잔여:{change['remaining']})")
+                    return True
+                print(f"    [{idx+1}] 값 입력 불일치: 기대={value_str}, 실제={actual_val} (시도 {attempt+1}/{attempts})")
+
+            print(f"    [{idx+1}] ⚠️ 최종 입력 실패: {value_str} (예약:{change['booked']}, 잔여:{change['remaining']})")
+            return False
+
         except Exception as e:
-            print(f"❌ 판매가능객실 설정 실패: {e}")
+            print(f"  ⚠ 입력 필드 {idx+1} 설정 실패: {e}")
             import traceback
             traceback.print_exc()
-            return {}
-        
+            return False
+
     def set_room_availability(self, room_type, available_rooms):
         """
         특정 방 타입의 예약 가능 수량 설정
@@ -1246,7 +2256,6 @@ class HotelCMSController:
             input_field.send_keys(str(available_rooms))
             
             print(f"✓ {room_name} 수량 설정 완료: {available_rooms}개")
-            time.sleep(0.5)
             return True
             
         except Exception as e:
@@ -1276,7 +2285,7 @@ class HotelCMSController:
             )
             save_button.click()
             print("\n✓ 변경사항 저장 완료")
-            time.sleep(2)
+            self.waiter.network_idle('save')
         except Exception as e:
             print(f"\n⚠ 저장 버튼을 찾을 수 없습니다: {e}")
             print("수동으로 저장해주세요.")
@@ -1321,7 +2330,7 @@ class HotelCMSController:
         """모든 방 타입의 판매가능객실 입력값을 지우고 저장"""
         try:
             print("\n🧹 모든 판매가능객실 입력값 초기화 중...")
-            time.sleep(3)
+            self.waiter.grid_rendered('search')
             
             results = {}
             
@@ -1344,7 +2353,6 @@ class HotelCMSController:
                     
                     # 2. 하위 메뉴 펼치기
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", expandable_span)
-                    time.sleep(1)
                     
                     parent_element = expandable_span.find_element(By.XPATH, "./ancestor::td")
                     closes_icon = parent_element.find_elements(By.CSS_SELECTOR, "i.closes")
@@ -1352,7 +2360,7 @@ class HotelCMSController:
                     if not closes_icon or not closes_icon[0].is_displayed():
                         self.driver.execute_script("arguments[0].click();", expandable_span)
                         print(f"  ✓ {room_name} 하위 메뉴 펼침")
-                        time.sleep(2)
+                        self.waiter.dom_quiet('expand')
                     else:
                         print(f"  ✓ {room_name} 이미 펼쳐져 있음")
                     
@@ -1377,7 +2385,6 @@ class HotelCMSController:
                     for input_field in input_fields:
                         try:
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'nearest'});", input_field)
-                            time.sleep(0.1)
                             
                             # 값을 빈 문자열로 설정
                             self.driver.execute_script("arguments[0].value = '';", input_field)
@@ -1395,25 +2402,8 @@ class HotelCMSController:
                     print(f"  ❌ {room_name} 초기화 실패: {e}")
                     results[room_name] = False
             
-            # 저장 버튼 클릭
-            print("\n💾 저장 중...")
-            save_button = self.driver.find_element(
-                By.CSS_SELECTOR,
-                "#scrollArea > div:nth-child(1) > div.app-main > div.app-main__outer > div > div > div.app-footer.fixFooter.TabsAnimation-appear.TabsAnimation-appear-active > div > div > button.btn-wide.btn-shadow.w140.btn.btn-primary.btn-lg"
-            )
-            save_button.click()
-            time.sleep(2)
-            
-            # "저장되었습니다" 팝업의 확인 버튼 클릭
-            try:
-                confirm_button = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'btn-primary') and contains(., '확인')]"))
-                )
-                confirm_button.click()
-                print("  ✓ 저장 확인 완료")
-                time.sleep(1)
-            except Exception as e:
-                print(f"  ⚠ 확인 버튼 클릭 건너뜀: {e}")
+            # 저장 버튼 클릭 및 확인
+            self.save_inventory()
             
             print("✅ 초기화 및 저장 완료!")
             
@@ -1427,9 +2417,23 @@ class HotelCMSController:
     
     def close(self):
         """브라우저 종료"""
+        self.flush_closed_room_highlights()
+        if self.price_table.matcher:
+            self.price_table.matcher.report()
+        if self.waiter:
+            self.waiter.report()
+        self.report_driver_timings()
+        if self.snapshot_store:
+            self.snapshot_store.report()
+            self.snapshot_store.close()
+        self.profiler.report()
+        self.profiler.export()
+        self.profiler.detach()
         if self.driver:
             self.driver.quit()
             print("\n✓ 브라우저 종료")
+        # 브라우저 종료와 겹쳐서 남은 파일 작업 처리 (종료 전 모두 완료)
+        self.io.close()
     
     def run_for_date_range(self):
         """날짜 범위에 대해 자동 실행"""
@@ -1445,108 +2449,553 @@ class HotelCMSController:
             # 15일 뒤로 이동
             current_date += delta
     
-    def run_for_date_range_with_input(self, start_date_str, end_date_str):
+    def run_for_date_range_with_input(self, start_date_str, end_date_str, dry_run=False, resume=False):
         """
-        시작일(YYYY-MM-DD) 문자열을 받아 15일(시작일~시작일+14일)만 처리
+        시작일~종료일을 15일(시작일~시작일+14일) 윈도우 단위로 처리
         최초 1회만 객실/필터 설정, 이후에는 날짜만 바꾸고 반드시 조회 버튼을 누름
+
+        Args:
+            resume: True면 체크포인트의 미완료 윈도우부터 이어서 처리
         """
-        # 시작일 미입력 시 오늘+3일로 자동 설정
-        if not start_date_str or start_date_str.strip() == "":
-            start_date = datetime.now() + timedelta(days=3)
-            start_date_str = start_date.strftime("%Y-%m-%d")
-            print(f"시작일 미입력: 오늘+3일({start_date_str})로 자동 설정합니다.")
-        else:
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
+        window_starts, checkpoint = prepare_inventory_run(start_date_str, end_date_str, resume, dry_run)
+        return self.run_inventory_windows(window_starts, checkpoint, dry_run=dry_run)
 
-        # 종료일 미입력 시 오늘+11개월로 자동 설정
-        if not end_date_str or end_date_str.strip() == "":
-            end_date = datetime.now() + timedelta(days=30*11)
-            print(f"종료일 미입력: 오늘+11개월({end_date.strftime('%Y-%m-%d')})로 자동 설정합니다.")
-        else:
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
-        current_date = start_date
-        # 최초 1회: 객실/필터 설정 포함
-        if current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            end_range = current_date + timedelta(days=14)
-            print(f"\n===== {date_str} ~ {end_range.strftime('%Y-%m-%d')} 처리 시작 =====")
+    def run_inventory_windows(self, window_starts, checkpoint=None, dry_run=False):
+        """윈도우 목록 처리 (checkpoint가 있으면 완료 윈도우를 기록하고, 모두 끝나면 체크포인트 삭제)"""
+        if not window_starts:
+            return {}
+        self.checkpoint = checkpoint
+        try:
+            results = self.process_inventory_windows(window_starts, dry_run=dry_run)
+        finally:
+            self.checkpoint = None
+        self.io.flush()  # 체크포인트 완료 기록이 모두 반영된 뒤 판단
+        finish_checkpoint(checkpoint)
+        return results
+
+    def run_inventory_daemon(self, start_date_str=None, end_date_str=None, interval_minutes=None,
+                             max_cycles=None, dry_run=False):
+        """
+        상주 모드: 로그인된 브라우저와 인벤토리 화면(객실/필터 설정)을 유지한 채 주기적으로 객실수 자동조정
+
+        - 매 주기 기간을 다시 계산 (시작일/종료일 미입력 시 오늘 기준으로 이동)
+        - 화면 설정은 첫 주기에만, 이후에는 날짜 변경/조회와 변경 윈도우 입력·저장만 수행
+        - 세션이 만료되었으면 다시 로그인하고 화면을 새로 설정
+
+        Args:
+            interval_minutes: 주기 시작 간격(분, 기본: config.DAEMON_INTERVAL_MINUTES)
+            max_cycles: 지정하면 해당 횟수만 실행하고 종료 (기본: Ctrl+C까지 반복)
+        """
+        interval = (interval_minutes or config.DAEMON_INTERVAL_MINUTES) * 60
+        print(f"\n🔁 상주 모드 시작: {interval / 60:g}분 간격 (종료: Ctrl+C)")
+        cycle = 0
+        while True:
+            cycle += 1
+            started = time.time()
+            print(f"\n{'='*60}\n🔁 동기화 {cycle}회차 ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})\n{'='*60}")
+            self.change_journal.run_id = new_run_id()
+            changes_before = self.change_journal.count
+            try:
+                self.ensure_daemon_session()
+                start_date, end_date = resolve_inventory_range(start_date_str, end_date_str)
+                window_starts = inventory_window_starts(start_date, end_date)
+                self.process_inventory_windows(window_starts, dry_run=dry_run)
+            except Exception as e:
+                print(f"❌ {cycle}회차 동기화 실패: {e}")
+                # 다음 주기에는 화면을 처음부터 다시 설정
+                self._inventory_page_ready = False
+                self._displayed_window = None
+            self.io.flush()  # 다음 주기의 run_id로 바뀌기 전에 저널 기록 완료
+            elapsed = time.time() - started
+            print(f"\n✓ {cycle}회차 완료: {elapsed:.1f}s, 변경 {self.change_journal.count - changes_before}건")
+            if max_cycles and cycle >= max_cycles:
+                return cycle
+            wait = max(0, interval - elapsed)
+            next_run = datetime.now() + timedelta(seconds=wait)
+            print(f"  → 다음 동기화: {next_run.strftime('%H:%M:%S')}")
+            with self.profiler.phase('idle'):
+                (self.waiter.sleep if self.waiter else time.sleep)(wait)
+
+    def ensure_daemon_session(self):
+        """상주 모드 주기 시작 전 로그인 상태 확인 (만료 시 재로그인, HTTP 백엔드는 쿠키 다시 등록)"""
+        if self.http_client:
+            self.ensure_http_session()
+            return
+        if self.is_session_valid():
+            return
+        print("⚠ 세션 만료 - 다시 로그인합니다.")
+        self._inventory_page_ready = False
+        self._displayed_window = None
+        self.navigate_to_cms()
+        if not self.ensure_logged_in():
+            raise RuntimeError("재로그인 실패")
+
+    def ensure_http_session(self):
+        """
+        HTTP 백엔드 세션 확인: 만료되었으면 브라우저에서 다시 로그인하고 쿠키를 다시 등록
+        (브라우저 세션이 살아 있어도 API가 거부하면 저장된 세션 대신 새로 로그인)
+        """
+        if self.http_client.is_session_valid():
+            return
+        self.refresh_http_session()
+
+    def refresh_http_session(self):
+        """브라우저에서 다시 로그인하고 HTTP 백엔드 쿠키를 다시 등록 (API 호출 중 인증 실패 시에도 호출됨)"""
+        print("⚠ HTTP 백엔드 세션 만료 - 브라우저에서 다시 로그인합니다.")
+        if not self.driver:
+            raise RuntimeError("브라우저 없이 HTTP 백엔드 세션을 갱신할 수 없습니다")
+        self.navigate_to_cms()
+        if self.ensure_logged_in():
+            self._import_browser_cookies(self.http_client)
+            if self.http_client.is_session_valid():
+                print("  ✓ HTTP 백엔드 쿠키 다시 등록")
+                return
+        if not self.login():
+            raise RuntimeError("재로그인 실패")
+        if config.SESSION_REUSE:
+            self.save_session()
+        self._import_browser_cookies(self.http_client)
+        if not self.http_client.is_session_valid():
+            raise RuntimeError("재로그인 후에도 HTTP 백엔드 인증 실패")
+        print("  ✓ HTTP 백엔드 쿠키 다시 등록")
+
+    def process_inventory_windows(self, window_starts, dry_run=False):
+        """
+        윈도우 시작일 목록을 계획 → 적용 2단계로 처리
+        계획 단계는 모든 윈도우를 읽기만 하고, 적용 단계는 변경이 있는 윈도우만 다시 열어 입력/저장
+
+        Args:
+            dry_run: True면 계획만 출력하고 CMS에는 입력/저장하지 않음
+
+        Returns:
+            {윈도우 시작일: 방 이름별 결과}
+        """
+        plans = self.plan_inventory_windows(window_starts)
+        print_inventory_plan(plans)
+        if not dry_run:
+            self.apply_inventory_plans(plans)
+        return {date_str: plan['results'] for date_str, plan in plans.items()}
+
+    def mark_window_done(self, date_str):
+        """윈도우 완료 기록 (I/O 워커에서 체크포인트 기록 후 완료 목록에 추가)"""
+        self.io.submit("체크포인트 기록", self._record_window_done, date_str)
+
+    def _record_window_done(self, date_str):
+        if self.checkpoint:
+            self.checkpoint.mark_done(date_str)
+        self.completed_windows.append(date_str)
+
+    def _record_window_changes(self, changes, saved, done_window=None):
+        """
+        변경 저널 기록 후 윈도우 완료 기록 (하나의 I/O 작업)
+        저널 기록이 실패하면 예외로 작업이 중단되어 해당 윈도우는 완료로 기록되지 않음 (--resume 시 다시 처리)
+        """
+        self.change_journal.append(changes, saved=saved)
+        if done_window:
+            self._record_window_done(done_window)
+
+    def open_inventory_window(self, date_str, refresh=True):
+        """
+        인벤토리 화면을 해당 시작일 윈도우로 조회 (최초 1회만 객실/필터 설정, HTTP 백엔드는 생략)
+
+        Args:
+            refresh: False면 이미 그 윈도우가 조회되어 있을 때 날짜 변경/조회를 생략
+        """
+        if self.http_client:
+            return
+        if not refresh and self._inventory_page_ready and self._displayed_window == date_str:
+            print(f"  ✓ {date_str} 윈도우가 이미 조회되어 있음 - 재조회 생략")
+            return
+        if not self._inventory_page_ready:
             self.navigate_to_inventory_page(date_str, do_select_rooms=True)
-            self.set_room_availability_by_date()
-            current_date += timedelta(days=15)
-        # 이후 반복: 날짜만 바꾸고 조회 버튼 누름
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            end_range = current_date + timedelta(days=14)
-            print(f"\n===== {date_str} ~ {end_range.strftime('%Y-%m-%d')} 처리 시작 =====")
+            self._inventory_page_ready = True
+        else:
+            # 이후 반복: 날짜만 바꾸고 조회 버튼 누름
             self.set_date(date_str)
             self.search_rooms_by_date()
-            self.set_room_availability_by_date()
-            current_date += timedelta(days=15)
+        self._displayed_window = date_str
+
+    def plan_inventory_windows(self, window_starts):
+        """
+        계획 단계: 모든 윈도우를 읽기 전용으로 조회해 변경 계획 작성
+
+        Returns:
+            {윈도우 시작일: plan_inventory_window 결과} (계획 실패 윈도우는 변경 없음으로 기록)
+        """
+        plans = {}
+        for date_str in window_starts:
+            end_range = datetime.strptime(date_str, "%Y-%m-%d") + timedelta(days=INVENTORY_WINDOW_DAYS - 1)
+            print(f"\n===== [계획] {date_str} ~ {end_range.strftime('%Y-%m-%d')} =====")
+            with self.profiler.window(date_str):
+                self.open_inventory_window(date_str)
+                plan = self.plan_inventory_window(window_start=date_str)
+            if plan is None:
+                plan = {'window_start': date_str, 'changes': [], 'alerts': [], 'results': {}, 'error': True}
+            elif not plan['changes']:
+                # 변경이 없는 윈도우는 읽기만으로 완료
+                self.mark_window_done(date_str)
+            plans[date_str] = plan
+        return plans
+
+    def apply_inventory_plans(self, plans):
+        """
+        적용 단계: 변경이 있는 윈도우만 다시 조회해 입력/저장
+
+        Returns:
+            저장한 윈도우 수
+        """
+        pending = [date_str for date_str, plan in plans.items() if plan['changes']]
+        print(f"\n===== [적용] 변경 윈도우 {len(pending)}/{len(plans)}개 =====")
+        saved = 0
+        for date_str in pending:
+            print(f"\n--- {date_str} 윈도우: 변경 {len(plans[date_str]['changes'])}개 ---")
+            try:
+                with self.profiler.window(date_str):
+                    # 계획 단계에서 마지막으로 읽은 윈도우는 화면에 그대로 있으므로 다시 조회하지 않음
+                    self.open_inventory_window(date_str, refresh=False)
+                    if not self.http_client:
+                        self.waiter.grid_rendered('search')
+                    plans[date_str] = self.refresh_inventory_plan(plans[date_str])
+                    if not plans[date_str]['changes']:
+                        self.mark_window_done(date_str)
+                    # 저장되면 저널 기록과 같은 I/O 작업에서 완료로 기록
+                    elif self.apply_inventory_window(plans[date_str], window_start=date_str):
+                        saved += 1
+            except Exception as e:
+                print(f"❌ {date_str} 윈도우 적용 실패: {e}")
+                self.forget_window_snapshot(date_str)
+        self.report_verification(plans)
+        return saved
+
+    def refresh_inventory_plan(self, plan):
+        """
+        적용 직전에 윈도우를 다시 읽어 계획 이후 잔여/예약/판매가능객실이 바뀐 셀이 있으면 다시 계획
+
+        Returns:
+            바뀐 셀이 없으면 기존 계획, 있으면 새로 읽은 값으로 만든 계획
+        """
+        snapshot = self.read_inventory_grid_snapshot(window_start=plan['window_start'])
+        stale = stale_cells(plan['snapshot'], snapshot)
+        if not stale:
+            return plan
+        print(f"  ⚠ 계획 이후 바뀐 셀 {len(stale)}개 ({', '.join(stale[:5])}{' 외' if len(stale) > 5 else ''}) → 다시 계획")
+        # 계획 이후 누군가 값을 바꿨으므로 지난 해시로 생략되지 않게 삭제 (다시 계획한 결과로 새로 기록)
+        self.forget_window_snapshot(plan['window_start'])
+        refreshed = self.plan_room_availability(snapshot)
+        refreshed['window_start'] = plan['window_start']
+        refreshed['snapshot'] = snapshot
+        if not refreshed['changes']:
+            print("  ✓ 다시 계획한 결과 변경 없음")
+            self.record_window_snapshot(refreshed)
+        return refreshed
+
+    @staticmethod
+    def report_verification(plans):
+        """윈도우별 저장 확인 결과 합계 출력"""
+        results = [plan['verification'] for plan in plans.values() if 'verification' in plan]
+        if not results:
+            return
+        total = {key: sum(r[key] for r in results) for key in ('verified', 'retried', 'failed')}
+        print(f"\n🔎 저장 확인 합계: 윈도우 {len(results)}개, 반영 {total['verified']}개, "
+              f"재입력 {total['retried']}개, 미반영 {total['failed']}개")
+
+
+def resolve_inventory_range(start_date_str, end_date_str):
+    """객실수 자동조정 기간 결정 (시작일 미입력: 오늘+3일, 종료일 미입력: 오늘+11개월)"""
+    # 시작일 미입력 시 오늘+3일로 자동 설정
+    if not start_date_str or start_date_str.strip() == "":
+        start_date = datetime.now() + timedelta(days=3)
+        start_date_str = start_date.strftime("%Y-%m-%d")
+        print(f"시작일 미입력: 오늘+3일({start_date_str})로 자동 설정합니다.")
+    else:
+        start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
+
+    # 종료일 미입력 시 오늘+11개월로 자동 설정
+    if not end_date_str or end_date_str.strip() == "":
+        end_date = datetime.now() + timedelta(days=30*11)
+        print(f"종료일 미입력: 오늘+11개월({end_date.strftime('%Y-%m-%d')})로 자동 설정합니다.")
+    else:
+        end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
+    return start_date, end_date
+
+
+def resolve_rate_range(start_date_str, end_date_str):
+    """요금 자동입력 기간 결정 (시작일 미입력: 오늘, 종료일 미입력: 시작일+14일) → ('YYYY-MM-DD', 'YYYY-MM-DD')"""
+    # 미입력시 오늘 날짜로 자동
+    if not start_date_str or start_date_str.strip() == "":
+        start_date_str = datetime.now().strftime("%Y-%m-%d")
+        print(f"시작일 미입력: 오늘({start_date_str})로 자동 설정합니다.")
+    # 종료일 미입력시 시작일+14일로 자동 (테스트용 요금 자동입력)
+    if not end_date_str or end_date_str.strip() == "":
+        start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")
+        end_date = start_dt + timedelta(days=14)
+        end_date_str = end_date.strftime("%Y-%m-%d")
+        print(f"종료일 미입력: 시작일+14일({end_date_str})로 자동 설정합니다.")
+    return start_date_str, end_date_str
+
+
+def prepare_inventory_run(start_date_str, end_date_str, resume=False, dry_run=False):
+    """
+    객실수 자동조정 윈도우 목록과 체크포인트 준비
+
+    Args:
+        resume: True면 저장된 체크포인트의 미완료 윈도우만 반환 (체크포인트가 없으면 새로 시작)
+        dry_run: True면 체크포인트를 만들지 않음
+
+    Returns:
+        (윈도우 시작일 목록, RunCheckpoint 또는 None)
+    """
+    checkpoint = RunCheckpoint()
+    if resume and checkpoint.load():
+        params = checkpoint.params()
+        pending = checkpoint.pending()
+        total = len(checkpoint.data.get('windows', []))
+        print(f"\n♻ 체크포인트 재개: {params.get('start')} ~ {params.get('end')} "
+              f"(완료 {total - len(pending)}/{total}개, 저장 {checkpoint.data.get('updated_at')})")
+        if not pending:
+            print("  ✓ 남은 윈도우가 없습니다.")
+            checkpoint.clear()
+            return [], None
+        print(f"  → {pending[0]} 윈도우부터 {len(pending)}개 처리")
+        return pending, (None if dry_run else checkpoint)
+    if resume:
+        print("\n체크포인트가 없어 처음부터 실행합니다.")
+
+    start_date, end_date = resolve_inventory_range(start_date_str, end_date_str)
+    window_starts = inventory_window_starts(start_date, end_date)
+    if dry_run:
+        return window_starts, None
+    checkpoint.start({'start': start_date.strftime("%Y-%m-%d"), 'end': end_date.strftime("%Y-%m-%d")}, window_starts)
+    return window_starts, checkpoint
 
 
-def main():
+def finish_checkpoint(checkpoint):
+    """모든 윈도우가 완료되었으면 체크포인트 삭제, 아니면 재개 방법 안내"""
+    if not checkpoint:
+        return
+    pending = checkpoint.pending()
+    if pending:
+        print(f"\n⚠ 미완료 윈도우 {len(pending)}개 ({pending[0]}~) - --resume으로 이어서 실행할 수 있습니다")
+    else:
+        checkpoint.clear()
+
+
+def inventory_window_starts(start_date, end_date, days=None):
+    """시작일부터 days일 간격의 윈도우 시작일 목록 ('YYYY-MM-DD')"""
+    days = days or INVENTORY_WINDOW_DAYS
+    starts = []
+    current_date = start_date
+    while current_date <= end_date:
+        starts.append(current_date.strftime("%Y-%m-%d"))
+        current_date += timedelta(days=days)
+    return starts
+
+
+def print_inventory_plan(plans):
+    """변경 계획 요약 출력 (윈도우별 변경 셀 old → new, 알림)"""
+    total_changes = sum(len(plan['changes']) for plan in plans.values())
+    total_alerts = sum(len(plan['alerts']) for plan in plans.values())
+    print("\n" + "="*60)
+    print(f"📋 변경 계획: 윈도우 {len(plans)}개, 변경 {total_changes}개, 알림 {total_alerts}개")
+    print("="*60)
+    for date_str, plan in plans.items():
+        if plan.get('error'):
+            print(f"  {date_str}: ❌ 조회 실패")
+            continue
+        if not plan['changes'] and not plan['alerts']:
+            print(f"  {date_str}: 변경 없음")
+            continue
+        print(f"  {date_str}: 변경 {len(plan['changes'])}개")
+        for change in plan['changes']:
+            old_value = change['old_value'] if str(change['old_value'] or "").strip() else "빈칸"
+            new_value = "빈칸" if change['value'] is None else change['value']
+            print(f"    {change['date']} {change['room_name']}: {old_value} → {new_value} (예약:{change['booked']})")
+        for alert in plan['alerts']:
+            print(f"    ⚠️ {alert['date']} {alert['room_name']}: {alert['message']}")
+
+
+def export_change_history(journal, path="change_history.xlsx"):
+    """이번 실행의 변경 저널을 엑셀로 저장 (저널 파일은 실행마다 누적)"""
+    count = journal.export_xlsx(path, journal.run_id)
+    if count:
+        print(f"\n변경 이력({path}) 저장 완료! 변경 건수: {count} (저널: {journal.path})")
+    else:
+        print("\n변경된 내역이 없습니다.")
+
+
+def parse_args(argv=None):
+    """명령행 옵션 (미지정 항목은 실행 중 입력 받음)"""
+    parser = argparse.ArgumentParser(description="호텔 CMS 자동 제어")
+    parser.add_argument("--option", choices=["1", "2"], help="1: 객실수 자동조정, 2: 요금 자동입력")
+    parser.add_argument("--start", help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", help="종료일 (YYYY-MM-DD)")
+    parser.add_argument("--backend", choices=["browser", "http"], default=config.CMS_BACKEND,
+                        help="browser: 화면 조작, http: CMS API 직접 호출 (기본: config.CMS_BACKEND)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="객실수 자동조정 변경 계획만 출력 (CMS에 입력/저장하지 않음)")
+    parser.add_argument("--resume", action="store_true",
+                        help="객실수 자동조정을 체크포인트의 미완료 윈도우부터 이어서 실행")
+    parser.add_argument("--profile", action="store_true",
+                        help="WebDriver 명령 프로파일 출력 (config.PROFILE_ENABLED)")
+    parser.add_argument("--driver-profile", choices=sorted(config.DRIVER_PROFILES), default=None,
+                        help="Chrome 드라이버 프로필 (기본: config.DRIVER_PROFILE)")
+    parser.add_argument("--full", action="store_true",
+                        help="스냅샷 저장소와 비교하지 않고 모든 윈도우 규칙 평가 (config.SNAPSHOT_SKIP_UNCHANGED)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="상주 모드: 브라우저를 유지한 채 주기적으로 객실수 자동조정 (Ctrl+C로 종료)")
+    parser.add_argument("--interval", type=float, default=None,
+                        help="상주 모드 동기화 간격(분, 기본: config.DAEMON_INTERVAL_MINUTES)")
+    parser.add_argument("--cycles", type=int, default=None, help="상주 모드 실행 횟수 (기본: 무제한)")
+    parser.add_argument("--properties", default=None,
+                        help="여러 숙소 동시 실행: all 또는 쉼표로 구분한 숙소 이름 (config.PROPERTIES)")
+    parser.add_argument("--workers", type=int, default=config.PARALLEL_WORKERS,
+                        help="객실수 자동조정 병렬 워커 수 (기본: config.PARALLEL_WORKERS)")
+    return parser.parse_args(argv)
+
+
+def cli_config_overrides(args):
+    """
+    명령행 옵션으로 바꾸는 config 값
+    (spawn 방식 자식 프로세스는 config를 새로 import하므로 병렬 워커/숙소 프로세스에 인자로 전달)
+    """
+    overrides = {}
+    if args.profile:
+        overrides['PROFILE_ENABLED'] = True
+    if args.driver_profile:
+        overrides['DRIVER_PROFILE'] = args.driver_profile
+        overrides['PARALLEL_DRIVER_PROFILE'] = args.driver_profile
+    if args.full:
+        overrides['SNAPSHOT_SKIP_UNCHANGED'] = False
+    return overrides
+
+
+def apply_config_overrides(overrides):
+    """cli_config_overrides 결과를 현재 프로세스의 config에 적용"""
+    for attr, value in (overrides or {}).items():
+        setattr(config, attr, value)
+
+
+def main(argv=None):
     """메인 실행 함수"""
+    args = parse_args(argv)
+    overrides = cli_config_overrides(args)
+    apply_config_overrides(overrides)
 
+    # HTTP 백엔드는 API 경로를 실제 CMS에서 확인하기 전에는 실행하지 않음 (저장 API를 잘못된 경로로 호출하지 않도록)
+    if args.backend == "http":
+        from cms_http_client import endpoints_ready
 
-    print("\n실행할 기능을 선택하세요:")
-    print("1. 객실수 자동조정 (기간별)")
-    print("2. 요금 자동입력 (RMO 기반)")
-    option = input("번호 입력 (1 또는 2): ").strip()
+        ready, reason = endpoints_ready()
+        if not ready:
+            print(f"❌ --backend http를 사용할 수 없습니다: {reason}")
+            return
 
-    # 기능별 입력값 미리 받기
+    option = args.option
+    start_date_str = args.start
+    end_date_str = args.end
+
+    if not option and (args.resume or args.daemon):
+        option = "1"
+    if not option:
+        print("\n실행할 기능을 선택하세요:")
+        print("1. 객실수 자동조정 (기간별)")
+        print("2. 요금 자동입력 (RMO 기반)")
+        option = input("번호 입력 (1 또는 2): ").strip()
+
+        # 기능별 입력값 미리 받기
+        if option == "1":
+            print("\n[객실수 자동조정] 기간을 입력하세요.")
+            start_date_str = input("시작일 (YYYY-MM-DD): ")
+            end_date_str = input("종료일 (YYYY-MM-DD): ")
+        elif option == "2":
+            print("\n[요금 자동입력] 기간을 입력하세요.")
+            start_date_str = input("시작일 (YYYY-MM-DD, 엔터시 오늘): ")
+            end_date_str = input("종료일 (YYYY-MM-DD, 엔터시 시작일+14일): ")
+
+    # 여러 숙소: 숙소마다 독립된 프로세스/브라우저에서 실행 (체크포인트·저널·세션 파일도 숙소별)
+    if args.properties:
+        from property_runner import load_properties, select_properties, run_properties
+
+        if option not in ("1", "2"):
+            print("잘못된 옵션입니다. 프로그램을 종료합니다.")
+            return
+        properties = select_properties(load_properties(), args.properties)
+        run_properties(properties, option, start_date_str, end_date_str, dry_run=args.dry_run, resume=args.resume,
+                       backend=args.backend, overrides=overrides)
+        return
+
+    # 상주 모드: 로그인/화면 설정을 한 번만 하고 주기적으로 객실수 자동조정
+    if args.daemon:
+        if option != "1":
+            print("상주 모드는 객실수 자동조정(1)만 지원합니다.")
+            return
+        controller = HotelCMSController()
+        try:
+            controller.setup_driver()
+            controller.navigate_to_cms()
+            if not controller.ensure_logged_in():
+                print("\n수동으로 로그인을 완료한 후 Enter를 눌러주세요...")
+                input()
+            if args.backend == "http":
+                controller.setup_http_backend()
+            controller.run_inventory_daemon(start_date_str, end_date_str, args.interval, args.cycles, args.dry_run)
+        except KeyboardInterrupt:
+            print("\n\n상주 모드를 종료합니다.")
+        finally:
+            controller.close()
+        return
+
+    # 객실수 자동조정 윈도우 목록 (재개 시 미완료 윈도우만, 남은 윈도우가 없으면 브라우저를 열지 않음)
     if option == "1":
-        print("\n[객실수 자동조정] 기간을 입력하세요.")
-        start_date_str = input("시작일 (YYYY-MM-DD): ")
-        end_date_str = input("종료일 (YYYY-MM-DD): ")
-    elif option == "2":
-        print("\n[요금 자동입력] 기간을 입력하세요.")
-        start_date_str = input("시작일 (YYYY-MM-DD, 엔터시 오늘): ")
-        end_date_str = input("종료일 (YYYY-MM-DD, 엔터시 시작일+14일): ")
-    else:
-        start_date_str = None
-        end_date_str = None
+        window_starts, checkpoint = prepare_inventory_run(start_date_str, end_date_str, args.resume, args.dry_run)
+        if not window_starts:
+            return
+
+    # 병렬 모드: 워커 프로세스가 각자 브라우저를 띄우므로 여기서는 브라우저를 열지 않음
+    if option == "1" and args.workers > 1:
+        from parallel_runner import run_date_range_parallel
+
+        # 워커가 끝날 때마다 저장까지 끝냈거나 변경이 없었던 윈도우만 완료로 기록 (계획/적용 실패 윈도우는 --resume 대상)
+        merged = run_date_range_parallel(window_starts, args.workers, dry_run=args.dry_run,
+                                         backend=args.backend, overrides=overrides, checkpoint=checkpoint)
+        finish_checkpoint(checkpoint)
+        if not args.dry_run:
+            export_change_history(merged['journal'])
+        print("\n" + "="*60)
+        print("✅ 기간별 판매가능객실 설정 완료!" if not merged['errors'] else "⚠ 일부 워커 실패 - 미처리 윈도우를 확인하세요")
+        print("="*60)
+        return
 
     controller = HotelCMSController()
+    if option == "2":
+        # 브라우저 시작/로그인 동안 기준가격.xlsx를 미리 읽어 둠
+        controller.io.submit("기준가격 미리 읽기", controller.price_table.preload)
 
     try:
         controller.setup_driver()
         controller.navigate_to_cms()
-        login_success = controller.login()
+        login_success = controller.ensure_logged_in()
         if not login_success:
             print("\n수동으로 로그인을 완료한 후 Enter를 눌러주세요...")
             input()
+        if args.backend == "http":
+            controller.setup_http_backend()
 
         if option == "1":
-            controller.run_for_date_range_with_input(start_date_str, end_date_str)
-            # 변경 이력 엑셀로 저장
-            if controller.change_history:
-                import pandas as pd
-                df = pd.DataFrame(controller.change_history)
-                df.to_excel("change_history.xlsx", index=False)
-                print(f"\n변경 이력(change_history.xlsx) 저장 완료! 변경 건수: {len(df)}")
-            else:
-                print("\n변경된 내역이 없습니다.")
+            controller.run_inventory_windows(window_starts, checkpoint, dry_run=args.dry_run)
             print("\n" + "="*60)
-            print("✅ 기간별 판매가능객실 설정 완료!")
+            if args.dry_run:
+                print("✅ 드라이런 완료 - CMS에는 입력/저장하지 않았습니다")
+            else:
+                # 변경 이력 엑셀로 저장 (저널 기록이 끝난 뒤 I/O 워커에서 실행)
+                controller.io.submit("변경 이력 엑셀 저장", export_change_history, controller.change_journal)
+                print("✅ 기간별 판매가능객실 설정 완료!")
             print("="*60)
         elif option == "2":
-            # 미입력시 오늘 날짜로 자동
-            if not start_date_str or start_date_str.strip() == "":
-                start_date_str = datetime.now().strftime("%Y-%m-%d")
-                print(f"시작일 미입력: 오늘({start_date_str})로 자동 설정합니다.")
-            # 종료일 미입력시 시작일+14일로 자동 (테스트용 요금 자동입력)
-            if not end_date_str or end_date_str.strip() == "":
-                start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")
-                end_date = start_dt + timedelta(days=14)
-                end_date_str = end_date.strftime("%Y-%m-%d")
-                print(f"종료일 미입력: 시작일+14일({end_date_str})로 자동 설정합니다.")
-            else:
-                end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
-            # 날짜 범위 반복 (요금 자동입력)
-            current_date = datetime.strptime(start_date_str, "%Y-%m-%d")
-            while current_date <= end_date:
-                controller.auto_set_rates_by_rmo(current_date.strftime("%Y-%m-%d"))
-                current_date += timedelta(days=1)
+            start_date_str, end_date_str = resolve_rate_range(start_date_str, end_date_str)
+            # 날짜 범위를 윈도우 단위로 처리 (윈도우마다 페이지 1회 로드)
+            controller.auto_set_rates_for_range(start_date_str, end_date_str)
+            controller.flush_closed_room_highlights()
             print("\n" + "="*60)
             print("✅ 요금 자동입력 완료!")
             print("="*60)
@@ -0,0 +1,93 @@
+"""
+백그라운드 파일 I/O 워커
+엑셀 하이라이트 저장, 기준가격 읽기, 변경 저널/체크포인트 기록, 변경 이력 엑셀 저장을
+브라우저 스레드 밖의 단일 스레드에서 제출 순서대로 실행 (브라우저는 바로 다음 윈도우로 진행)
+"""
+import queue
+import threading
+import time
+
+import config
+
+
+class IOWorker:
+    """
+    파일 작업 큐 + 단일 백그라운드 스레드
+
+    - 작업은 제출 순서대로 실행 (저널 기록과 체크포인트 완료 기록은 한 작업으로 제출되어 저널 기록이 실패하면 완료로 기록되지 않음)
+    - 큐가 가득 차면 submit이 자리가 날 때까지 대기 (백프레셔)
+    - flush()는 제출된 작업이 모두 끝날 때까지 대기, close()는 flush 후 스레드 종료
+    - enabled=False면 submit 즉시 현재 스레드에서 실행
+    """
+
+    def __init__(self, enabled=None, max_pending=None):
+        self.enabled = config.IO_WORKER_ENABLED if enabled is None else enabled
+        self.max_pending = max_pending or config.IO_QUEUE_SIZE
+        self._queue = queue.Queue(maxsize=self.max_pending)
+        self._thread = None
+        self.completed = 0
+        self.errors = []          # [(작업 이름, 예외)]
+        self.busy_seconds = 0.0   # 백그라운드에서 작업을 실행한 시간
+        self.blocked_seconds = 0.0  # 큐가 가득 차 submit이 대기한 시간
+
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="cms-io", daemon=True)
+            self._thread.start()
+
+    def submit(self, name, func, *args, **kwargs):
+        """파일 작업 제출 (큐가 가득 차면 대기)"""
+        if not self.enabled:
+            self._execute(name, func, args, kwargs)
+            return
+        self._ensure_started()
+        started = time.time()
+        self._queue.put((name, func, args, kwargs))
+        self.blocked_seconds += time.time() - started
+
+    def _execute(self, name, func, args, kwargs):
+        started = time.time()
+        try:
+            func(*args, **kwargs)
+            self.completed += 1
+        except Exception as e:
+            self.errors.append((name, e))
+            print(f"  ⚠ 파일 작업 실패 ({name}): {e}")
+        finally:
+            self.busy_seconds += time.time() - started
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._execute(*job)
+            finally:
+                self._queue.task_done()
+
+    def pending(self):
+        return self._queue.unfinished_tasks
+
+    def flush(self):
+        """제출된 작업이 모두 끝날 때까지 대기"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """남은 작업을 모두 처리한 뒤 스레드 종료"""
+        if self._thread is None:
+            return
+        waiting = self.pending()
+        if waiting:
+            print(f"\n💾 남은 파일 작업 {waiting}개 처리 중...")
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self.report()
+
+    def report(self):
+        if not self.completed and not self.errors:
+            return
+        print(f"💾 백그라운드 파일 작업 {self.completed}건 ({self.busy_seconds:.2f}s, "
+              f"큐 대기 {self.blocked_seconds:.2f}s, 실패 {len(self.errors)}건)")
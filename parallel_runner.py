@@ -0,0 +1,130 @@
+"""
+객실수 자동조정 병렬 실행
+15일 윈도우를 여러 워커 프로세스에 나눠 처리 (워커마다 헤드리스 Chrome + 로그인)
+각 워커의 결과와 변경 이력은 실행이 끝난 뒤 하나로 합침
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import config
+from change_journal import ChangeJournal
+
+
+def split_into_shards(items, count):
+    """목록을 순서를 유지한 채 count개 연속 구간으로 나누기 (앞 구간부터 1개씩 더 받음)"""
+    count = max(1, min(count, len(items)))
+    size, extra = divmod(len(items), count)
+    shards = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        shards.append(items[start:end])
+        start = end
+    return shards
+
+
+def _run_worker(worker_id, window_starts, dry_run=False, run_id=None, backend='browser', overrides=None):
+    """
+    워커 프로세스: 독립된 브라우저로 로그인 후 할당된 윈도우 처리 (변경 내역은 워커별 저널 파일에 기록)
+
+    Args:
+        backend: 'http'면 로그인 후 HTTP 백엔드 사용
+        overrides: 부모 프로세스의 명령행 config 변경 (cli_config_overrides)
+    """
+    from hotel_cms_controller import HotelCMSController, apply_config_overrides
+
+    apply_config_overrides(overrides)
+    config.HEADLESS = True
+    # 같은 Chrome 프로필 디렉터리는 여러 프로세스가 동시에 쓸 수 없으므로 세션 파일만 사용
+    config.CHROME_USER_DATA_DIR = None
+    # CMS에 로그인 요청이 한꺼번에 몰리지 않도록 시작 시점을 분산
+    time.sleep(worker_id * config.PARALLEL_START_STAGGER)
+
+    started = time.time()
+    controller = HotelCMSController(run_id=run_id)
+    controller.change_journal.path = worker_journal_path(worker_id)
+    outcome = {'worker': worker_id, 'windows': {}, 'done': [], 'error': None}
+    try:
+        controller.setup_driver(config.PARALLEL_DRIVER_PROFILE)
+        controller.navigate_to_cms()
+        if not controller.ensure_logged_in(save=False):
+            raise RuntimeError("자동 로그인 실패 (병렬 모드는 수동 로그인을 지원하지 않습니다)")
+        if backend == "http":
+            controller.setup_http_backend()
+        outcome['windows'] = controller.process_inventory_windows(window_starts, dry_run=dry_run)
+    except Exception as e:
+        outcome['error'] = str(e)
+    finally:
+        outcome['elapsed'] = time.time() - started
+        controller.close()
+        # 저널 기록이 끝난 뒤(close) 완료 목록 전달 - 오류로 중단되어도 그 전에 저장된 윈도우는 포함
+        outcome['done'] = list(controller.completed_windows)
+    return outcome
+
+
+def worker_journal_path(worker_id):
+    """워커별 변경 저널 파일 (실행이 끝나면 메인 저널에 합침)"""
+    base, ext = os.path.splitext(config.CHANGE_JOURNAL_FILE)
+    return f"{base}.w{worker_id}{ext}"
+
+
+def run_date_range_parallel(window_starts, workers=None, dry_run=False, backend='browser', overrides=None,
+                            checkpoint=None):
+    """
+    윈도우 시작일 목록을 워커 프로세스에 나눠 처리
+
+    Args:
+        window_starts: 윈도우 시작일 목록 ('YYYY-MM-DD')
+        workers: 워커 수 (기본: config.PARALLEL_WORKERS, 최대 config.MAX_PARALLEL_WORKERS)
+        dry_run: True면 워커가 변경 계획만 출력
+        backend, overrides: 워커에 그대로 전달 (_run_worker)
+        checkpoint: RunCheckpoint - 워커가 끝날 때마다 그 워커의 완료 윈도우를 바로 기록
+                    (부모가 도중에 중단되어도 이미 끝난 워커의 진행은 --resume에서 이어짐)
+
+    Returns:
+        {'windows': {윈도우 시작일: 결과}, 'done': 저장까지 끝났거나 변경이 없었던 윈도우 목록,
+         'journal': 워커 기록을 합친 ChangeJournal, 'errors': {워커: 오류}}
+    """
+    journal = ChangeJournal()
+    merged = {'windows': {}, 'done': [], 'journal': journal, 'errors': {}}
+    if not window_starts:
+        return merged
+    workers = min(workers or config.PARALLEL_WORKERS, config.MAX_PARALLEL_WORKERS)
+    shards = split_into_shards(list(window_starts), workers)
+    print(f"\n🚀 병렬 실행: 윈도우 {len(window_starts)}개를 워커 {len(shards)}개로 처리")
+    for worker_id, shard in enumerate(shards):
+        print(f"  워커 {worker_id}: {shard[0]} ~ {shard[-1]} ({len(shard)}개)")
+
+    started = time.time()
+    with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+        futures = [pool.submit(_run_worker, worker_id, shard, dry_run, journal.run_id, backend, overrides) for worker_id, shard in enumerate(shards)]
+        for future in as_completed(futures):
+            try:
+                outcome = future.result()
+            except Exception as e:
+                # 워커 프로세스 자체가 비정상 종료된 경우
+                merged['errors'][f"worker-{futures.index(future)}"] = str(e)
+                continue
+            merged['windows'].update(outcome['windows'])
+            merged['done'].extend(outcome['done'])
+            if checkpoint and not dry_run:
+                for date_str in outcome['done']:
+                    checkpoint.mark_done(date_str)
+            status = "✓" if not outcome['error'] else f"❌ {outcome['error']}"
+            print(f"  워커 {outcome['worker']} 종료 ({outcome['elapsed']:.0f}s, 윈도우 {len(outcome['windows'])}개) {status}")
+            if outcome['error']:
+                merged['errors'][f"worker-{outcome['worker']}"] = outcome['error']
+
+    merged['windows'] = dict(sorted(merged['windows'].items()))
+    merged['done'] = sorted(merged['done'])
+    # 워커 저널을 윈도우 순서(워커 순서)대로 메인 저널에 합침 (비정상 종료 워커의 기록도 포함)
+    for worker_id in range(len(shards)):
+        journal.merge_from(worker_journal_path(worker_id))
+    # 드라이런은 저장하지 않으므로 계획한 윈도우를 처리 완료로 봄
+    finished = merged['windows'] if dry_run else merged['done']
+    missing = [date_str for date_str in window_starts if date_str not in finished]
+    print(f"\n✓ 병렬 실행 완료: {time.time() - started:.0f}s, 완료 {len(finished)}/{len(window_starts)}개 윈도우")
+    if missing:
+        print(f"  ⚠ 미완료 윈도우 (--resume 대상): {', '.join(missing)}")
+    return merged
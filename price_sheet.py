@@ -0,0 +1,293 @@
+"""
+기준가격.xlsx 조회/관리
+- 기준가: 워크북을 한 번만 읽어 날짜·방 타입별 dict로 보관, 파일이 수정되면 자동으로 다시 읽음
+- 방 라벨 매칭: CMS 행 라벨 → 엑셀 방 타입 (정규화 + 가장 긴 이름 우선 + 별칭)
+- 마감 방 하이라이트: 실행 중 요청을 모아 두었다가 한 번에 저장
+"""
+import os
+import re
+import threading
+import unicodedata
+from datetime import datetime, timedelta
+
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.styles import PatternFill
+
+import config
+
+# 기준가격.xlsx 읽기/저장 직렬화 (백그라운드 I/O 워커와 브라우저 스레드가 같은 파일을 다룸)
+WORKBOOK_LOCK = threading.RLock()
+
+
+def to_date_key(value):
+    """str/date/datetime/Timestamp 값을 'YYYY-MM-DD' 키로 변환 (변환 불가 시 None)"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+    try:
+        ts = pd.Timestamp(value)
+    except (ValueError, TypeError):
+        return None
+    if pd.isna(ts):
+        return None
+    return ts.strftime("%Y-%m-%d")
+
+
+def normalize_room_label(text):
+    """라벨 비교용 정규화 (전각/반각 통일, 소문자, 구분 기호·연속 공백을 공백 하나로)"""
+    text = unicodedata.normalize('NFKC', str(text)).lower()
+    return re.sub(r'[\s\-_/|·,.:()\[\]]+', ' ', text).strip()
+
+
+class RoomLabelMatcher:
+    """
+    CMS 행 라벨 → 엑셀 방 타입 매칭
+
+    - 방 타입명과 별칭을 정규화해 길이 내림차순으로 한 번만 정렬해 두고,
+      라벨에 포함된 이름 중 가장 긴 것을 선택 ('Twin Room Deluxe'가 'Twin Room'보다 우선)
+    - 라벨별 결과를 캐시하므로 같은 라벨은 다시 검색하지 않음
+    - 매칭되지 않은 라벨은 모아 두었다가 report()로 출력
+    """
+
+    def __init__(self, rooms, aliases=None):
+        self.rooms = list(rooms)
+        names = {normalize_room_label(room): room for room in self.rooms}
+        for alias, room in (aliases or {}).items():
+            if room not in self.rooms:
+                print(f"  ⚠ 방 라벨 별칭 '{alias}' → '{room}': 엑셀에 없는 방 타입이라 무시합니다.")
+                continue
+            names[normalize_room_label(alias)] = room
+        self._names = sorted(((name, room) for name, room in names.items() if name),
+                             key=lambda item: len(item[0]), reverse=True)
+        self._cache = {}
+        self.unmatched = set()
+
+    def match(self, label):
+        """라벨에 해당하는 엑셀 방 타입 (없으면 None)"""
+        if label in self._cache:
+            return self._cache[label]
+        normalized = normalize_room_label(label)
+        room = next((room for name, room in self._names if name in normalized), None)
+        if room is None:
+            self.unmatched.add(label)
+        self._cache[label] = room
+        return room
+
+    def price(self, label, prices):
+        """라벨의 기준가 ({방 타입: 기준가}에서 조회) → (방 타입, 기준가), 없으면 (방 타입 또는 None, None)"""
+        room = self.match(label)
+        return room, prices.get(room) if room else None
+
+    def report(self):
+        if not self.unmatched:
+            return
+        print(f"\n⚠ 엑셀 방 타입과 매칭되지 않은 라벨 {len(self.unmatched)}개 (config.ROOM_LABEL_ALIASES에 별칭 추가):")
+        for label in sorted(self.unmatched):
+            print(f"  - {label}")
+
+
+class BasePriceTable:
+    """날짜 → {방 타입: 기준가} 테이블 (파일 mtime이 바뀌면 다음 조회 때 재로드)"""
+
+    def __init__(self, path=None):
+        self.path = path or config.BASE_PRICE_FILE
+        self.rooms = []     # 엑셀 헤더 순서의 방 타입 목록
+        self.dates = []     # 엑셀 행 순서의 날짜 목록
+        self._prices = {}   # 'YYYY-MM-DD' -> {방 타입: 기준가}
+        self._mtime = None
+        self.matcher = None  # RoomLabelMatcher (label_matcher()에서 생성)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def _ensure_loaded(self):
+        if not self.exists():
+            return False
+        with WORKBOOK_LOCK:
+            mtime = os.path.getmtime(self.path)
+            if mtime != self._mtime:
+                self.load()
+                self._mtime = mtime
+        return True
+
+    def preload(self):
+        """워크북 미리 읽기 (백그라운드 I/O 워커에서 호출, 첫 조회 때 읽기 대기 없음)"""
+        if not self.exists():
+            print(f"  ⚠ 기준가격 파일 없음: {self.path}")
+            return
+        self._ensure_loaded()
+
+    def load(self):
+        """워크북 첫 시트를 읽어 날짜별 기준가 dict 생성 (첫 열 = 날짜, 나머지 열 = 방 타입)"""
+        df = pd.read_excel(self.path, sheet_name=0)
+        rooms = [str(col) for col in df.columns[1:]]
+        date_keys = [to_date_key(value) for value in df.iloc[:, 0]]
+        values = df.iloc[:, 1:].apply(pd.to_numeric, errors='coerce')
+
+        # 새 dict를 따로 만든 뒤 한 번에 교체 (잠금 없이 읽는 쪽이 채워지는 중인 dict를 보지 않도록)
+        prices = {}
+        for date_key, row in zip(date_keys, values.itertuples(index=False, name=None)):
+            if date_key is None or date_key in prices:
+                continue
+            prices[date_key] = {room: int(price) for room, price in zip(rooms, row) if not pd.isna(price)}
+        self.rooms, self.dates, self._prices = rooms, list(prices), prices
+        print(f"  ✓ 기준가격 로드: {len(prices)}일 × {len(rooms)}개 방 타입 ({os.path.basename(self.path)})")
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self._prices)
+
+    def __contains__(self, target_date):
+        self._ensure_loaded()
+        return to_date_key(target_date) in self._prices
+
+    def price(self, target_date, room):
+        """특정 날짜·방 타입의 기준가 (없으면 None)"""
+        if not self._ensure_loaded():
+            return None
+        return self._prices.get(to_date_key(target_date), {}).get(room)
+
+    def prices_for(self, target_date):
+        """특정 날짜의 {방 타입: 기준가} (없으면 빈 dict)"""
+        if not self._ensure_loaded():
+            return {}
+        return dict(self._prices.get(to_date_key(target_date), {}))
+
+    def prices_for_range(self, start_date, end_date):
+        """시작일~종료일(포함)의 {날짜: {방 타입: 기준가}} (엑셀에 없는 날짜는 제외)"""
+        if not self._ensure_loaded():
+            return {}
+        start = datetime.strptime(to_date_key(start_date), "%Y-%m-%d").date()
+        end = datetime.strptime(to_date_key(end_date), "%Y-%m-%d").date()
+        prices = self._prices
+        result = {}
+        current = start
+        while current <= end:
+            key = current.strftime("%Y-%m-%d")
+            if key in prices:
+                result[key] = dict(prices[key])
+            current += timedelta(days=1)
+        return result
+
+    def label_matcher(self):
+        """엑셀 헤더의 방 타입으로 만든 RoomLabelMatcher (방 타입 목록이 바뀔 때만 다시 생성)"""
+        self._ensure_loaded()
+        if self.matcher is None or self.matcher.rooms != self.rooms:
+            self.matcher = RoomLabelMatcher(self.rooms, config.ROOM_LABEL_ALIASES)
+        return self.matcher
+
+    def first_prices(self):
+        """엑셀 첫 번째 날짜 행의 기준가 (날짜 행이 없을 때 대체값)"""
+        if not self._ensure_loaded():
+            return {}
+        return dict(next(iter(self._prices.values()), {}))
+
+
+# 마감 방 하이라이트 색상 (노란색)
+CLOSED_FILL = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+NO_FILL = PatternFill(fill_type=None)
+
+
+def _is_closed_fill(fill):
+    return fill is not None and fill.fill_type == "solid" and str(fill.start_color.rgb).upper().endswith("FFFF00")
+
+
+class ClosedRoomHighlighter:
+    """날짜별 마감 방 하이라이트 요청을 모아 두었다가 워크북을 한 번만 열고 저장"""
+
+    def __init__(self, path=None):
+        self.path = path or config.BASE_PRICE_FILE
+        # 'YYYY-MM-DD' -> {'closed': 마감 방 타입 set, 'observed': 이번 실행에서 판매 상태를 확인한 방 타입 set}
+        self._pending = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def detach(self):
+        """모아 둔 요청을 새 highlighter로 넘기고 비움 (백그라운드 저장 중에도 새 요청을 받을 수 있음)"""
+        batch = ClosedRoomHighlighter(self.path)
+        batch._pending, self._pending = self._pending, {}
+        return batch
+
+    def add(self, target_date, closed_rooms, observed_rooms=()):
+        """
+        해당 날짜의 마감 방 목록 기록 (같은 날짜는 합침, 한 번이라도 마감이면 마감)
+
+        Args:
+            closed_rooms: 마감 방 타입 (엑셀 헤더 이름)
+            observed_rooms: 판매 상태를 확인한 방 타입 - 이 중 마감이 아닌 방만 기존 하이라이트 해제
+                            (확인하지 못한 방의 하이라이트는 그대로 둠)
+        """
+        date_key = to_date_key(target_date)
+        if date_key:
+            entry = self._pending.setdefault(date_key, {'closed': set(), 'observed': set()})
+            entry['closed'].update(closed_rooms)
+            entry['observed'].update(closed_rooms)
+            entry['observed'].update(observed_rooms)
+
+    def flush(self):
+        """
+        모아 둔 요청을 한 번에 반영 후 저장
+
+        - 날짜→행, 방 타입→열 인덱스를 한 번만 만들어 조회
+        - 마감 방은 노란색, 판매 중으로 확인된 방의 노란색 하이라이트는 해제
+
+        Returns:
+            하이라이트/해제한 셀 수
+        """
+        if not self._pending:
+            return 0
+        if not os.path.exists(self.path):
+            print(f"  ⚠ 하이라이트 대상 파일 없음: {self.path}")
+            return 0
+        with WORKBOOK_LOCK:
+            return self._flush()
+
+    def _flush(self):
+        wb = load_workbook(self.path)
+        ws = wb.active
+
+        row_index = {}
+        for row_idx, (value,) in enumerate(ws.iter_rows(min_row=2, max_col=1, values_only=True), 2):
+            date_key = to_date_key(value)
+            if date_key and date_key not in row_index:
+                row_index[date_key] = row_idx
+        header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
+        if header is None:
+            print(f"  ⚠ 하이라이트 대상 시트가 비어 있습니다: {self.path}")
+            self._pending.clear()
+            return 0
+        col_index = {
+            str(value): col_idx
+            for col_idx, value in enumerate(header, 1)
+            if col_idx > 1 and value is not None
+        }
+
+        highlighted = 0
+        cleared = 0
+        for date_key, entry in sorted(self._pending.items()):
+            row_idx = row_index.get(date_key)
+            if row_idx is None:
+                print(f"  ⚠ 엑셀에서 {date_key} 행을 찾지 못했습니다.")
+                continue
+            for room_type, col_idx in col_index.items():
+                cell = ws.cell(row=row_idx, column=col_idx)
+                if room_type in entry['closed']:
+                    if not _is_closed_fill(cell.fill):
+                        cell.fill = CLOSED_FILL
+                        highlighted += 1
+                        print(f"    → {date_key} '{room_type}' 셀을 노란색으로 하이라이트함")
+                elif room_type in entry['observed'] and _is_closed_fill(cell.fill):
+                    cell.fill = NO_FILL
+                    cleared += 1
+                    print(f"    → {date_key} '{room_type}' 판매 재개 - 하이라이트 해제")
+
+        if highlighted or cleared:
+            wb.save(self.path)
+        print(f"  ✓ {len(self._pending)}일 마감 방 엑셀 반영 완료 (하이라이트 {highlighted}개, 해제 {cleared}개)")
+        self._pending.clear()
+        return highlighted + cleared
@@ -0,0 +1,189 @@
+"""
+여러 숙소(CMS 업체 ID) 동시 처리
+숙소마다 독립된 프로세스·헤드리스 브라우저·세션 파일로 로그인해 객실수 자동조정 또는 요금 자동입력을 실행
+(숙소별 설정은 config.PROPERTIES 또는 PROPERTIES_FILE JSON)
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import config
+
+# 숙소 설정 키 → config 속성 (지정하지 않은 항목은 config 기본값 사용)
+PROPERTY_CONFIG_KEYS = {
+    'company_id': 'CMS_COMPANY_ID',
+    'username': 'CMS_USERNAME',
+    'password': 'CMS_PASSWORD',
+    'room_types': 'ROOM_TYPES',
+    'room_max_count': 'ROOM_MAX_COUNT',
+    'base_price_file': 'BASE_PRICE_FILE',
+    'room_label_aliases': 'ROOM_LABEL_ALIASES',
+    'availability_rules': 'AVAILABILITY_RULES',
+    'availability_rules_file': 'AVAILABILITY_RULES_FILE',
+}
+# 숙소별로 바뀌는 config 속성 (프로세스가 다음 숙소에 재사용될 때 기본값으로 되돌림)
+PROPERTY_FILE_ATTRS = ('SESSION_FILE', 'CHANGE_JOURNAL_FILE', 'CHECKPOINT_FILE', 'SNAPSHOT_STORE_FILE',
+                       'PROFILE_EXPORT_FILE', 'CHROME_USER_DATA_DIR', 'HEADLESS')
+_config_defaults = {}
+
+
+def load_properties(path=None):
+    """숙소 목록 로드 (PROPERTIES_FILE JSON이 있으면 우선, 없으면 config.PROPERTIES)"""
+    path = path or config.PROPERTIES_FILE
+    if path:
+        with open(path, encoding='utf-8') as f:
+            properties = json.load(f)
+    else:
+        properties = list(config.PROPERTIES)
+    names = [prop.get('name') for prop in properties]
+    if not all(names) or len(set(names)) != len(names):
+        raise ValueError("숙소마다 서로 다른 'name'이 필요합니다.")
+    return properties
+
+
+def select_properties(properties, names=None):
+    """'all' 또는 쉼표로 구분한 이름 목록으로 숙소 선택"""
+    if not names or names == 'all':
+        return properties
+    wanted = [name.strip() for name in names.split(',') if name.strip()]
+    unknown = [name for name in wanted if name not in {prop['name'] for prop in properties}]
+    if unknown:
+        raise ValueError(f"등록되지 않은 숙소: {', '.join(unknown)}")
+    return [prop for prop in properties if prop['name'] in wanted]
+
+
+def property_file(path, name):
+    """숙소별 파일 경로 (예: change_journal.jsonl → change_journal.<숙소>.jsonl)"""
+    base, ext = os.path.splitext(path)
+    return f"{base}.{name}{ext}"
+
+
+def apply_property(prop):
+    """현재 프로세스의 config를 숙소 설정으로 덮어씀 (세션/저널/체크포인트 파일도 숙소별로 분리)"""
+    if not _config_defaults:
+        for attr in list(PROPERTY_CONFIG_KEYS.values()) + list(PROPERTY_FILE_ATTRS):
+            _config_defaults[attr] = getattr(config, attr)
+    for attr, value in _config_defaults.items():
+        setattr(config, attr, value)
+    for key, attr in PROPERTY_CONFIG_KEYS.items():
+        if key in prop:
+            setattr(config, attr, prop[key])
+    name = prop['name']
+    config.SESSION_FILE = property_file(config.SESSION_FILE, name)
+    config.CHANGE_JOURNAL_FILE = property_file(config.CHANGE_JOURNAL_FILE, name)
+    config.CHECKPOINT_FILE = property_file(config.CHECKPOINT_FILE, name)
+    config.SNAPSHOT_STORE_FILE = property_file(config.SNAPSHOT_STORE_FILE, name)
+    if config.PROFILE_EXPORT_FILE:
+        config.PROFILE_EXPORT_FILE = property_file(config.PROFILE_EXPORT_FILE, name)
+    # 같은 Chrome 프로필 디렉터리는 여러 프로세스가 동시에 쓸 수 없으므로 숙소별 디렉터리만 허용
+    config.CHROME_USER_DATA_DIR = prop.get('chrome_user_data_dir')
+    config.HEADLESS = True
+
+
+def _run_property(prop, index, option, start_date_str, end_date_str, dry_run=False, resume=False,
+                  backend='browser', overrides=None):
+    """
+    숙소 프로세스: 숙소 설정 적용 → 로그인 → 객실수 자동조정(1) 또는 요금 자동입력(2)
+
+    Args:
+        backend: 'http'면 로그인 후 HTTP 백엔드 사용
+        overrides: 부모 프로세스의 명령행 config 변경 (cli_config_overrides, 숙소 설정 뒤에 적용)
+    """
+    from hotel_cms_controller import (HotelCMSController, apply_config_overrides, export_change_history,
+                                      prepare_inventory_run, resolve_rate_range)
+
+    apply_property(prop)
+    apply_config_overrides(overrides)
+    # CMS에 로그인 요청이 한꺼번에 몰리지 않도록 시작 시점을 분산
+    time.sleep(index * config.PARALLEL_START_STAGGER)
+
+    started = time.time()
+    outcome = {'property': prop['name'], 'option': option, 'windows': 0, 'changes': 0, 'error': None}
+    controller = None
+    try:
+        if option == "1":
+            window_starts, checkpoint = prepare_inventory_run(start_date_str, end_date_str, resume, dry_run)
+            if not window_starts:
+                return outcome
+        else:
+            start_date_str, end_date_str = resolve_rate_range(start_date_str, end_date_str)
+
+        controller = HotelCMSController()
+        controller.setup_driver(config.PARALLEL_DRIVER_PROFILE)
+        controller.navigate_to_cms()
+        if not controller.ensure_logged_in():
+            raise RuntimeError("자동 로그인 실패 (여러 숙소 실행은 수동 로그인을 지원하지 않습니다)")
+        if backend == "http":
+            controller.setup_http_backend()
+
+        if option == "1":
+            results = controller.run_inventory_windows(window_starts, checkpoint, dry_run=dry_run)
+            outcome['windows'] = len(results)
+            outcome['changes'] = controller.change_journal.count
+            if not dry_run:
+                controller.io.submit("변경 이력 엑셀 저장", export_change_history, controller.change_journal,
+                                     property_file("change_history.xlsx", prop['name']))
+        else:
+            outcome['windows'] = controller.auto_set_rates_for_range(start_date_str, end_date_str)
+            controller.flush_closed_room_highlights()
+    except Exception as e:
+        outcome['error'] = str(e)
+    finally:
+        if controller:
+            controller.close()
+        outcome['elapsed'] = time.time() - started
+    return outcome
+
+
+def run_properties(properties, option, start_date_str=None, end_date_str=None,
+                   max_concurrent=None, dry_run=False, resume=False, backend='browser', overrides=None):
+    """
+    숙소 목록을 동시에 처리 (동시 실행 수는 config.MAX_PARALLEL_PROPERTIES 이하)
+    backend, overrides는 숙소 프로세스에 그대로 전달 (_run_property)
+
+    Returns:
+        숙소별 결과 목록 [{'property', 'windows', 'changes', 'elapsed', 'error'}] (등록 순서)
+    """
+    if not properties:
+        print("등록된 숙소가 없습니다. config.PROPERTIES 또는 PROPERTIES_FILE을 설정하세요.")
+        return []
+    concurrent = max(1, min(max_concurrent or config.MAX_PARALLEL_PROPERTIES, len(properties)))
+    print(f"\n🏨 숙소 {len(properties)}곳 처리 (동시 {concurrent}곳): {', '.join(prop['name'] for prop in properties)}")
+
+    started = time.time()
+    outcomes = {}
+    with ProcessPoolExecutor(max_workers=concurrent) as pool:
+        futures = {
+            pool.submit(_run_property, prop, index % concurrent, option,
+                        start_date_str, end_date_str, dry_run, resume, backend, overrides): prop['name']
+            for index, prop in enumerate(properties)
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                # 숙소 프로세스 자체가 비정상 종료된 경우
+                outcome = {'property': name, 'windows': 0, 'changes': 0, 'elapsed': 0, 'error': str(e)}
+            outcomes[name] = outcome
+            status = "✓" if not outcome['error'] else f"❌ {outcome['error']}"
+            print(f"  [{name}] 종료 ({outcome['elapsed']:.0f}s) {status}")
+
+    results = [outcomes[prop['name']] for prop in properties]
+    print_property_summary(results, time.time() - started, option)
+    return results
+
+
+def print_property_summary(results, elapsed, option):
+    unit = "윈도우" if option == "1" else "페이지"
+    print("\n" + "="*60)
+    print(f"🏨 숙소별 결과 (전체 {elapsed:.0f}s, 숙소별 합계 {sum(r['elapsed'] for r in results):.0f}s)")
+    print("="*60)
+    for r in results:
+        status = "완료" if not r['error'] else f"실패: {r['error']}"
+        changes = f", 변경 {r['changes']}건" if option == "1" else ""
+        print(f"  {r['property']:<16} {unit} {r['windows']}개{changes}, {r['elapsed']:.0f}s - {status}")
+    failed = [r['property'] for r in results if r['error']]
+    if failed:
+        print(f"\n⚠ 실패한 숙소: {', '.join(failed)}")
@@ -0,0 +1,76 @@
+"""
+객실수 자동조정 체크포인트
+윈도우가 저장·확인되면(또는 변경이 없으면) 완료로 기록해 두고, --resume 실행 시 미완료 윈도우부터 이어서 처리
+"""
+import json
+import os
+from datetime import datetime
+
+import config
+
+
+class RunCheckpoint:
+    """실행 파라미터와 완료된 윈도우 목록을 담는 체크포인트 파일"""
+
+    def __init__(self, path=None):
+        self.path = path or config.CHECKPOINT_FILE
+        self.data = None
+
+    def load(self):
+        """저장된 체크포인트 읽기 (없거나 깨졌으면 None)"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self.data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"  ⚠ 체크포인트 읽기 실패: {e}")
+            self.data = None
+        return self.data
+
+    def start(self, params, window_starts):
+        """새 실행 시작 (기존 체크포인트는 덮어씀)"""
+        now = datetime.now().isoformat(timespec='seconds')
+        self.data = {
+            'params': params,
+            'windows': list(window_starts),
+            'completed': [],
+            'started_at': now,
+            'updated_at': now,
+        }
+        self._write()
+
+    def params(self):
+        return (self.data or {}).get('params', {})
+
+    def completed(self):
+        return set((self.data or {}).get('completed', []))
+
+    def pending(self, window_starts=None):
+        """미완료 윈도우 시작일 목록 (원래 순서 유지)"""
+        done = self.completed()
+        starts = window_starts if window_starts is not None else (self.data or {}).get('windows', [])
+        return [date_str for date_str in starts if date_str not in done]
+
+    def mark_done(self, window_start):
+        """윈도우 완료 기록 (바로 파일에 반영)"""
+        if self.data is None or window_start in self.completed():
+            return
+        self.data['completed'].append(window_start)
+        self.data['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        self._write()
+
+    def clear(self):
+        """전체 윈도우 완료 시 체크포인트 삭제"""
+        self.data = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _write(self):
+        # 임시 파일에 쓴 뒤 교체 (쓰는 도중 중단돼도 이전 체크포인트 유지)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,173 @@
+"""
+인벤토리 스냅샷 저장소 (SQLite)
+- 방 타입×날짜별 마지막 잔여/예약/판매가능객실 값과 윈도우별 해시를 보관
+- 다음 실행에서 같은 윈도우의 그리드 해시가 저장된 해시와 같으면 규칙 평가·입력·저장을 생략
+  (해당 윈도우의 알림은 저장해 둔 것을 그대로 사용)
+- 규칙을 평가한 윈도우의 잔여/예약/입력값은 실행 ID별 관측 이력으로 누적 (규칙 백테스트용, backtest.py)
+"""
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+import config
+
+
+def _cell_value(value):
+    return "" if value is None else str(value).strip()
+
+
+def rules_signature(rules):
+    """규칙표 + 방 타입/최대 수량 서명 (규칙이 바뀌면 저장된 윈도우 해시가 모두 무효가 됨)"""
+    payload = json.dumps([rules, config.ROOM_TYPES, config.ROOM_MAX_COUNT], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def window_hash(snapshot, signature=""):
+    """윈도우 스냅샷(방 타입×날짜 잔여/예약/입력값)과 규칙 서명으로 만든 해시"""
+    items = []
+    for room_name in sorted(snapshot['rooms']):
+        room = snapshot['rooms'][room_name]
+        cells = sorted([date_key, cell['remaining'], cell['booked'], _cell_value(cell['value'])]
+                       for date_key, cell in room.get('dates', {}).items())
+        items.append([room_name, bool(room.get('found')), cells])
+    payload = json.dumps([signature, items], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def applied_snapshot(snapshot, changes):
+    """변경 목록을 반영한 저장 후 스냅샷 (value None은 빈칸)"""
+    applied = copy.deepcopy(snapshot)
+    for change in changes:
+        cell = applied['rooms'][change['room_name']]['dates'].get(change['date'])
+        if cell is not None:
+            cell['value'] = "" if change['value'] is None else str(change['value'])
+    return applied
+
+
+def stale_cells(old_snapshot, new_snapshot):
+    """두 스냅샷에서 잔여/예약/입력값이 다른 셀 목록 ('날짜 방 이름', 한쪽에만 있는 셀 포함)"""
+    stale = []
+    for room_name in sorted(set(old_snapshot['rooms']) | set(new_snapshot['rooms'])):
+        old_dates = old_snapshot['rooms'].get(room_name, {}).get('dates', {})
+        new_dates = new_snapshot['rooms'].get(room_name, {}).get('dates', {})
+        for date_key in sorted(set(old_dates) | set(new_dates)):
+            old_cell, new_cell = old_dates.get(date_key), new_dates.get(date_key)
+            if (old_cell is None or new_cell is None
+                    or (old_cell['remaining'], old_cell['booked'], _cell_value(old_cell['value']))
+                    != (new_cell['remaining'], new_cell['booked'], _cell_value(new_cell['value']))):
+                stale.append(f"{date_key} {room_name}")
+    return stale
+
+
+class SnapshotStore:
+    """윈도우별 해시와 방 타입×날짜별 마지막 값을 담는 SQLite 파일 (처음 사용할 때 연결)"""
+
+    def __init__(self, path=None):
+        self.path = path or config.SNAPSHOT_STORE_FILE
+        self.conn = None
+        self.skipped = 0
+        self.recorded = 0
+        self.observed = 0
+
+    def _connect(self):
+        if self.conn is None:
+            # 병렬 워커가 같은 파일을 쓸 수 있으므로 잠금 대기 시간을 넉넉히 둠
+            self.conn = sqlite3.connect(self.path, timeout=30)
+            with self.conn:
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS windows ("
+                    " window_start TEXT PRIMARY KEY, hash TEXT NOT NULL, alerts TEXT NOT NULL,"
+                    " checked_at TEXT NOT NULL)")
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cells ("
+                    " date TEXT NOT NULL, room_name TEXT NOT NULL, remaining INTEGER, booked INTEGER,"
+                    " value TEXT, updated_at TEXT NOT NULL, PRIMARY KEY (date, room_name))")
+                # cells는 마지막 값만 남으므로, 실행마다 읽은 값은 실행 ID를 키로 따로 누적
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS observations ("
+                    " run_id TEXT NOT NULL, date TEXT NOT NULL, room_name TEXT NOT NULL, remaining INTEGER,"
+                    " booked INTEGER, value TEXT, observed_at TEXT NOT NULL, PRIMARY KEY (run_id, date, room_name))")
+        return self.conn
+
+    def unchanged_alerts(self, window_start, digest):
+        """저장된 윈도우 해시와 같으면 그때의 알림 목록, 다르거나 기록이 없으면 None"""
+        row = self._connect().execute(
+            "SELECT hash, alerts FROM windows WHERE window_start = ?", (window_start,)).fetchone()
+        if row is None or row[0] != digest:
+            return None
+        self.skipped += 1
+        return json.loads(row[1])
+
+    def record(self, window_start, snapshot, digest, alerts=()):
+        """윈도우 해시·알림과 날짜별 값 저장 (변경이 없거나 저장이 끝난 상태)"""
+        now = datetime.now().isoformat(timespec='seconds')
+        cells = [
+            (date_key, room_name, cell['remaining'], cell['booked'], _cell_value(cell['value']), now)
+            for room_name, room in snapshot['rooms'].items()
+            for date_key, cell in room.get('dates', {}).items()
+        ]
+        conn = self._connect()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO windows (window_start, hash, alerts, checked_at) VALUES (?, ?, ?, ?)",
+                         (window_start, digest, json.dumps(list(alerts), ensure_ascii=False), now))
+            conn.executemany("INSERT OR REPLACE INTO cells (date, room_name, remaining, booked, value, updated_at) "
+                             "VALUES (?, ?, ?, ?, ?, ?)", cells)
+        self.recorded += 1
+
+    def observe(self, run_id, snapshot):
+        """
+        규칙 평가 전에 읽은 윈도우 값을 관측 이력에 추가 (같은 실행에서 다시 읽으면 덮어씀)
+        변화 없음으로 생략된 윈도우는 직전 관측과 잔여/예약이 같으므로 기록하지 않음
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = [
+            (run_id, date_key, room_name, cell['remaining'], cell['booked'], _cell_value(cell['value']), now)
+            for room_name, room in snapshot['rooms'].items()
+            for date_key, cell in room.get('dates', {}).items()
+        ]
+        conn = self._connect()
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO observations "
+                             "(run_id, date, room_name, remaining, booked, value, observed_at) "
+                             "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        self.observed += len(rows)
+
+    def forget(self, window_start):
+        """윈도우 해시 삭제 (다음 실행에서 반드시 다시 평가)"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM windows WHERE window_start = ?", (window_start,))
+
+    def _select(self, table, keys, start_date, end_date, order):
+        query = f"SELECT {', '.join(keys)} FROM {table} WHERE 1 = 1"
+        params = []
+        if start_date:
+            query += " AND date >= ?"
+            params.append(start_date)
+        if end_date:
+            query += " AND date <= ?"
+            params.append(end_date)
+        return [dict(zip(keys, row)) for row in self._connect().execute(f"{query} ORDER BY {order}", params)]
+
+    def cells(self, start_date=None, end_date=None):
+        """저장된 날짜별 마지막 값 [{'date', 'room_name', 'remaining', 'booked', 'value', 'updated_at'}] (날짜 범위 포함)"""
+        return self._select('cells', ('date', 'room_name', 'remaining', 'booked', 'value', 'updated_at'),
+                            start_date, end_date, "date, room_name")
+
+    def observations(self, start_date=None, end_date=None):
+        """실행별 관측 이력 [{'run_id', 'date', 'room_name', 'remaining', 'booked', 'value', 'observed_at'}] (날짜 범위 포함)"""
+        return self._select('observations',
+                            ('run_id', 'date', 'room_name', 'remaining', 'booked', 'value', 'observed_at'),
+                            start_date, end_date, "observed_at, date, room_name")
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def report(self):
+        if self.skipped or self.recorded or self.observed:
+            print(f"🗂 스냅샷 저장소: 변화 없는 윈도우 {self.skipped}개 생략, {self.recorded}개 기록, "
+                  f"관측 이력 {self.observed}셀 ({os.path.basename(self.path)})")
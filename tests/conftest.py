@@ -0,0 +1,75 @@
+"""
+테스트 공통 설정
+저장소 루트의 모듈을 import할 수 있게 하고, 저널/체크포인트/스냅샷 파일을 임시 디렉터리로 돌림
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import config  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_files(tmp_path, monkeypatch):
+    """실제 작업 파일을 건드리지 않도록 파일 경로 설정을 tmp_path로 변경"""
+    monkeypatch.setattr(config, 'CHANGE_JOURNAL_FILE', str(tmp_path / 'change_journal.jsonl'))
+    monkeypatch.setattr(config, 'CHECKPOINT_FILE', str(tmp_path / 'checkpoint.json'))
+    monkeypatch.setattr(config, 'SNAPSHOT_STORE_FILE', str(tmp_path / 'snapshots.sqlite3'))
+    monkeypatch.setattr(config, 'BASE_PRICE_FILE', str(tmp_path / '기준가격.xlsx'))
+    monkeypatch.setattr(config, 'AVAILABILITY_RULES_FILE', None)
+    monkeypatch.setattr(config, 'ROOM_LABEL_ALIASES', {})
+    return tmp_path
+
+
+def make_snapshot(start_date, cells):
+    """
+    테스트용 윈도우 스냅샷
+
+    Args:
+        cells: {방 이름: [(remaining, booked, value), ...]} (start_date부터 하루씩)
+    """
+    from datetime import datetime, timedelta
+
+    base = datetime.strptime(start_date, "%Y-%m-%d")
+    rooms = {}
+    for room_name, values in cells.items():
+        dates = {}
+        for col, (remaining, booked, value) in enumerate(values):
+            dates[(base + timedelta(days=col)).strftime("%Y-%m-%d")] = {
+                'col': col, 'remaining': remaining, 'booked': booked, 'value': value, 'disabled': False,
+            }
+        rooms[room_name] = {'found': True, 'expanded': True, 'dates': dates}
+    return {'start_date': start_date, 'rooms': rooms}
+
+
+@pytest.fixture
+def stub_cms(monkeypatch):
+    """
+    스텁 서버 + HTTP 백엔드 컨트롤러 생성 함수 (브라우저 없이 계획/적용 흐름 시험)
+
+    Returns:
+        (컨트롤러 생성 함수, StubCMSState)
+    """
+    from cms_http_client import CMSHttpClient
+    from cms_stub_server import start_stub_server
+    from hotel_cms_controller import HotelCMSController
+
+    server, url = start_stub_server()
+    monkeypatch.setattr(config, 'CMS_API_BASE_URL', url)
+    controllers = []
+
+    def make_controller():
+        controller = HotelCMSController()
+        controller.http_client = CMSHttpClient()
+        controllers.append(controller)
+        return controller
+
+    yield make_controller, server.state
+    for controller in controllers:
+        controller.close()
+    server.shutdown()
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import config
+from availability_rules import AvailabilityRules
+
+
+def baseline_available_rooms(room_type, remaining, booked):
+    """규칙표 도입 전 calculate_available_rooms의 분기 (로그 출력 제외, 기본값 분기는 규칙표에서 고정값 2)"""
+    if room_type == 'DOUBLE':
+        return None if booked >= 3 else booked + 2
+    if room_type == 'SINGLE':
+        return None if remaining <= 4 else booked + 4
+    if room_type == 'TWIN':
+        if remaining <= 4:
+            return None
+        if remaining >= 3 and booked >= 6:
+            return booked + 2
+        if remaining >= 3 and booked < 6:
+            return booked + 4
+    if room_type == 'TRIPLE':
+        if booked >= 5:
+            return f"ALERT:트리플룸 예약 {booked}건 - 수동 확인 필요"
+        if booked == 4:
+            return booked + 1
+        return booked + 2
+    return 2
+
+
+ROOM_KEYS = ['SINGLE', 'TWIN', 'DOUBLE', 'TRIPLE']
+GRID = [(remaining, booked) for remaining in range(0, 13) for booked in range(0, 13)]
+
+
+@pytest.mark.parametrize('room_key', ROOM_KEYS)
+def test_cells_match_baseline(room_key):
+    rules = AvailabilityRules(config.AVAILABILITY_RULES)
+    for remaining, booked in GRID:
+        assert rules.evaluate_cell(room_key, remaining, booked) == \
+            baseline_available_rooms(room_key, remaining, booked), (room_key, remaining, booked)
+
+
+def test_matrix_matches_cells():
+    rules = AvailabilityRules(config.AVAILABILITY_RULES)
+    remaining = np.array([[r for r, _ in GRID]] * len(ROOM_KEYS), dtype=float)
+    booked = np.array([[b for _, b in GRID]] * len(ROOM_KEYS), dtype=float)
+    result = rules.evaluate(ROOM_KEYS, remaining, booked)
+    for row, room_key in enumerate(ROOM_KEYS):
+        for col, (r, b) in enumerate(GRID):
+            assert rules.cell_value(result, row, col, room_key, r, b) == baseline_available_rooms(room_key, r, b)
+
+
+def test_first_matching_rule_wins():
+    rules = AvailabilityRules([
+        {'room': 'SINGLE', 'remaining_max': 4, 'action': 'open'},
+        {'room': 'SINGLE', 'action': 'fixed', 'value': 7},
+        {'room': '*', 'action': 'fixed', 'value': 1},
+    ])
+    result = rules.evaluate(['SINGLE', 'TWIN'], [[4, 5], [4, 5]], [[0, 0], [0, 0]])
+    assert np.isnan(result['target'][0, 0])
+    assert result['target'][0, 1] == 7
+    assert list(result['target'][1]) == [1, 1]
+    assert result['rule'].tolist() == [[0, 1], [2, 2]]
+
+
+def test_missing_values_are_not_evaluated():
+    rules = AvailabilityRules([{'room': '*', 'action': 'fixed', 'value': 3}])
+    result = rules.evaluate(['SINGLE'], [[np.nan, 5]], [[1, np.nan]])
+    assert np.isnan(result['target']).all()
+    assert result['rule'].tolist() == [[-1, -1]]
+
+
+def test_dataframe_input_keeps_labels():
+    rules = AvailabilityRules(config.AVAILABILITY_RULES)
+    columns = ['2026-11-01', '2026-11-02']
+    remaining = pd.DataFrame([[8, 2]], index=['SINGLE'], columns=columns)
+    booked = pd.DataFrame([[2, 8]], index=['SINGLE'], columns=columns)
+    result = rules.evaluate(['SINGLE'], remaining, booked)
+    assert list(result['target'].columns) == columns
+    assert result['target'].loc['SINGLE', '2026-11-01'] == 6
+    assert np.isnan(result['target'].loc['SINGLE', '2026-11-02'])
+
+
+def test_invalid_rules_rejected():
+    with pytest.raises(ValueError):
+        AvailabilityRules([{'room': '*', 'action': 'close'}])
+    with pytest.raises(ValueError):
+        AvailabilityRules([{'room': '*', 'action': 'fixed'}])
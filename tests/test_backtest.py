@@ -0,0 +1,100 @@
+import json
+
+import pandas as pd
+import pytest
+
+import config
+from backtest import BASELINE_NAME, load_history, load_variants, main, run_backtest
+from change_journal import ChangeJournal
+from conftest import make_snapshot
+from snapshot_store import SnapshotStore
+
+# (방 이름, 잔여, 예약, 현재 값) - 현재 규칙표 기준 기대값은 각 줄 주석
+HISTORY = [
+    ('Single Room', 8, 2, '6'),     # 예약+4 = 6 → 변경 없음, 묶어둔 객실 8 - (6 - 2) = 4
+    ('Single Room', 3, 7, '10'),    # 잔여 4 이하 → 빈칸 → 변경
+    ('Twin Room', 6, 6, ''),        # 예약 6 이상 → 8 → 변경, 묶어둔 객실 6 - 2 = 4
+    ('Triple Room', 1, 5, ''),      # 예약 5 이상 → 알림 (변경 집계 제외)
+    ('Double Room', None, None, 'x'),  # 잔여/예약 없음 → 잔여 5, 예약 0 → 2 → 변경, 묶어둔 객실 3
+    ('Suite', 1, 1, ''),            # ROOM_TYPES에 없는 방 → 제외
+]
+
+
+def history_frame():
+    return pd.DataFrame([
+        {'observed': 'run-1', 'date': '2026-11-01', 'room_name': room_name,
+         'remaining': remaining, 'booked': booked, 'value': value}
+        for room_name, remaining, booked, value in HISTORY
+    ])
+
+
+def single_plus(value):
+    return [dict(rule, value=value) if rule.get('name') == '싱글룸 예약+4' else rule
+            for rule in config.AVAILABILITY_RULES]
+
+
+def test_metrics_on_small_history():
+    backtest, summary, details = run_backtest(
+        history_frame(), [(BASELINE_NAME, config.AVAILABILITY_RULES), ('싱글 +6', single_plus(6))])
+    assert backtest.cells == 5 and backtest.skipped == 1
+
+    totals = summary.set_index('variant')[['cells', 'changed', 'held_back', 'alerts']].to_dict('index')
+    assert totals[BASELINE_NAME] == {'cells': 5, 'changed': 3, 'held_back': 11, 'alerts': 1}
+    # 싱글룸 첫 셀이 8로 바뀌어 변경 +1, 묶어둔 객실 4 → 2
+    assert totals['싱글 +6'] == {'cells': 5, 'changed': 4, 'held_back': 9, 'alerts': 1}
+
+    rules = details[details['variant'] == BASELINE_NAME].set_index('rule')
+    assert rules.loc['싱글룸 예약+4', ['cells', 'changed', 'held_back']].tolist() == [1, 0, 4]
+    assert rules.loc['트리플룸 예약 5 이상, 수동 확인', 'alerts'] == 1
+    assert rules['cells'].sum() == 5
+
+
+def test_history_from_snapshot_observations():
+    store = SnapshotStore()
+    store.observe('run-1', make_snapshot('2026-11-01', {'Single Room': [(8, 2, '6'), (3, 7, '10')]}))
+    store.observe('run-2', make_snapshot('2026-11-01', {'Single Room': [(7, 3, '6')]}))
+    store.close()
+
+    history = load_history(config.SNAPSHOT_STORE_FILE)
+    assert len(history) == 3 and set(history['observed']) == {'run-1', 'run-2'}
+    assert len(load_history(config.SNAPSHOT_STORE_FILE, start_date='2026-11-02')) == 1
+
+
+def test_history_from_journal():
+    journal = ChangeJournal(run_id='run-1')
+    journal.append([{'room_name': 'Twin Room', 'date': '2026-11-01', 'value': 8, 'old_value': '',
+                     'remaining': 6, 'booked': 6}])
+    history = load_history()
+    assert history.iloc[0][['observed', 'room_name', 'remaining', 'booked']].tolist() == ['run-1', 'Twin Room', 6, 6]
+
+
+def test_legacy_change_history_is_rejected(tmp_path):
+    path = tmp_path / 'change_history.xlsx'
+    pd.DataFrame([{'date': '2026-11-01', 'room_type': 'Single Room', 'old_value': '', 'new_value': 6}]).to_excel(
+        path, index=False)
+    with pytest.raises(ValueError, match='remaining'):
+        load_history(str(path))
+    with pytest.raises(FileNotFoundError):
+        load_history(str(tmp_path / 'none.sqlite3'))
+
+
+def test_load_variants(tmp_path):
+    rules_file = tmp_path / 'plus6.json'
+    rules_file.write_text(json.dumps(single_plus(6), ensure_ascii=False), encoding='utf-8')
+    variants_file = tmp_path / 'variants.json'
+    variants_file.write_text(json.dumps([{'name': '싱글 +5', 'rules': single_plus(5)}], ensure_ascii=False),
+                             encoding='utf-8')
+    variants = load_variants([str(rules_file)], str(variants_file))
+    assert [name for name, _ in variants] == [BASELINE_NAME, 'plus6', '싱글 +5']
+    with pytest.raises(ValueError):
+        load_variants([str(rules_file), str(rules_file)])
+
+
+def test_main_exports_results(tmp_path, capsys):
+    journal = ChangeJournal(run_id='run-1')
+    journal.append([{'room_name': 'Twin Room', 'date': '2026-11-01', 'value': 8, 'old_value': '',
+                     'remaining': 6, 'booked': 6}])
+    output = tmp_path / 'backtest.csv'
+    main(['--history', config.CHANGE_JOURNAL_FILE, '--detail', '-o', str(output)])
+    assert '규칙 백테스트' in capsys.readouterr().out
+    assert pd.read_csv(output)['cells'].sum() == 1
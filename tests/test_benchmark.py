@@ -0,0 +1,19 @@
+import pytest
+
+import config
+from benchmark import STUB_CONFIG_KEYS, stub_config
+
+
+def test_stub_config_is_restored_after_failure(tmp_path):
+    (tmp_path / '기준가격.xlsx').write_bytes(b'prices')
+    work_dir = tmp_path / 'bench'
+    work_dir.mkdir()
+    original = {key: getattr(config, key) for key in STUB_CONFIG_KEYS}
+
+    with pytest.raises(RuntimeError):
+        with stub_config('http://127.0.0.1:1', str(work_dir)):
+            assert config.CMS_URL.startswith('http://127.0.0.1:1/')
+            assert config.CHECKPOINT_FILE == str(work_dir / 'checkpoint.json')
+            assert (work_dir / '기준가격.xlsx').read_bytes() == b'prices'
+            raise RuntimeError("모의 화면 로그인 실패")
+    assert {key: getattr(config, key) for key in STUB_CONFIG_KEYS} == original
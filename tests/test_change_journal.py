@@ -0,0 +1,60 @@
+from openpyxl import load_workbook
+
+from change_journal import JOURNAL_COLUMNS, ChangeJournal
+
+
+def change(date_str, room_name, old_value, value, remaining=5, booked=3):
+    return {'room_key': 'SINGLE', 'room_name': room_name, 'col': 0, 'date': date_str,
+            'value': value, 'old_value': old_value, 'remaining': remaining, 'booked': booked}
+
+
+def test_append_and_read_by_run(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    first = ChangeJournal(path, run_id='run-1')
+    assert first.append([]) == 0
+    assert first.append([change('2026-11-01', 'Single Room', '', 7),
+                         change('2026-11-02', 'Single Room', '5', None)]) == 2
+    second = ChangeJournal(path, run_id='run-2')
+    second.append([change('2026-11-01', 'Twin Room', '3', 6)], saved=False)
+
+    records = list(second.records())
+    assert [r['run_id'] for r in records] == ['run-1', 'run-1', 'run-2']
+    assert records[1]['new_value'] is None
+    assert list(second.records('run-2'))[0]['saved'] is False
+    assert second.last_run_id() == 'run-2'
+    assert first.count == 2 and second.count == 1
+
+
+def test_truncated_last_line_is_skipped(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = ChangeJournal(path, run_id='run-1')
+    journal.append([change('2026-11-01', 'Single Room', '', 7)])
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"run_id": "run-1", "date": "2026-')
+    assert len(list(journal.records())) == 1
+
+
+def test_merge_from_worker_journal(tmp_path):
+    main_path = str(tmp_path / 'journal.jsonl')
+    worker_path = str(tmp_path / 'journal.worker1.jsonl')
+    ChangeJournal(worker_path, run_id='run-1').append([change('2026-11-16', 'Single Room', '', 4)])
+    journal = ChangeJournal(main_path, run_id='run-1')
+    journal.append([change('2026-11-01', 'Single Room', '', 7)])
+
+    assert journal.merge_from(worker_path) == 1
+    assert not (tmp_path / 'journal.worker1.jsonl').exists()
+    assert [r['date'] for r in journal.records('run-1')] == ['2026-11-01', '2026-11-16']
+    assert journal.merge_from(worker_path) == 0
+
+
+def test_export_xlsx(tmp_path):
+    journal = ChangeJournal(str(tmp_path / 'journal.jsonl'), run_id='run-1')
+    output = tmp_path / 'change_history.xlsx'
+    assert journal.export_xlsx(str(output)) == 0
+    assert not output.exists()
+
+    journal.append([change('2026-11-01', 'Single Room', '', 7)])
+    assert journal.export_xlsx(str(output), run_id='run-1') == 1
+    rows = list(load_workbook(output)['change_history'].iter_rows(values_only=True))
+    assert rows[0] == JOURNAL_COLUMNS
+    assert rows[1][:6] == ('run-1', rows[1][1], '2026-11-01', 'Single Room', None, 7)
@@ -0,0 +1,74 @@
+import pytest
+
+from cms_http_client import CMSAuthError, CMSHttpClient
+from cms_stub_server import start_stub_server
+
+WINDOW = '2026-11-01'
+
+
+@pytest.fixture
+def stub():
+    server, url = start_stub_server()
+    yield server.state, url
+    server.shutdown()
+
+
+def login_as(client, session_id):
+    client.session.cookies.clear()
+    client.session.cookies.set('JSESSIONID', session_id)
+
+
+def test_expired_session_logs_in_again_and_retries_once(stub):
+    state, url = stub
+    client = CMSHttpClient(base_url=url)
+    login_as(client, 'mock-1')
+    logins = []
+    client.relogin = lambda: (logins.append(1), login_as(client, 'mock-2'))
+    assert client.read_inventory_window(WINDOW, 1, ['Single Room'])['rooms']['Single Room']['found']
+
+    state.expire_sessions()
+    assert not client.is_session_valid() and not logins  # 세션 확인은 재로그인하지 않음
+    result = client.save_availability([{'room_name': 'Single Room', 'col': 0, 'date': WINDOW, 'value': 3}])
+    assert result == {'Single Room|0': {'ok': True, 'actual': '3'}}
+    assert len(logins) == 1 and state.auth_failures == 2
+    assert state.sales_limits[('Single Room', WINDOW)] == 3
+
+
+def test_relogin_that_does_not_help_is_not_retried_again(stub):
+    state, url = stub
+    client = CMSHttpClient(base_url=url)
+    login_as(client, 'mock-1')
+    client.read_inventory_window(WINDOW, 1, ['Single Room'])
+    logins = []
+    client.relogin = lambda: logins.append(1)  # 같은 (만료된) 쿠키 유지
+
+    state.expire_sessions()
+    with pytest.raises(CMSAuthError):
+        client.read_inventory_window(WINDOW, 1, ['Single Room'])
+    assert len(logins) == 1 and state.auth_failures == 2
+
+
+class LoggedInBrowser:
+    def quit(self):
+        pass
+
+
+def test_controller_refreshes_browser_cookies_on_expired_session(stub_cms, monkeypatch):
+    make_controller, state = stub_cms
+    controller = make_controller()
+    client = controller.http_client
+    client.relogin = controller.refresh_http_session
+    login_as(client, 'mock-1')
+    controller.plan_inventory_window(WINDOW)
+
+    logins = []
+    monkeypatch.setattr(controller, 'driver', LoggedInBrowser())
+    monkeypatch.setattr(controller, 'navigate_to_cms', lambda: None)
+    monkeypatch.setattr(controller, 'ensure_logged_in', lambda: logins.append(1) or True)
+    monkeypatch.setattr(controller, '_import_browser_cookies', lambda http_client: login_as(http_client, 'mock-2'))
+    state.expire_sessions()
+
+    state.sales_limits[('Single Room', WINDOW)] = 99
+    plan = controller.plan_inventory_window(WINDOW)
+    assert [c['old_value'] for c in plan['changes'] if (c['room_name'], c['date']) == ('Single Room', WINDOW)] == ['99']
+    assert logins == [1] and state.auth_failures == 1
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from cms_http_client import CMSHttpClient
+from cms_profiler import SLEEP_SCOPE, CMSProfiler
+
+
+class FakeDriver:
+    def execute(self, driver_command, params=None):
+        return driver_command
+
+
+class FakeWaiter:
+    def __init__(self):
+        self.sleep = time.sleep
+
+
+def test_controller_sleeps_are_attributed_to_phases(capsys):
+    profiler = CMSProfiler(enabled=True)
+    driver, waiter, client = FakeDriver(), FakeWaiter(), CMSHttpClient(base_url="http://127.0.0.1:1")
+    profiler.attach(driver, waiter=waiter)
+    profiler.wrap_sleep(client)
+    assert time.sleep.__module__ == 'time'  # 전역 sleep은 그대로
+
+    with profiler.window('2026-11-01'):
+        with profiler.phase('search'):
+            waiter.sleep(0.01)
+            driver.execute('findElement')
+        with profiler.phase('idle'):
+            client.sleep(0.01)
+    keys = set(profiler.commands)
+    assert ('2026-11-01', 'search', 'sleep') in keys
+    assert ('2026-11-01', 'search', 'findElement') in keys
+    assert ('2026-11-01', 'idle', 'sleep') in keys
+
+    profiler.report()
+    assert SLEEP_SCOPE in capsys.readouterr().out
+    profiler.detach()
+    assert waiter.sleep is time.sleep and client.sleep is time.sleep
+
+
+def test_phases_are_kept_per_thread():
+    profiler = CMSProfiler(enabled=True)
+    driver = FakeDriver()
+    profiler.attach(driver)
+
+    def background():
+        with profiler.window('bg'), profiler.phase('io'):
+            driver.execute('getTitle')
+
+    with profiler.window('2026-11-01'), profiler.phase('plan'):
+        thread = threading.Thread(target=background)
+        thread.start()
+        thread.join()
+        driver.execute('executeScript')
+    assert set(profiler.commands) == {('bg', 'io', 'getTitle'), ('2026-11-01', 'plan', 'executeScript')}
+
+
+def test_disabled_profiler_wraps_nothing():
+    profiler = CMSProfiler(enabled=False)
+    waiter = FakeWaiter()
+    profiler.attach(FakeDriver(), waiter=waiter)
+    profiler.wrap_sleep(waiter)
+    assert waiter.sleep is time.sleep
@@ -0,0 +1,57 @@
+import threading
+
+from io_worker import IOWorker
+
+
+def test_jobs_run_in_order_off_the_caller_thread():
+    worker = IOWorker(enabled=True, max_pending=2)
+    seen = []
+    for idx in range(10):
+        worker.submit(f"작업 {idx}", lambda idx=idx: seen.append((idx, threading.current_thread().name)))
+    worker.flush()
+    assert [idx for idx, _ in seen] == list(range(10))
+    assert {name for _, name in seen} == {'cms-io'}
+    assert worker.pending() == 0 and worker.completed == 10
+    worker.close()
+
+
+def test_failed_job_is_recorded_and_later_jobs_still_run():
+    worker = IOWorker(enabled=True)
+    seen = []
+
+    def broken():
+        raise OSError("disk full")
+    worker.submit("깨진 작업", broken)
+    worker.submit("다음 작업", seen.append, 'next')
+    worker.close()
+    assert seen == ['next']
+    assert [(name, str(error)) for name, error in worker.errors] == [("깨진 작업", "disk full")]
+
+
+def test_disabled_worker_runs_inline():
+    worker = IOWorker(enabled=False)
+    seen = []
+    worker.submit("작업", lambda: seen.append(threading.current_thread().name))
+    assert seen == [threading.current_thread().name]
+    worker.close()
+
+
+def test_journal_failure_leaves_window_pending(stub_cms):
+    from hotel_cms_controller import prepare_inventory_run
+
+    make_controller, _ = stub_cms
+    controller = make_controller()
+    append = controller.change_journal.append
+
+    def failing_append(changes, saved=True):
+        if changes and changes[0]['date'] >= '2026-11-16':
+            raise OSError("disk full")
+        return append(changes, saved)
+    controller.change_journal.append = failing_append
+
+    window_starts, checkpoint = prepare_inventory_run('2026-11-01', '2026-11-20')
+    controller.run_inventory_windows(window_starts, checkpoint)
+    controller.io.flush()
+    assert controller.completed_windows == ['2026-11-01']
+    assert checkpoint.pending() == ['2026-11-16']
+    assert [name for name, _ in controller.io.errors] == ["변경 저널 기록"]
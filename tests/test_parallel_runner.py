@@ -0,0 +1,45 @@
+import os
+import time
+
+import parallel_runner
+from parallel_runner import run_date_range_parallel, split_into_shards
+
+WINDOWS = ['2026-11-01', '2026-11-16', '2026-12-01', '2026-12-16']
+
+
+def fake_worker(worker_id, window_starts, dry_run=False, run_id=None, backend='browser', overrides=None):
+    """워커 0은 바로 끝나고, 워커 1은 늦게 끝나며 마지막 윈도우를 완료하지 못함"""
+    flag = os.path.join(os.environ['PARALLEL_TEST_DIR'], f"worker{worker_id}.done")
+    if worker_id == 1:
+        time.sleep(1)
+    with open(flag, 'w'):
+        pass
+    done = window_starts if worker_id == 0 else window_starts[:-1]
+    return {'worker': worker_id, 'windows': {d: {} for d in window_starts}, 'done': list(done),
+            'error': None, 'elapsed': 0.0}
+
+
+class RecordingCheckpoint:
+    def __init__(self, directory):
+        self.directory = directory
+        self.marked = []
+
+    def mark_done(self, window_start):
+        # 기록 시점에 늦게 끝나는 워커가 아직 실행 중인지 함께 기록
+        slow_finished = os.path.exists(os.path.join(self.directory, "worker1.done"))
+        self.marked.append((window_start, slow_finished))
+
+
+def test_split_into_shards():
+    assert split_into_shards(WINDOWS, 3) == [WINDOWS[:2], WINDOWS[2:3], WINDOWS[3:]]
+    assert split_into_shards(WINDOWS[:1], 3) == [WINDOWS[:1]]
+
+
+def test_finished_shards_are_checkpointed_as_they_arrive(tmp_path, monkeypatch):
+    monkeypatch.setenv('PARALLEL_TEST_DIR', str(tmp_path))
+    monkeypatch.setattr(parallel_runner, '_run_worker', fake_worker)
+    checkpoint = RecordingCheckpoint(str(tmp_path))
+
+    merged = run_date_range_parallel(WINDOWS, workers=2, checkpoint=checkpoint)
+    assert merged['done'] == WINDOWS[:3]
+    assert checkpoint.marked == [('2026-11-01', False), ('2026-11-16', False), ('2026-12-01', True)]
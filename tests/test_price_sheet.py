@@ -0,0 +1,113 @@
+import os
+from datetime import date, datetime
+
+import pandas as pd
+
+import config
+from price_sheet import BasePriceTable, RoomLabelMatcher, normalize_room_label, to_date_key
+
+
+def write_prices(path, rows, rooms=('Single Room', 'Twin Room')):
+    pd.DataFrame(rows, columns=['날짜', *rooms]).to_excel(path, index=False)
+
+
+def test_to_date_key():
+    assert to_date_key('2026-11-01') == '2026-11-01'
+    assert to_date_key(datetime(2026, 11, 1, 9, 30)) == '2026-11-01'
+    assert to_date_key(date(2026, 11, 1)) == '2026-11-01'
+    assert to_date_key('') is None
+    assert to_date_key('기준가') is None
+
+
+def test_base_price_lookup(tmp_path):
+    path = tmp_path / '기준가격.xlsx'
+    write_prices(path, [
+        [datetime(2026, 11, 1), 80000, 95000],
+        [datetime(2026, 11, 2), 82000, None],
+        [datetime(2026, 11, 1), 1, 1],  # 중복 날짜는 첫 행 사용
+        [None, 1, 1],
+    ])
+    table = BasePriceTable(str(path))
+    assert len(table) == 2
+    assert table.rooms == ['Single Room', 'Twin Room']
+    assert table.price('2026-11-01', 'Twin Room') == 95000
+    assert table.price(datetime(2026, 11, 2), 'Twin Room') is None
+    assert table.prices_for('2026-11-02') == {'Single Room': 82000}
+    assert '2026-11-01' in table and '2026-11-03' not in table
+    assert table.first_prices() == {'Single Room': 80000, 'Twin Room': 95000}
+    assert list(table.prices_for_range('2026-10-31', '2026-11-05')) == ['2026-11-01', '2026-11-02']
+
+
+def test_base_price_reloads_when_file_changes(tmp_path):
+    path = tmp_path / '기준가격.xlsx'
+    write_prices(path, [[datetime(2026, 11, 1), 80000, 95000]])
+    table = BasePriceTable(str(path))
+    assert table.price('2026-11-01', 'Single Room') == 80000
+
+    write_prices(path, [[datetime(2026, 11, 1), 70000, 95000]])
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert table.price('2026-11-01', 'Single Room') == 70000
+
+
+def test_reload_swaps_in_a_new_table(tmp_path):
+    path = tmp_path / '기준가격.xlsx'
+    write_prices(path, [[datetime(2026, 11, 1), 80000, 95000], [datetime(2026, 11, 2), 82000, 96000]])
+    table = BasePriceTable(str(path))
+    before = table.prices_for_range('2026-11-01', '2026-11-02')
+    held = table._prices  # 잠금 없이 읽던 쪽이 들고 있는 dict
+
+    write_prices(path, [[datetime(2026, 11, 2), 70000, 90000]])
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert table.first_prices() == {'Single Room': 70000, 'Twin Room': 90000}
+    assert held == before and table._prices is not held
+    assert table.dates == ['2026-11-02']
+
+
+def test_missing_file(tmp_path):
+    table = BasePriceTable(str(tmp_path / 'none.xlsx'))
+    assert table.price('2026-11-01', 'Single Room') is None
+    assert table.prices_for('2026-11-01') == {}
+    assert table.first_prices() == {}
+
+
+ROOMS = ['Twin Room', 'Twin Room Deluxe', 'Single Room', 'Double Room']
+
+
+def test_longest_room_name_wins():
+    matcher = RoomLabelMatcher(ROOMS)
+    assert matcher.match('Twin Room Deluxe - Agoda') == 'Twin Room Deluxe'
+    assert matcher.match('Twin Room - Agoda') == 'Twin Room'
+    assert matcher.match('[RMO] single-room') == 'Single Room'
+    assert matcher.match('ＤＯＵＢＬＥ　ＲＯＯＭ') == 'Double Room'
+
+
+def test_aliases_and_unmatched_labels():
+    matcher = RoomLabelMatcher(ROOMS, {'스탠다드 트윈': 'Twin Room', '패밀리': 'Family Room'})
+    assert matcher.match('스탠다드 트윈 (조식)') == 'Twin Room'
+    assert matcher.match('패밀리룸') is None  # 엑셀에 없는 방 타입 별칭은 무시
+    assert matcher.match('Suite') is None
+    assert matcher.unmatched == {'패밀리룸', 'Suite'}
+    assert matcher.price('Twin Room Deluxe', {'Twin Room Deluxe': 120000}) == ('Twin Room Deluxe', 120000)
+    assert matcher.price('Suite', {'Twin Room': 90000}) == (None, None)
+
+
+def test_normalize_room_label():
+    assert normalize_room_label('  Twin_Room / Deluxe ') == 'twin room deluxe'
+
+
+def test_label_matcher_follows_workbook_rooms(tmp_path, monkeypatch):
+    path = tmp_path / '기준가격.xlsx'
+    write_prices(path, [[datetime(2026, 11, 1), 80000, 95000]])
+    monkeypatch.setattr(config, 'ROOM_LABEL_ALIASES', {'스탠다드 트윈': 'Twin Room'})
+    table = BasePriceTable(str(path))
+    matcher = table.label_matcher()
+    assert matcher.match('스탠다드 트윈') == 'Twin Room'
+    assert table.label_matcher() is matcher
+
+    write_prices(path, [[datetime(2026, 11, 1), 80000, 95000, 120000]],
+                 rooms=('Single Room', 'Twin Room', 'Twin Room Deluxe'))
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert table.label_matcher().match('Twin Room Deluxe') == 'Twin Room Deluxe'
@@ -0,0 +1,78 @@
+import json
+import os
+
+import pytest
+
+import config
+from run_checkpoint import RunCheckpoint
+
+WINDOWS = ['2026-11-01', '2026-11-16', '2026-12-01']
+
+
+def test_start_mark_done_and_pending(tmp_path):
+    path = str(tmp_path / 'checkpoint.json')
+    checkpoint = RunCheckpoint(path)
+    checkpoint.start({'start': '2026-11-01', 'end': '2026-12-10'}, WINDOWS)
+    checkpoint.mark_done('2026-11-16')
+    checkpoint.mark_done('2026-11-16')
+
+    loaded = RunCheckpoint(path)
+    assert loaded.load()['completed'] == ['2026-11-16']
+    assert loaded.params() == {'start': '2026-11-01', 'end': '2026-12-10'}
+    assert loaded.pending() == ['2026-11-01', '2026-12-01']
+    assert not os.path.exists(path + '.tmp')
+
+    loaded.clear()
+    assert not os.path.exists(path)
+    assert RunCheckpoint(path).load() is None
+
+
+def test_failed_write_keeps_previous_checkpoint(tmp_path, monkeypatch):
+    path = str(tmp_path / 'checkpoint.json')
+    checkpoint = RunCheckpoint(path)
+    checkpoint.start({}, WINDOWS)
+    checkpoint.mark_done('2026-11-01')
+
+    def broken_dump(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(json, 'dump', broken_dump)
+    with pytest.raises(OSError):
+        checkpoint.mark_done('2026-11-16')
+    monkeypatch.undo()
+
+    assert RunCheckpoint(path).load()['completed'] == ['2026-11-01']
+
+
+def test_corrupt_checkpoint_is_ignored(tmp_path):
+    path = tmp_path / 'checkpoint.json'
+    path.write_text('{"windows": [', encoding='utf-8')
+    assert RunCheckpoint(str(path)).load() is None
+
+
+def test_resume_returns_pending_windows():
+    from hotel_cms_controller import finish_checkpoint, prepare_inventory_run
+
+    window_starts, checkpoint = prepare_inventory_run('2026-11-01', '2026-12-10')
+    assert window_starts == WINDOWS
+    assert checkpoint.path == config.CHECKPOINT_FILE
+    checkpoint.mark_done('2026-11-01')
+    finish_checkpoint(checkpoint)
+    assert os.path.exists(config.CHECKPOINT_FILE)
+
+    pending, resumed = prepare_inventory_run(None, None, resume=True)
+    assert pending == ['2026-11-16', '2026-12-01']
+    for date_str in pending:
+        resumed.mark_done(date_str)
+    finish_checkpoint(resumed)
+    assert not os.path.exists(config.CHECKPOINT_FILE)
+
+    assert prepare_inventory_run('2026-11-01', '2026-12-10', dry_run=True) == (WINDOWS, None)
+
+
+def test_resume_after_finished_run_clears_checkpoint():
+    from hotel_cms_controller import prepare_inventory_run
+
+    _, checkpoint = prepare_inventory_run('2026-11-01', '2026-11-10')
+    checkpoint.mark_done('2026-11-01')
+    assert prepare_inventory_run(None, None, resume=True) == ([], None)
+    assert not os.path.exists(config.CHECKPOINT_FILE)
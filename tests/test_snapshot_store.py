@@ -0,0 +1,147 @@
+import config
+from conftest import make_snapshot
+from snapshot_store import SnapshotStore, applied_snapshot, rules_signature, stale_cells, window_hash
+
+WINDOW = '2026-11-01'
+
+
+def snapshot(value='', booked=3):
+    return make_snapshot(WINDOW, {'Single Room': [(7, booked, value), (4, 6, '')],
+                                  'Twin Room': [(9, 3, '7'), (2, 10, None)]})
+
+
+def test_window_hash():
+    signature = rules_signature(config.AVAILABILITY_RULES)
+    digest = window_hash(snapshot(), signature)
+    assert window_hash(snapshot(value=None), signature) == digest  # 빈칸과 None은 같은 값
+    assert window_hash(snapshot(booked=4), signature) != digest
+    assert window_hash(snapshot(value='7'), signature) != digest
+    assert window_hash(snapshot(), rules_signature(config.AVAILABILITY_RULES[1:])) != digest
+
+
+def test_record_and_skip_unchanged(tmp_path):
+    store = SnapshotStore(str(tmp_path / 'snapshots.sqlite3'))
+    alerts = [{'room_name': 'Triple Room', 'date': WINDOW, 'message': '수동 확인'}]
+    digest = window_hash(snapshot())
+    assert store.unchanged_alerts(WINDOW, digest) is None
+
+    store.record(WINDOW, snapshot(), digest, alerts)
+    assert store.unchanged_alerts(WINDOW, digest) == alerts
+    assert store.unchanged_alerts(WINDOW, window_hash(snapshot(booked=4))) is None
+    assert store.skipped == 1 and store.recorded == 1
+
+    store.forget(WINDOW)
+    assert store.unchanged_alerts(WINDOW, digest) is None
+    assert {(c['date'], c['room_name'], c['value']) for c in store.cells(end_date=WINDOW)} == {
+        (WINDOW, 'Single Room', ''), (WINDOW, 'Twin Room', '7')}
+    store.close()
+
+
+def test_observations_accumulate_per_run(tmp_path):
+    store = SnapshotStore(str(tmp_path / 'snapshots.sqlite3'))
+    store.observe('run-1', snapshot())
+    store.observe('run-1', snapshot(booked=5))  # 같은 실행에서 다시 읽으면 덮어씀
+    store.observe('run-2', snapshot(booked=6))
+    rows = store.observations(start_date=WINDOW, end_date=WINDOW)
+    assert [(r['run_id'], r['room_name'], r['booked']) for r in rows if r['room_name'] == 'Single Room'] == [
+        ('run-1', 'Single Room', 5), ('run-2', 'Single Room', 6)]
+    assert store.observed == 12
+    store.close()
+
+
+def test_applied_snapshot():
+    changes = [{'room_name': 'Single Room', 'date': WINDOW, 'value': 7},
+               {'room_name': 'Twin Room', 'date': WINDOW, 'value': None}]
+    original = snapshot()
+    applied = applied_snapshot(original, changes)
+    assert applied['rooms']['Single Room']['dates'][WINDOW]['value'] == '7'
+    assert applied['rooms']['Twin Room']['dates'][WINDOW]['value'] == ''
+    assert original['rooms']['Single Room']['dates'][WINDOW]['value'] == ''
+
+
+def test_second_run_skips_unchanged_windows(stub_cms):
+    make_controller, state = stub_cms
+    first = make_controller()
+    first.run_inventory_windows([WINDOW])
+    assert first.snapshot_store.recorded == 1
+
+    second = make_controller()
+    plan = second.plan_inventory_window(WINDOW)
+    assert plan['unchanged'] and not plan['changes']
+
+    # CMS에서 값이 바뀌면 다시 평가
+    state.sales_limits[('Single Room', WINDOW)] = 99
+    plan = second.plan_inventory_window(WINDOW)
+    assert 'unchanged' not in plan
+    assert [(c['date'], c['old_value']) for c in plan['changes'] if c['room_name'] == 'Single Room'][0] == (WINDOW, '99')
+
+
+def test_rule_change_invalidates_windows(stub_cms, monkeypatch):
+    make_controller, _ = stub_cms
+    make_controller().run_inventory_windows([WINDOW])
+
+    rules = [dict(rule, value=rule['value'] + 1) if rule['action'] == 'booked_plus' else rule
+             for rule in config.AVAILABILITY_RULES]
+    monkeypatch.setattr(config, 'AVAILABILITY_RULES', rules)
+    plan = make_controller().plan_inventory_window(WINDOW)
+    assert 'unchanged' not in plan and plan['changes']
+
+
+def test_stale_cells():
+    assert stale_cells(snapshot(), snapshot(value=None)) == []
+    assert stale_cells(snapshot(), snapshot(booked=4)) == [f"{WINDOW} Single Room"]
+    fewer = snapshot()
+    del fewer['rooms']['Twin Room']
+    assert stale_cells(snapshot(), fewer) == [f"{WINDOW} Twin Room", "2026-11-02 Twin Room"]
+
+
+def test_apply_replans_window_changed_since_planning(stub_cms):
+    make_controller, state = stub_cms
+    controller = make_controller()
+    plans = controller.plan_inventory_windows([WINDOW])
+    planned = next(c for c in plans[WINDOW]['changes'] if c['value'] is not None)
+    state.sales_limits[(planned['room_name'], planned['date'])] = 99
+
+    assert controller.apply_inventory_plans(plans) == 1
+    replanned = next(c for c in plans[WINDOW]['changes']
+                     if (c['room_name'], c['date']) == (planned['room_name'], planned['date']))
+    assert replanned['old_value'] == '99'
+    assert state.sales_limits[(planned['room_name'], planned['date'])] == planned['value']
+    controller.io.flush()
+    assert controller.completed_windows == [WINDOW]
+
+
+def test_apply_skips_window_already_at_target(stub_cms):
+    make_controller, state = stub_cms
+    controller = make_controller()
+    plans = controller.plan_inventory_windows([WINDOW])
+    for change in plans[WINDOW]['changes']:
+        if change['value'] is None:
+            state.sales_limits.pop((change['room_name'], change['date']), None)
+        else:
+            state.sales_limits[(change['room_name'], change['date'])] = change['value']
+
+    assert controller.apply_inventory_plans(plans) == 0
+    assert plans[WINDOW]['changes'] == []
+    controller.io.flush()
+    assert controller.completed_windows == [WINDOW]
+
+
+def stored_windows(store):
+    return [row[0] for row in store._connect().execute("SELECT window_start FROM windows")]
+
+
+def test_failed_save_forgets_window_hash(stub_cms, monkeypatch):
+    make_controller, state = stub_cms
+    make_controller().run_inventory_windows([WINDOW])
+
+    # 다른 사용자가 값을 바꾼 뒤, 저장 요청은 성공으로 응답하지만 실제로는 반영되지 않음
+    state.sales_limits[('Single Room', WINDOW)] = 99
+    monkeypatch.setattr(state, 'save_inventory', lambda items: [
+        {'roomName': item.get('roomName'), 'date': item.get('date'), 'ok': True, 'salesLimit': item.get('salesLimit')}
+        for item in items])
+    controller = make_controller()
+    assert stored_windows(controller.snapshot_store) == [WINDOW]
+    controller.run_inventory_windows([WINDOW])
+    assert controller.plan_inventory_window(WINDOW).get('unchanged') is None
+    assert stored_windows(controller.snapshot_store) == []